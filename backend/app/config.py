@@ -16,9 +16,12 @@ class Settings(BaseSettings):
     # Common
     ENV: str = "dev"
     LOG_LEVEL: str = "INFO"
+    DEBUG_PRETTY_JSON: bool = False  # Pretty-print layout/plot JSON artifacts
 
     # Data directories
     OUTPUT_DIR: Path = Path(__file__).resolve().parent / "data" / "outputs"
+    SCRATCH_DIR: str = ""  # Fast scratch space for per-run intermediates (e.g. /dev/shm); empty = output dir
+    PLAN_CACHE_DIR: str = ""  # Reuse plot/characters JSON for identical plan inputs; empty = always call the LLM
 
     # Backend network
     API_HOST: str = "0.0.0.0"
@@ -46,6 +49,15 @@ class Settings(BaseSettings):
     # BGM source (True = use local assets, False = use API for music generation)
     USE_LOCAL_BGM: bool = True
 
+    # Video encoding: "auto" detects a usable hardware H.264 encoder (NVENC/VideoToolbox/QSV),
+    # "none" forces libx264, or name an encoder explicitly (e.g. "h264_nvenc")
+    FFMPEG_HW_ENCODER: str = "auto"
+    # Decode acceleration for video inputs: "auto" uses CUDA when NVENC is in use,
+    # "none" decodes on CPU, or name an FFmpeg hwaccel explicitly (e.g. "cuda", "vaapi")
+    FFMPEG_HWACCEL: str = "auto"
+    FFMPEG_PRESET: str = "veryfast"  # libx264 preset (same CRF; much faster than "fast"/"medium")
+    FFMPEG_DEBUG: bool = False  # full FFmpeg logs (default: errors only)
+
     # Model/Prompt settings
     ART_STYLE_LORA: str = "WatercolorDream_v2"
     BASE_CHAR_SEED: int = 1001
@@ -80,6 +92,10 @@ class Settings(BaseSettings):
     KLING_ACCESS_KEY: str = ""
     KLING_SECRET_KEY: str = ""
     KLING_VIDEO_DURATION: int = 5  # seconds (fixed)
+    KLING_MAX_CONCURRENCY: int = 4  # parallel image-to-video requests per run
+    KLING_SCENE_RETRIES: int = 2  # per-scene retries on network errors / 429 / 5xx
+    KLING_CACHE_DIR: str = ""  # Clip cache shared across runs (e.g. app/data/kling_cache); empty = off
+    KLING_CACHE_MAX_BYTES: int = 5 * 1024 ** 3  # Cache is pruned to this size after each run, least recently used first
     PRO_MODE_MAX_TEXT_LENGTH: int = 25  # chars per scene for TTS
 
     # S3/R2 Storage (optional)
@@ -31,6 +31,8 @@ from app.schemas.run_spec import RunSpec, RunStatus
 from app.orchestrator.fsm import FSM, RunState
 from app.utils.logger import setup_logger
 from app.utils.fonts import get_available_fonts
+from app.utils.json_io import read_json, write_json
+from app.state import runs
 from app.utils.auth import get_current_user
 from app.routers import auth, runs as runs_router, youtube
 from app.database import get_db
@@ -41,8 +43,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 setup_logger()
 logger = logging.getLogger(__name__)
 
-# In-memory run tracking
-runs: Dict[str, dict] = {}
+# In-memory run tracking lives in app.state (shared with the Celery tasks)
 websocket_clients: Dict[str, List[WebSocket]] = {}
 
 # Redis clients for pub/sub
@@ -442,8 +443,7 @@ async def get_plot_json(run_id: str):
             raise HTTPException(status_code=404, detail=f"Plot JSON file not generated yet. Please wait...")
 
     try:
-        import json
-        plot_content = json.loads(Path(plot_json_path).read_text(encoding="utf-8"))
+        plot_content = read_json(plot_json_path)
 
         # Try to infer mode from plot content if not available
         if "scenes" in plot_content:
@@ -496,8 +496,8 @@ async def confirm_plot(
     from app.tasks.designer import designer_task
     from app.tasks.composer import composer_task
     from app.tasks.voice import voice_task
-    from app.tasks.director import layout_ready_task
-    from celery import chord, group
+    from app.tasks.director import director_task, layout_ready_task
+    from celery import chain, chord, group
     from app.utils.progress import publish_progress
 
     # Check if run exists (either in memory or on filesystem)
@@ -535,8 +535,6 @@ async def confirm_plot(
         raise HTTPException(status_code=403, detail="You don't have permission to confirm this plot")
 
     try:
-        import json
-
         # Determine paths (from memory or filesystem)
         if run_id in runs:
             plot_json_path = runs[run_id]["artifacts"].get("plot_json_path")
@@ -562,19 +560,17 @@ async def confirm_plot(
             # Try to load spec from layout.json if it exists
             spec = {}
             if layout_json_path.exists():
-                with open(layout_json_path, 'r', encoding='utf-8') as f:
-                    layout_data = json.load(f)
-                    spec = layout_data.get("spec", {})
+                layout_data = read_json(layout_json_path)
+                spec = layout_data.get("spec", {})
 
         # Get mode from spec, fallback to plot.json if not in spec
         mode = spec.get("mode")
         if not mode:
             # Try to read mode from plot.json (Pro mode stores mode in plot.json)
             try:
-                with open(plot_json_path, 'r', encoding='utf-8') as f:
-                    plot_data = json.load(f)
-                    mode = plot_data.get("mode", "general")
-                    logger.info(f"[{run_id}] Mode loaded from plot.json: {mode}")
+                plot_data = read_json(plot_json_path)
+                mode = plot_data.get("mode", "general")
+                logger.info(f"[{run_id}] Mode loaded from plot.json: {mode}")
             except Exception as e:
                 logger.warning(f"[{run_id}] Could not read mode from plot.json: {e}")
                 mode = "general"
@@ -584,9 +580,8 @@ async def confirm_plot(
         if request and "edited_plot" in request:
             edited_plot = request["edited_plot"]
 
-            # Save edited plot.json
-            with open(plot_json_path, 'w', encoding='utf-8') as f:
-                json.dump(edited_plot, f, indent=2, ensure_ascii=False)
+            # Save edited plot.json (atomic: plan/director tasks may read it concurrently)
+            write_json(plot_json_path, edited_plot)
 
             logger.info(f"[{run_id}] Updated plot.json from user edits")
 
@@ -597,8 +592,7 @@ async def confirm_plot(
 
                 characters_data = None
                 if Path(characters_json_path).exists():
-                    with open(characters_json_path, 'r', encoding='utf-8') as f:
-                        characters_data = json.load(f)
+                    characters_data = read_json(characters_json_path)
 
                 # Update plot.json with edited characters if they exist
                 if "characters" in edited_plot:
@@ -620,8 +614,7 @@ async def confirm_plot(
                         updated_characters_list.append(char_copy)
 
                     updated_characters = {"characters": updated_characters_list}
-                    with open(characters_json_path, 'w', encoding='utf-8') as f:
-                        json.dump(updated_characters, f, indent=2, ensure_ascii=False)
+                    write_json(characters_json_path, updated_characters)
                     logger.info(f"[{run_id}] Updated characters.json from edited plot")
 
                 # Convert plot.json to layout.json
@@ -632,7 +625,8 @@ async def confirm_plot(
                     music_genre=spec.get("music_genre", "ambient"),
                     video_title=spec.get("video_title"),
                     layout_config=spec.get("layout_config"),
-                    review_mode=spec.get("review_mode", False)
+                    review_mode=spec.get("review_mode", False),
+                    plot_data=edited_plot
                 )
 
                 # Update runs if in memory
@@ -687,8 +681,15 @@ async def confirm_plot(
                     voice_task.s(run_id, json_path_str, spec),
                 )
 
-                workflow = chord(asset_tasks)(layout_ready_task.s(run_id, json_path_str))
-                logger.info(f"[{run_id}] Asset generation chord started (will transition to LAYOUT_REVIEW)")
+                if spec.get("review_mode", False):
+                    workflow = chord(asset_tasks)(layout_ready_task.s(run_id, json_path_str))
+                    logger.info(f"[{run_id}] Asset generation chord started (will transition to ASSET_REVIEW)")
+                else:
+                    # Auto mode: layout_ready → director as one Celery chain (no .delay() from inside a task)
+                    workflow = chord(asset_tasks)(
+                        chain(layout_ready_task.s(run_id, json_path_str), director_task.s(run_id, json_path_str))
+                    )
+                    logger.info(f"[{run_id}] Asset generation chord started (will go directly to RENDERING)")
 
             return {
                 "status": "success",
@@ -716,8 +717,6 @@ async def regenerate_plot(run_id: str):
     from app.orchestrator.fsm import get_fsm, RunState, register_fsm, FSM
     from app.tasks.plan import plan_task
     from app.utils.progress import publish_progress
-    import json
-
     # Check if run exists in memory or can be restored from filesystem
     output_dir = settings.OUTPUT_DIR / run_id
     spec = None
@@ -730,25 +729,24 @@ async def regenerate_plot(run_id: str):
 
         # Load spec from layout.json
         try:
-            with open(layout_json_path, 'r', encoding='utf-8') as f:
-                layout_data = json.load(f)
-                spec = layout_data.get("spec", {})
-                if not spec:
-                    # Reconstruct minimal spec from layout
-                    layout_config = layout_data.get("layout_config", {})
-                    spec = {
-                        "mode": layout_data.get("mode", "general"),
-                        "prompt": layout_data.get("title", ""),
-                        "art_style": layout_config.get("art_style", "파스텔 수채화"),
-                        "review_mode": True,
-                    }
-                # Ensure required fields have defaults
-                spec.setdefault("num_characters", 2)
-                spec.setdefault("num_cuts", 7)
-                spec.setdefault("mode", "general")
-                spec.setdefault("review_mode", True)
-                spec.setdefault("art_style", "파스텔 수채화")
-                spec.setdefault("music_genre", "ambient")
+            layout_data = read_json(layout_json_path)
+            spec = layout_data.get("spec", {})
+            if not spec:
+                # Reconstruct minimal spec from layout
+                layout_config = layout_data.get("layout_config", {})
+                spec = {
+                    "mode": layout_data.get("mode", "general"),
+                    "prompt": layout_data.get("title", ""),
+                    "art_style": layout_config.get("art_style", "파스텔 수채화"),
+                    "review_mode": True,
+                }
+            # Ensure required fields have defaults
+            spec.setdefault("num_characters", 2)
+            spec.setdefault("num_cuts", 7)
+            spec.setdefault("mode", "general")
+            spec.setdefault("review_mode", True)
+            spec.setdefault("art_style", "파스텔 수채화")
+            spec.setdefault("music_genre", "ambient")
             logger.info(f"[{run_id}] Restored spec from filesystem for plot regeneration: {spec}")
         except Exception as e:
             logger.error(f"[{run_id}] Failed to load spec from layout.json: {e}")
@@ -794,7 +792,7 @@ async def regenerate_plot(run_id: str):
             runs[run_id]["state"] = fsm.current_state.value
 
             # Restart plan task
-            plan_task.delay(run_id, spec)
+            plan_task.delay(run_id, spec, use_plan_cache=False)
             logger.info(f"[{run_id}] Plan task restarted for plot regeneration")
 
             return {
@@ -856,8 +854,7 @@ async def get_layout_config(run_id: str):
         raise HTTPException(status_code=404, detail=f"Layout JSON not found for run {run_id}")
 
     try:
-        import json
-        layout_content = json.loads(Path(layout_json_path).read_text(encoding="utf-8"))
+        layout_content = read_json(layout_json_path)
 
         layout_config = layout_content.get("metadata", {}).get("layout_config", {})
         title = layout_content.get("title", "")
@@ -927,8 +924,6 @@ async def confirm_layout(run_id: str, request: Dict = Body(default={})):
         )
 
     try:
-        import json
-
         # Determine paths (from memory or filesystem)
         if run_id in runs:
             layout_json_path = runs[run_id]["artifacts"].get("json_path")
@@ -943,8 +938,7 @@ async def confirm_layout(run_id: str, request: Dict = Body(default={})):
         # If user updated layout_config or title, save it to layout.json
         if request and ("layout_config" in request or "title" in request):
             # Load current layout.json
-            with open(layout_json_path, 'r', encoding='utf-8') as f:
-                layout_data = json.load(f)
+            layout_data = read_json(layout_json_path)
 
             # Update layout_config in metadata if provided
             if "layout_config" in request:
@@ -961,8 +955,7 @@ async def confirm_layout(run_id: str, request: Dict = Body(default={})):
                 logger.info(f"[{run_id}] Updated title in layout.json: {updated_title}")
 
             # Save updated layout.json
-            with open(layout_json_path, 'w', encoding='utf-8') as f:
-                json.dump(layout_data, f, indent=2, ensure_ascii=False)
+            write_json(layout_json_path, layout_data)
 
         # Transition to RENDERING
         publish_progress(run_id, progress=0.65, log="레이아웃 확정 - 영상 합성 시작...")
@@ -1007,8 +1000,8 @@ async def regenerate_layout(run_id: str):
     from app.tasks.designer import designer_task
     from app.tasks.composer import composer_task
     from app.tasks.voice import voice_task
-    from app.tasks.director import layout_ready_task
-    from celery import chord, group
+    from app.tasks.director import director_task, layout_ready_task
+    from celery import chain, chord, group
     from app.utils.progress import publish_progress
 
     if run_id not in runs:
@@ -1044,7 +1037,13 @@ async def regenerate_layout(run_id: str):
                 voice_task.s(run_id, str(layout_json_path), spec),
             )
 
-            workflow = chord(asset_tasks)(layout_ready_task.s(run_id, str(layout_json_path)))
+            if spec.get("review_mode", False):
+                workflow = chord(asset_tasks)(layout_ready_task.s(run_id, str(layout_json_path)))
+            else:
+                # Auto mode: layout_ready → director as one Celery chain
+                workflow = chord(asset_tasks)(
+                    chain(layout_ready_task.s(run_id, str(layout_json_path)), director_task.s(run_id, str(layout_json_path)))
+                )
             logger.info(f"[{run_id}] Asset generation chord restarted for layout regeneration")
 
             return {
@@ -1372,8 +1371,7 @@ async def regenerate_scene_image(run_id: str, scene_id: str, request: Request):
         for img in scene.get("images", []):
             img["image_url"] = str(new_image_path)
 
-        with open(layout_json_path, "wb") as f:
-            f.write(orjson.dumps(layout, option=orjson.OPT_INDENT_2))
+        write_json(layout_json_path, layout)
 
         logger.info(f"[{run_id}] Regenerated image for {scene_id}")
 
@@ -1465,8 +1463,7 @@ async def regenerate_bgm(run_id: str, request: Request):
         layout["global_bgm"]["audio_url"] = str(new_bgm_path)
         layout["global_bgm"]["prompt"] = bgm_prompt
 
-        with open(layout_json_path, "wb") as f:
-            f.write(orjson.dumps(layout, option=orjson.OPT_INDENT_2))
+        write_json(layout_json_path, layout)
 
         logger.info(f"[{run_id}] Regenerated BGM")
 
@@ -34,16 +34,20 @@ class LocalBGMClient(MusicProvider):
         """
         self.api_key = api_key or settings.GEMINI_API_KEY
         self.bgm_dir = BGM_ASSETS_DIR
+        self._available_bgms: Optional[list[str]] = None
 
     def _get_available_bgms(self) -> list[str]:
-        """Get list of available BGM files."""
+        """Get list of available BGM files (scanned once per client)."""
+        if self._available_bgms is not None:
+            return self._available_bgms
+
         if not self.bgm_dir.exists():
             logger.warning(f"BGM directory not found: {self.bgm_dir}")
             return []
 
-        bgms = [f.stem for f in self.bgm_dir.glob("*.mp3")]
-        logger.info(f"Found {len(bgms)} BGM files in {self.bgm_dir}")
-        return bgms
+        self._available_bgms = [f.stem for f in self.bgm_dir.glob("*.mp3")]
+        logger.info(f"Found {len(self._available_bgms)} BGM files in {self.bgm_dir}")
+        return self._available_bgms
 
     def _select_bgm_with_gemini(self, prompt: str, available_bgms: list[str]) -> str:
         """
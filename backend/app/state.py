@@ -0,0 +1,10 @@
+"""
+In-memory run registry shared by the API and the Celery tasks.
+
+Kept out of app.main so task modules can import it at module level without
+pulling in (and cycling through) the FastAPI app.
+"""
+from typing import Dict
+
+# In-memory run tracking
+runs: Dict[str, dict] = {}
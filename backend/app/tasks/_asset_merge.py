@@ -0,0 +1,203 @@
+"""
+Shared asset-result merge for layout.json / plot.json (used by the director tasks).
+
+Chord results are dispatched by their "agent" key through a handler table, so
+adding an agent means adding one function and one dict entry.
+"""
+import logging
+from typing import Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+# ---------------------------------------------------------------------------
+# General mode: results -> layout.json
+# ---------------------------------------------------------------------------
+
+def _apply_designer(result: Dict, ctx: Dict, run_id: str) -> bool:
+    """Update image URLs from designer."""
+    updated = False
+    for img_result in result.get("images", ()):
+        scene_id = img_result["scene_id"]
+        slot_id = img_result["slot_id"]
+        image_url = img_result["image_url"]
+
+        img_slot = ctx["img_slots"].get((scene_id, slot_id))
+        if img_slot is not None:
+            img_slot["image_url"] = image_url
+            updated = True
+            logger.debug("[%s] Updated %s/%s -> %s", run_id, scene_id, slot_id, image_url)
+    return updated
+
+
+def _apply_voice(result: Dict, ctx: Dict, run_id: str) -> bool:
+    """Update audio URLs from voice agent."""
+    updated = False
+    for audio_result in result.get("voice", ()):
+        scene_id = audio_result["scene_id"]
+        line_id = audio_result["line_id"]
+        audio_url = audio_result["audio_url"]
+
+        text_line = ctx["text_lines"].get((scene_id, line_id))
+        if text_line is not None:
+            text_line["audio_url"] = audio_url
+            text_line["audio_duration_ms"] = audio_result.get("audio_duration_ms")
+            updated = True
+            logger.debug("[%s] Updated %s/%s -> %s", run_id, scene_id, line_id, audio_url)
+    return updated
+
+
+def _apply_composer(result: Dict, ctx: Dict, run_id: str) -> bool:
+    """Update global BGM from composer (audio results live in the "audio" key)."""
+    bgm_url = _global_bgm_url(result)
+    if not bgm_url:
+        return False
+
+    layout = ctx["layout"]
+    if layout.get("global_bgm") is None:
+        layout["global_bgm"] = {}
+    layout["global_bgm"]["audio_url"] = bgm_url
+    logger.info(f"[{run_id}] Updated global BGM -> {bgm_url}")
+    return True
+
+
+# ---------------------------------------------------------------------------
+# Pro mode: results -> plot.json scenes
+# ---------------------------------------------------------------------------
+
+def _apply_designer_pro(result: Dict, ctx: Dict, run_id: str) -> bool:
+    """Update start/end frame URLs from designer_pro."""
+    updated = False
+    for img_result in result.get("images", ()):
+        scene_id = img_result["scene_id"]
+        frame_type = img_result.get("frame_type", "start")
+        image_url = img_result["image_url"]
+
+        scene = ctx["scenes_by_id"].get(scene_id)
+        if scene is not None:
+            if frame_type == "start":
+                scene["start_image_url"] = image_url
+            else:
+                scene["end_image_url"] = image_url
+            updated = True
+            logger.debug("[%s] Updated %s/%s -> %s", run_id, scene_id, frame_type, image_url)
+    return updated
+
+
+def _apply_voice_pro(result: Dict, ctx: Dict, run_id: str) -> bool:
+    """Update per-scene audio URL and TTS duration from voice agent."""
+    updated = False
+    for audio_result in result.get("voice", ()):
+        scene_id = audio_result["scene_id"]
+        audio_url = audio_result["audio_url"]
+        duration_ms = audio_result.get("duration_ms")
+
+        scene = ctx["scenes_by_id"].get(scene_id)
+        if scene is not None:
+            scene["audio_url"] = audio_url
+            if duration_ms:
+                scene["tts_duration_ms"] = duration_ms
+            updated = True
+            logger.debug("[%s] Updated %s audio -> %s (%sms)", run_id, scene_id, audio_url, duration_ms)
+    return updated
+
+
+def _apply_composer_pro(result: Dict, ctx: Dict, run_id: str) -> bool:
+    """Update global BGM from composer."""
+    bgm_url = _global_bgm_url(result)
+    if not bgm_url:
+        return False
+
+    ctx["plot"]["bgm_url"] = bgm_url
+    logger.info(f"[{run_id}] Updated global BGM -> {bgm_url}")
+    return True
+
+
+def _global_bgm_url(result: Dict) -> Optional[str]:
+    """Return the path of the last global BGM item in a composer result."""
+    bgm_url = None
+    for audio_item in result.get("audio", ()):
+        if audio_item.get("type") == "bgm" and audio_item.get("id") == "global_bgm":
+            bgm_url = audio_item.get("path") or bgm_url
+    return bgm_url
+
+
+Handler = Callable[[Dict, Dict, str], bool]
+
+LAYOUT_HANDLERS: Dict[str, Handler] = {
+    "designer": _apply_designer,
+    "voice": _apply_voice,
+    "composer": _apply_composer,
+}
+
+PLOT_HANDLERS: Dict[str, Handler] = {
+    "designer_pro": _apply_designer_pro,
+    "voice": _apply_voice_pro,
+    "composer": _apply_composer_pro,
+}
+
+
+def _dispatch(asset_results: List, handlers: Dict[str, Handler], ctx: Dict, run_id: str) -> bool:
+    # Per-item updates are logged at DEBUG; one summary line per agent at INFO
+    updated = False
+    for result in asset_results:
+        agent = result.get("agent") if result else None
+        handler = handlers.get(agent)
+        if handler is not None and handler(result, ctx, run_id):
+            updated = True
+            logger.info(f"[{run_id}] Merged {agent} results")
+    return updated
+
+
+def merge_asset_results(layout: Dict, asset_results: Optional[List], run_id: str) -> bool:
+    """
+    Apply designer/voice/composer chord results to layout in-place.
+
+    Args:
+        layout: Layout JSON dict (modified in-place)
+        asset_results: List of results from parallel tasks (designer, composer, voice)
+        run_id: Run identifier for logging
+
+    Returns:
+        True if any URL in the layout was updated
+    """
+    if not asset_results:
+        return False
+
+    # Index image slots / text lines once so each result is an O(1) lookup
+    ctx = {
+        "layout": layout,
+        "img_slots": {
+            (scene["scene_id"], img_slot["slot_id"]): img_slot
+            for scene in layout.get("scenes", [])
+            for img_slot in scene.get("images", [])
+        },
+        "text_lines": {
+            (scene["scene_id"], text_line.get("line_id")): text_line
+            for scene in layout.get("scenes", [])
+            for text_line in scene.get("texts", [])
+        },
+    }
+    return _dispatch(asset_results, LAYOUT_HANDLERS, ctx, run_id)
+
+
+def merge_pro_asset_results(plot: Dict, asset_results: Optional[List], run_id: str) -> bool:
+    """
+    Apply designer_pro/voice/composer chord results to plot in-place (Pro mode).
+
+    Args:
+        plot: Plot JSON dict (modified in-place)
+        asset_results: List of results from parallel tasks (designer_pro, composer, voice)
+        run_id: Run identifier for logging
+
+    Returns:
+        True if any URL in the plot was updated
+    """
+    if not asset_results:
+        return False
+
+    ctx = {
+        "plot": plot,
+        "scenes_by_id": {scene["scene_id"]: scene for scene in plot.get("scenes", [])},
+    }
+    return _dispatch(asset_results, PLOT_HANDLERS, ctx, run_id)
@@ -1,17 +1,33 @@
 """
 작곡가 Agent: Music/BGM generation.
 """
+import functools
 import logging
-import json
 from pathlib import Path
 
 from app.celery_app import celery
 from app.config import settings
+from app.state import runs
 from app.utils.progress import publish_progress
+from app.utils.json_io import read_json, write_json
 
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=1)
+def _local_bgm_client():
+    """Worker-wide LocalBGMClient (BGM asset index is scanned once per process)."""
+    from app.providers.music.local_bgm_client import LocalBGMClient
+    return LocalBGMClient()
+
+
+@functools.lru_cache(maxsize=1)
+def _stub_music_client():
+    """Worker-wide StubMusicClient."""
+    from app.providers.music.stub_client import StubMusicClient
+    return StubMusicClient()
+
+
 @celery.task(bind=True, name="tasks.composer")
 def composer_task(self, run_id: str, json_path: str, spec: dict):
     """
@@ -34,14 +50,9 @@ def composer_task(self, run_id: str, json_path: str, spec: dict):
         logger.warning(f"[{run_id}] 🧪 STUB MUSIC MODE: Skipping ElevenLabs/Mubert API calls")
         publish_progress(run_id, progress=0.47, log="🧪 테스트: 더미 음원 사용 (API 생략)")
 
-    # TEST: 3초 대기
-    import time
-    time.sleep(3)
-
     try:
         # Load JSON
-        with open(json_path, "r", encoding="utf-8") as f:
-            layout = json.load(f)
+        layout = read_json(json_path)
 
         # Get music provider (stub mode bypasses all providers)
         # NOTE: Set USE_LOCAL_BGM=false in .env to enable API-based music generation
@@ -49,13 +60,11 @@ def composer_task(self, run_id: str, json_path: str, spec: dict):
 
         if stub_mode:
             # Use stub client in test mode
-            from app.providers.music.stub_client import StubMusicClient
-            client = StubMusicClient()
+            client = _stub_music_client()
             logger.info(f"[{run_id}] Using Stub client (test mode)")
         elif use_local_bgm:
             # Use local BGM assets (default - no API calls)
-            from app.providers.music.local_bgm_client import LocalBGMClient
-            client = LocalBGMClient()
+            client = _local_bgm_client()
             logger.info(f"[{run_id}] Using Local BGM client (selecting from assets)")
         # === API-based music generation (disabled by default) ===
         # To enable: set USE_LOCAL_BGM=false in .env
@@ -71,8 +80,7 @@ def composer_task(self, run_id: str, json_path: str, spec: dict):
             logger.info(f"[{run_id}] Using Mubert for music generation")
         else:
             # Stub 모드 (API 키 없음)
-            from app.providers.music.stub_client import StubMusicClient
-            client = StubMusicClient()
+            client = _stub_music_client()
             logger.warning(f"[{run_id}] Using Stub mode for music (no API keys)")
 
         audio_results = []
@@ -147,15 +155,14 @@ def composer_task(self, run_id: str, json_path: str, spec: dict):
                 sfx["audio_url"] = str(sfx_path)
 
         # Save updated JSON
-        with open(json_path, "w", encoding="utf-8") as f:
-            json.dump(layout, f, indent=2, ensure_ascii=False)
+        write_json(json_path, layout)
 
         logger.info(f"[{run_id}] Composer: Completed")
 
         # Update progress
-        from app.main import runs
-        if run_id in runs:
-            runs[run_id]["artifacts"]["audio"] = audio_results
+        run_entry = runs.get(run_id)
+        if run_entry is not None:
+            run_entry["artifacts"]["audio"] = audio_results
 
         return {
             "run_id": run_id,
@@ -1,17 +1,26 @@
 """
 디자이너 Agent: Image generation via ComfyUI.
 """
+import functools
 import logging
-import json
 from pathlib import Path
 
 from app.celery_app import celery
 from app.config import settings
-from app.utils.progress import publish_progress
+from app.state import runs
+from app.utils.progress import ProgressDebouncer, publish_progress
+from app.utils.json_io import read_json, write_json
 
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=1)
+def _comfyui_client(base_url: str):
+    """Worker-wide ComfyUIClient (reuses its HTTP connection pool across tasks)."""
+    from app.providers.images.comfyui_client import ComfyUIClient
+    return ComfyUIClient(base_url=base_url)
+
+
 def _validate_image_with_vision(
     image_path: Path,
     expected_description: str,
@@ -233,14 +242,12 @@ def designer_task(self, run_id: str, json_path: str, spec: dict):
         logger.warning(f"[{run_id}] 🧪 STUB IMAGE MODE: Skipping Gemini API calls")
         publish_progress(run_id, progress=0.32, log="🧪 테스트: 더미 이미지 사용 (API 생략)")
 
-    # TEST: 3초 대기
-    import time
-    time.sleep(3)
+    # Per-image updates arrive in bursts (stub/reused images): coalesce them
+    progress_debouncer = ProgressDebouncer()
 
     try:
         # Load layout JSON
-        with open(json_path, "r", encoding="utf-8") as f:
-            layout = json.load(f)
+        layout = read_json(json_path)
 
         # Check if this is story mode (for background removal)
         is_story_mode = layout.get("mode") == "story"
@@ -250,8 +257,7 @@ def designer_task(self, run_id: str, json_path: str, spec: dict):
         plot_json_path = Path(json_path).parent / "plot.json"
         plot_data = {}
         if plot_json_path.exists():
-            with open(plot_json_path, "r", encoding="utf-8") as f:
-                plot_data = json.load(f)
+            plot_data = read_json(plot_json_path)
             logger.info(f"[{run_id}] Loaded plot.json for expression/pose data")
 
         # Load characters.json for appearance info
@@ -259,8 +265,7 @@ def designer_task(self, run_id: str, json_path: str, spec: dict):
         characters_data = {}
         char_descriptions = {}  # char_id -> description mapping
         if characters_json_path.exists():
-            with open(characters_json_path, "r", encoding="utf-8") as f:
-                characters_data = json.load(f)
+            characters_data = read_json(characters_json_path)
             logger.info(f"[{run_id}] Loaded characters.json for appearance data")
 
             # Build character description lookup
@@ -302,8 +307,7 @@ def designer_task(self, run_id: str, json_path: str, spec: dict):
         elif provider == "comfyui":
             # ComfyUI provider
             try:
-                from app.providers.images.comfyui_client import ComfyUIClient
-                client = ComfyUIClient(base_url=settings.COMFY_URL)
+                client = _comfyui_client(settings.COMFY_URL)
                 # Test connection
                 import httpx
                 response = httpx.get(f"{settings.COMFY_URL}/system_stats", timeout=2.0)
@@ -574,7 +578,7 @@ def designer_task(self, run_id: str, json_path: str, spec: dict):
                                 if not is_valid:
                                     logger.warning(f"[{run_id}] 🔄 Image validation failed for {scene_id}/{slot_id}: {reason}")
                                     logger.info(f"[{run_id}] Retrying image generation (attempt {attempt + 2}/{max_validation_retries + 1})...")
-                                    publish_progress(run_id, log=f"디자이너: 이미지 검증 실패, 재생성 중... ({scene_id})")
+                                    progress_debouncer.schedule(run_id, log=f"디자이너: 이미지 검증 실패, 재생성 중... ({scene_id})")
                                     continue  # Retry generation
                                 else:
                                     logger.info(f"[{run_id}] ✅ Image validation passed for {scene_id}/{slot_id}")
@@ -601,7 +605,7 @@ def designer_task(self, run_id: str, json_path: str, spec: dict):
                     with open(image_path, "wb") as f:
                         f.write(stub_png)
                     logger.info(f"[{run_id}] Created stub image: {image_path}")
-                    publish_progress(run_id, log=f"디자이너: stub 이미지 생성 - {scene_id}_{slot_id}")
+                    progress_debouncer.schedule(run_id, log=f"디자이너: stub 이미지 생성 - {scene_id}_{slot_id}")
                 else:
                     # Debug: Log conditions for background removal
                     logger.info(f"[{run_id}] [DEBUG] Checking rembg conditions: is_story_mode={is_story_mode}, img_type={img_type}, path_exists={Path(image_path).exists()}, image_path={image_path}")
@@ -653,7 +657,7 @@ def designer_task(self, run_id: str, json_path: str, spec: dict):
 
                             image_path = output_path
                             logger.info(f"[{run_id}] Background removed: {image_path}")
-                            publish_progress(run_id, log=f"디자이너: 배경 제거 완료 - {scene_id}_{slot_id}")
+                            progress_debouncer.schedule(run_id, log=f"디자이너: 배경 제거 완료 - {scene_id}_{slot_id}")
                         except Exception as e:
                             logger.warning(f"[{run_id}] Background removal failed: {e}, using original image")
 
@@ -690,10 +694,10 @@ def designer_task(self, run_id: str, json_path: str, spec: dict):
                 logger.info(f"[{run_id}] Generated: {image_path}")
 
         # Save updated JSON
-        with open(json_path, "w", encoding="utf-8") as f:
-            json.dump(layout, f, indent=2, ensure_ascii=False)
+        write_json(json_path, layout)
 
         logger.info(f"[{run_id}] Designer: Completed {len(image_results)} images")
+        progress_debouncer.flush()
         publish_progress(run_id, progress=0.4, log=f"디자이너: 모든 이미지 생성 완료 ({len(image_results)}개)")
 
         # Cleanup unused images (images that were generated but not referenced in layout.json)
@@ -701,10 +705,10 @@ def designer_task(self, run_id: str, json_path: str, spec: dict):
         # _cleanup_unused_images(run_id, layout, json_path)
 
         # Update progress
-        from app.main import runs
-        if run_id in runs:
-            runs[run_id]["progress"] = 0.5
-            runs[run_id]["artifacts"]["images"] = image_results
+        run_entry = runs.get(run_id)
+        if run_entry is not None:
+            run_entry["progress"] = 0.5
+            run_entry["artifacts"]["images"] = image_results
 
         return {
             "run_id": run_id,
@@ -714,6 +718,7 @@ def designer_task(self, run_id: str, json_path: str, spec: dict):
         }
 
     except Exception as e:
+        progress_debouncer.flush()
         logger.error(f"[{run_id}] Designer task failed: {e}", exc_info=True)
         raise
 
@@ -748,10 +753,12 @@ def designer_task_pro(self, run_id: str, json_path: str, spec: dict):
         logger.warning(f"[{run_id}] 🧪 STUB IMAGE MODE: Skipping Gemini API calls")
         publish_progress(run_id, progress=0.32, log="🧪 테스트: 더미 이미지 사용 (API 생략)")
 
+    # Per-image updates arrive in bursts (stub/reused images): coalesce them
+    progress_debouncer = ProgressDebouncer()
+
     try:
         # Load plot JSON (Pro mode uses plot.json directly)
-        with open(json_path, "r", encoding="utf-8") as f:
-            plot = json.load(f)
+        plot = read_json(json_path)
 
         # Verify Pro mode
         if plot.get("mode") != "pro":
@@ -761,8 +768,7 @@ def designer_task_pro(self, run_id: str, json_path: str, spec: dict):
         characters_json_path = Path(json_path).parent / "characters.json"
         char_descriptions = {}  # char_id -> description mapping
         if characters_json_path.exists():
-            with open(characters_json_path, "r", encoding="utf-8") as f:
-                characters_data = json.load(f)
+            characters_data = read_json(characters_json_path)
             logger.info(f"[{run_id}] Loaded characters.json for appearance data")
 
             # Build character description lookup from plot.json characters (Pro mode)
@@ -844,7 +850,7 @@ def designer_task_pro(self, run_id: str, json_path: str, spec: dict):
                     })
                     generated_count += 1
                     progress = 0.3 + (0.15 * generated_count / total_images)
-                    publish_progress(run_id, progress=progress, log=f"디자이너: {scene_id} 시작 프레임 생성 완료")
+                    progress_debouncer.schedule(run_id, progress=progress, log=f"디자이너: {scene_id} 시작 프레임 생성 완료")
             else:
                 # Subsequent scenes: Reuse previous scene's end frame as start
                 if previous_end_image:
@@ -901,24 +907,24 @@ def designer_task_pro(self, run_id: str, json_path: str, spec: dict):
                 })
                 generated_count += 1
                 progress = 0.3 + (0.15 * generated_count / total_images)
-                publish_progress(run_id, progress=progress, log=f"디자이너: {scene_id} 종료 프레임 생성 완료")
+                progress_debouncer.schedule(run_id, progress=progress, log=f"디자이너: {scene_id} 종료 프레임 생성 완료")
 
         # Save updated plot.json with image URLs
-        with open(json_path, "w", encoding="utf-8") as f:
-            json.dump(plot, f, indent=2, ensure_ascii=False)
+        write_json(json_path, plot)
 
         # Count actual generated vs reused images
         reused_count = sum(1 for r in image_results if r.get("reused"))
         actual_generated = len(image_results) - reused_count
 
         logger.info(f"[{run_id}] Designer Pro: Completed {len(image_results)} images ({actual_generated} generated, {reused_count} reused)")
+        progress_debouncer.flush()
         publish_progress(run_id, progress=0.45, log=f"디자이너: Pro 모드 이미지 완료 ({actual_generated}개 생성, {reused_count}개 재사용)")
 
         # Update progress
-        from app.main import runs
-        if run_id in runs:
-            runs[run_id]["progress"] = 0.5
-            runs[run_id]["artifacts"]["images"] = image_results
+        run_entry = runs.get(run_id)
+        if run_entry is not None:
+            run_entry["progress"] = 0.5
+            run_entry["artifacts"]["images"] = image_results
 
         return {
             "run_id": run_id,
@@ -928,6 +934,7 @@ def designer_task_pro(self, run_id: str, json_path: str, spec: dict):
         }
 
     except Exception as e:
+        progress_debouncer.flush()
         logger.error(f"[{run_id}] Designer Pro task failed: {e}", exc_info=True)
         raise
 
@@ -2,16 +2,86 @@
 감독 Agent: Final video composition using MoviePy.
 This is the chord callback that runs after all asset generation tasks complete.
 """
+import asyncio
+import functools
+import hashlib
 import logging
-import json
+import multiprocessing
+import os
+import re
+import shutil
+import subprocess
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import Callable
+
+import httpx
 
 from app.celery_app import celery
-from app.orchestrator.fsm import RunState
-from app.utils.progress import publish_progress
+from app.config import settings
+from app.orchestrator.fsm import RunState, get_fsm
+from app.state import runs
+from app.utils.progress import ProgressDebouncer, publish_progress
+from app.utils.json_io import read_json, write_json
+from app.utils.task_lock import single_run_task
+from app.tasks._asset_merge import merge_asset_results, merge_pro_asset_results
+from app.tasks.qa import emit_qa_input, qa_task
+from app.utils.ffmpeg_renderer import (
+    FFmpegRenderer,
+    ffmpeg_has_filter,
+    ffmpeg_log_args,
+    hwaccel_input_args,
+    run_ffmpeg,
+    video_encoder_args,
+)
+from app.utils.fonts import get_font_path, layout_text, load_font
+from app.utils.kling_client import KLING_MODEL_V1_6, KlingTransientError, get_kling_client
 
 logger = logging.getLogger(__name__)
 
+# Merged layout handed from layout_ready_task to a chained director_task in the
+# same worker process: (run_id, json_path, (st_mtime_ns, st_size), layout).
+# A single slot: when director_task runs in another process, the next stash
+# replaces the stale entry, so at most one layout is ever held.
+_layout_handoff: tuple | None = None
+
+
+def _stash_layout(run_id: str, json_path: str, layout: dict) -> None:
+    """Keep the merged layout for the chained director_task, tagged with the file's stat."""
+    global _layout_handoff
+    st = os.stat(json_path)
+    _layout_handoff = (run_id, json_path, (st.st_mtime_ns, st.st_size), layout)
+
+
+def _load_layout(run_id: str, json_path: str) -> dict:
+    """
+    Load layout.json, reusing the dict stashed by layout_ready_task when possible.
+
+    The stash is only used once, and only if layout.json is unchanged since it
+    was taken (same path, mtime and size); otherwise the file is read. A
+    director_task running in another worker process simply reads the file.
+
+    Args:
+        run_id: Run identifier
+        json_path: Path to layout.json
+
+    Returns:
+        Layout JSON dict
+    """
+    global _layout_handoff
+    stashed = _layout_handoff
+    if stashed is not None and stashed[0] == run_id:
+        _layout_handoff = None
+        _, stashed_path, stashed_stat, layout = stashed
+        try:
+            st = os.stat(json_path)
+        except OSError:
+            st = None
+        if stashed_path == json_path and st is not None and (st.st_mtime_ns, st.st_size) == stashed_stat:
+            logger.info(f"[{run_id}] Reusing layout merged by layout_ready_task (skipping reload)")
+            return layout
+    return read_json(json_path)
+
 
 @celery.task(bind=True, name="tasks.layout_ready")
 def layout_ready_task(self, asset_results: list, run_id: str, json_path: str):
@@ -25,83 +95,35 @@ def layout_ready_task(self, asset_results: list, run_id: str, json_path: str):
         json_path: Path to layout.json
 
     Returns:
-        Dict with status
+        Dict with status, or None when chained to director_task in auto mode
     """
     logger.info(f"[{run_id}] Layout ready: All assets generated")
-    logger.info(f"[{run_id}] Asset results: {asset_results}")
+    logger.debug("[%s] Asset results: %s", run_id, asset_results)
     publish_progress(run_id, progress=0.6, log="에셋 생성 완료 - 레이아웃 검수 대기 중...")
 
     try:
         # Load layout.json
-        with open(json_path, "r", encoding="utf-8") as f:
-            layout = json.load(f)
+        layout = read_json(json_path)
 
         # Update layout.json with asset URLs from chord results
         logger.info(f"[{run_id}] Updating layout.json with asset URLs from chord results...")
 
-        for result in asset_results:
-            if not result or "agent" not in result:
-                continue
-
-            agent = result["agent"]
-
-            # Update image URLs from designer
-            if agent == "designer" and "images" in result:
-                for img_result in result["images"]:
-                    scene_id = img_result["scene_id"]
-                    slot_id = img_result["slot_id"]
-                    image_url = img_result["image_url"]
-
-                    # Find scene and update image_url
-                    for scene in layout.get("scenes", []):
-                        if scene["scene_id"] == scene_id:
-                            for img_slot in scene.get("images", []):
-                                if img_slot["slot_id"] == slot_id:
-                                    img_slot["image_url"] = image_url
-                                    logger.info(f"[{run_id}] Updated {scene_id}/{slot_id} -> {image_url}")
-
-            # Update audio URLs from voice agent
-            elif agent == "voice" and "voice" in result:
-                for audio_result in result["voice"]:
-                    scene_id = audio_result["scene_id"]
-                    line_id = audio_result["line_id"]
-                    audio_url = audio_result["audio_url"]
-
-                    # Find scene and update audio_url
-                    for scene in layout.get("scenes", []):
-                        if scene["scene_id"] == scene_id:
-                            for text_line in scene.get("texts", []):
-                                if text_line.get("line_id") == line_id:
-                                    text_line["audio_url"] = audio_url
-                                    logger.info(f"[{run_id}] Updated {scene_id}/{line_id} -> {audio_url}")
-
-            # Update global BGM from composer
-            elif agent == "composer" and "audio" in result:
-                # Composer returns audio results in "audio" key
-                audio_results = result["audio"]
-                for audio_item in audio_results:
-                    if audio_item.get("type") == "bgm" and audio_item.get("id") == "global_bgm":
-                        bgm_url = audio_item.get("path")
-                        if bgm_url:
-                            if "global_bgm" not in layout or layout["global_bgm"] is None:
-                                layout["global_bgm"] = {}
-                            layout["global_bgm"]["audio_url"] = bgm_url
-                            logger.info(f"[{run_id}] Updated global BGM -> {bgm_url}")
-
-        # Save updated layout.json
-        with open(json_path, "w", encoding="utf-8") as f:
-            json.dump(layout, f, indent=2, ensure_ascii=False)
-
-        logger.info(f"[{run_id}] layout.json updated with all asset URLs")
+        # Save updated layout.json (single write, skipped when nothing changed
+        # e.g. confirm_assets passes [] and the asset tasks already saved their URLs)
+        if merge_asset_results(layout, asset_results, run_id):
+            write_json(json_path, layout)
+            logger.info(f"[{run_id}] layout.json updated with all asset URLs")
+        else:
+            logger.info(f"[{run_id}] layout.json already up to date, skipping rewrite")
 
         # Check mode from layout.json
         mode = layout.get("metadata", {}).get("mode", "general")
 
         # Get review_mode from run spec or layout metadata (fallback)
-        from app.main import runs
+        run_entry = runs.get(run_id)
         review_mode = False
-        if run_id in runs:
-            spec = runs[run_id].get("spec", {})
+        if run_entry is not None:
+            spec = run_entry.get("spec", {})
             review_mode = spec.get("review_mode", False)
 
         # Fallback to metadata if not found in spec
@@ -110,7 +132,6 @@ def layout_ready_task(self, asset_results: list, run_id: str, json_path: str):
 
         logger.info(f"[{run_id}] Mode={mode}, review_mode={review_mode}")
 
-        from app.orchestrator.fsm import get_fsm
         fsm = get_fsm(run_id)
 
         # State transition logic:
@@ -129,13 +150,24 @@ def layout_ready_task(self, asset_results: list, run_id: str, json_path: str):
                     log="영상 합성 시작..."
                 )
 
-                if run_id in runs:
-                    runs[run_id]["state"] = fsm.current_state.value
-                    runs[run_id]["progress"] = 0.7
+                if run_entry is not None:
+                    run_entry["state"] = fsm.current_state.value
+                    run_entry["progress"] = 0.7
+
+                if self.request.chain:
+                    # Registered as chain(layout_ready_task, director_task): Celery runs the director next.
+                    # layout.json is already merged, so there are no asset_results to hand over;
+                    # the parsed layout itself is stashed so the director can skip reloading it.
+                    _stash_layout(run_id, json_path, layout)
+                    logger.info(f"[{run_id}] director_task chained after layout_ready_task")
+                    return None
 
-                # Trigger director task immediately
+                # Standalone call (e.g. confirm_assets): trigger director task immediately
                 logger.info(f"[{run_id}] Triggering director_task for immediate rendering")
-                director_task.delay([], run_id, json_path)
+                director_task.delay(None, run_id, json_path)
+            else:
+                # Could not enter RENDERING: don't let a chained director_task run
+                self.request.chain = None
 
             return {
                 "status": "success",
@@ -145,6 +177,9 @@ def layout_ready_task(self, asset_results: list, run_id: str, json_path: str):
 
         # Review mode: go to ASSET_REVIEW for image/BGM review first
         else:
+            # Review mode must not fall through to a chained director_task
+            self.request.chain = None
+
             if fsm and fsm.transition_to(RunState.ASSET_REVIEW):
                 logger.info(f"[{run_id}] Transitioned to ASSET_REVIEW")
                 publish_progress(
@@ -154,9 +189,9 @@ def layout_ready_task(self, asset_results: list, run_id: str, json_path: str):
                     log="에셋 검수 단계 - 이미지/BGM 확인 대기 중"
                 )
 
-                if run_id in runs:
-                    runs[run_id]["state"] = fsm.current_state.value
-                    runs[run_id]["progress"] = 0.6
+                if run_entry is not None:
+                    run_entry["state"] = fsm.current_state.value
+                    run_entry["progress"] = 0.6
 
             return {
                 "status": "success",
@@ -166,7 +201,6 @@ def layout_ready_task(self, asset_results: list, run_id: str, json_path: str):
 
     except Exception as e:
         logger.error(f"[{run_id}] Failed in layout_ready_task: {e}", exc_info=True)
-        from app.orchestrator.fsm import get_fsm
         fsm = get_fsm(run_id)
         if fsm:
             fsm.fail(f"Layout ready task failed: {str(e)}")
@@ -174,6 +208,7 @@ def layout_ready_task(self, asset_results: list, run_id: str, json_path: str):
 
 
 @celery.task(bind=True, name="tasks.director")
+@single_run_task("director")
 def director_task(self, asset_results: list, run_id: str, json_path: str):
     """
     Compose final 9:16 video from all generated assets.
@@ -181,37 +216,34 @@ def director_task(self, asset_results: list, run_id: str, json_path: str):
     This task is called as chord callback after all asset generation tasks complete.
 
     Args:
-        asset_results: List of results from parallel asset generation tasks (designer, composer, voice)
+        asset_results: List of results from parallel asset generation tasks (designer, composer, voice),
+            or None when layout_ready_task has already merged them into layout.json
         run_id: Run identifier
         json_path: Path to JSON layout with all asset URLs
 
     Returns:
         Dict with final video URL
     """
-    logger.info(f"[{run_id}] Director: Received asset results from chord: {asset_results}")
+    logger.debug("[%s] Director: Received asset results from chord: %s", run_id, asset_results)
     logger.info(f"[{run_id}] Director: Starting video composition...")
     publish_progress(run_id, progress=0.7, log="감독: 최종 영상 합성 시작...")
 
-    # TEST: 3초 대기
-    import time
-    time.sleep(3)
+    # Bind the run registry entry once for every state/progress update below
+    run_entry = runs.get(run_id)
 
     try:
         # Get FSM and transition to RENDERING
-        from app.orchestrator.fsm import get_fsm
         fsm = get_fsm(run_id)
         if fsm and fsm.transition_to(RunState.RENDERING):
             logger.info(f"[{run_id}] Transitioned to RENDERING")
             publish_progress(run_id, state="RENDERING", progress=0.75, log="렌더링 단계 시작")
 
-            from app.main import runs
-            if run_id in runs:
-                runs[run_id]["state"] = fsm.current_state.value
-                runs[run_id]["progress"] = 0.7
+            if run_entry is not None:
+                run_entry["state"] = fsm.current_state.value
+                run_entry["progress"] = 0.7
 
-        # Load layout.json
-        with open(json_path, "r", encoding="utf-8") as f:
-            layout = json.load(f)
+        # Load layout.json (or take the one layout_ready_task just merged)
+        layout = _load_layout(run_id, json_path)
 
         logger.info(f"[{run_id}] Layout loaded with {len(layout.get('scenes', []))} scenes")
         logger.info(f"[{run_id}] Mode: {layout.get('metadata', {}).get('mode', 'general')}")
@@ -220,52 +252,9 @@ def director_task(self, asset_results: list, run_id: str, json_path: str):
         # This is needed when director_task is called directly from chord callback (auto mode)
         if asset_results:
             logger.info(f"[{run_id}] Updating layout with asset URLs from chord results...")
-            for result in asset_results:
-                if not result or "agent" not in result:
-                    continue
-
-                agent = result["agent"]
-
-                # Update image URLs from designer
-                if agent == "designer" and "images" in result:
-                    for img_result in result["images"]:
-                        scene_id = img_result["scene_id"]
-                        slot_id = img_result["slot_id"]
-                        image_url = img_result["image_url"]
-
-                        for scene in layout.get("scenes", []):
-                            if scene["scene_id"] == scene_id:
-                                for img_slot in scene.get("images", []):
-                                    if img_slot["slot_id"] == slot_id:
-                                        img_slot["image_url"] = image_url
-
-                # Update audio URLs from voice agent
-                elif agent == "voice" and "voice" in result:
-                    for audio_result in result["voice"]:
-                        scene_id = audio_result["scene_id"]
-                        line_id = audio_result["line_id"]
-                        audio_url = audio_result["audio_url"]
-
-                        for scene in layout.get("scenes", []):
-                            if scene["scene_id"] == scene_id:
-                                for text_line in scene.get("texts", []):
-                                    if text_line.get("line_id") == line_id:
-                                        text_line["audio_url"] = audio_url
-                                        logger.info(f"[{run_id}] Updated {scene_id}/{line_id} audio -> {audio_url}")
-
-                # Update global BGM from composer
-                elif agent == "composer" and "audio" in result:
-                    for audio_item in result["audio"]:
-                        if audio_item.get("type") == "bgm" and audio_item.get("id") == "global_bgm":
-                            bgm_url = audio_item.get("path")
-                            if bgm_url:
-                                if "global_bgm" not in layout or layout["global_bgm"] is None:
-                                    layout["global_bgm"] = {}
-                                layout["global_bgm"]["audio_url"] = bgm_url
-                                logger.info(f"[{run_id}] Updated global BGM -> {bgm_url}")
+            merge_asset_results(layout, asset_results, run_id)
 
         # Check if we're in stub mode (no real assets)
-        from app.config import settings
         # Always use full rendering mode since MoviePy is installed
         stub_mode = False
 
@@ -292,29 +281,35 @@ def director_task(self, asset_results: list, run_id: str, json_path: str):
             output_dir.mkdir(parents=True, exist_ok=True)
             output_path = output_dir / "final_video.txt"
 
-            with open(output_path, "w", encoding="utf-8") as f:
-                f.write("=== AutoShorts Video Composition Summary ===\n\n")
-                f.write(f"Run ID: {run_id}\n")
-                f.write(f"Format: 1080x1920 (9:16)\n")
-                f.write(f"FPS: {layout.get('timeline', {}).get('fps', 30)}\n\n")
+            # Build the summary in memory and write it in one go
+            parts = []
+            append = parts.append
+            append("=== AutoShorts Video Composition Summary ===\n\n")
+            append(f"Run ID: {run_id}\n")
+            append("Format: 1080x1920 (9:16)\n")
+            append(f"FPS: {layout.get('timeline', {}).get('fps', 30)}\n\n")
 
-                for scene in layout.get("scenes", []):
-                    scene_id = scene["scene_id"]
-                    duration_sec = scene["duration_ms"] / 1000.0
-                    f.write(f"\n[{scene_id}] ({duration_sec}s)\n")
-                    f.write("-" * 40 + "\n")
+            for scene in layout.get("scenes", []):
+                scene_id = scene["scene_id"]
+                duration_sec = scene["duration_ms"] / 1000.0
+                append(f"\n[{scene_id}] ({duration_sec}s)\n")
+                append("-" * 40 + "\n")
 
-                    for img_slot in scene.get("images", []):
-                        f.write(f"  Image ({img_slot.get('slot_id', 'N/A')}): {img_slot.get('image_url', 'N/A')}\n")
+                for img_slot in scene.get("images", []):
+                    append(f"  Image ({img_slot.get('slot_id', 'N/A')}): {img_slot.get('image_url', 'N/A')}\n")
 
-                    for text_line in scene.get("texts", []):
-                        f.write(f"  Audio: {text_line.get('audio_url', 'N/A')}\n")
-                        f.write(f"    Text: {text_line.get('text', 'N/A')}\n")
-                        f.write(f"    Type: {text_line.get('text_type', 'N/A')}\n")
+                for text_line in scene.get("texts", []):
+                    append(
+                        f"  Audio: {text_line.get('audio_url', 'N/A')}\n"
+                        f"    Text: {text_line.get('text', 'N/A')}\n"
+                        f"    Type: {text_line.get('text_type', 'N/A')}\n"
+                    )
 
-                if global_bgm:
-                    f.write(f"\nGlobal BGM: {global_bgm.get('audio_url', 'N/A')}\n")
-                    f.write(f"  Volume: {global_bgm.get('volume', 0.3)}\n")
+            if global_bgm:
+                append(f"\nGlobal BGM: {global_bgm.get('audio_url', 'N/A')}\n")
+                append(f"  Volume: {global_bgm.get('volume', 0.3)}\n")
+
+            output_path.write_text("".join(parts), encoding="utf-8")
 
             logger.info(f"[{run_id}] Stub rendering complete: {output_path}")
             logger.info(f"[{run_id}] ===== END STUB RENDERING =====")
@@ -325,16 +320,15 @@ def director_task(self, asset_results: list, run_id: str, json_path: str):
                 logger.info(f"[{run_id}] Transitioned to QA")
                 publish_progress(run_id, state="QA", progress=0.82, log="QA 검수 단계로 전환...")
 
-                from app.main import runs
-                if run_id in runs:
-                    runs[run_id]["state"] = fsm.current_state.value
-                    runs[run_id]["progress"] = 0.82
+                if run_entry is not None:
+                    run_entry["state"] = fsm.current_state.value
+                    run_entry["progress"] = 0.82
                     # Set HTTP URL path for frontend to access video
-                    runs[run_id]["artifacts"]["video_url"] = f"/outputs/{run_id}/final_video.mp4"
+                    run_entry["artifacts"]["video_url"] = f"/outputs/{run_id}/final_video.mp4"
 
                 # Trigger QA task
-                from app.tasks.qa import qa_task
-                qa_task.apply_async(args=[run_id, str(json_path), str(output_path)])
+                qa_input_path = emit_qa_input(layout, output_dir, f"/outputs/{run_id}/final_video.mp4")
+                qa_task.apply_async(args=[run_id, str(qa_input_path), str(output_path)])
                 logger.info(f"[{run_id}] QA task triggered")
 
             return {
@@ -346,8 +340,6 @@ def director_task(self, asset_results: list, run_id: str, json_path: str):
             }
 
         # Use FFmpeg-based renderer (faster and more memory-efficient than MoviePy)
-        from app.utils.ffmpeg_renderer import FFmpegRenderer
-
         logger.info(f"[{run_id}] Using FFmpeg-based rendering pipeline")
 
         output_dir = Path(f"app/data/outputs/{run_id}")
@@ -357,12 +349,21 @@ def director_task(self, asset_results: list, run_id: str, json_path: str):
         # Create FFmpeg renderer
         renderer = FFmpegRenderer(run_id, layout, output_dir)
 
-        # Render video using FFmpeg pipeline
+        # Render video using FFmpeg pipeline (encode progress maps onto 0.72-0.78)
+        progress_debouncer = ProgressDebouncer(interval=1.0)
+
+        def _on_encode_progress(fraction: float) -> None:
+            progress_debouncer.schedule(
+                run_id, progress=0.72 + 0.06 * fraction, log=f"영상 인코딩 중... {int(fraction * 100)}%"
+            )
+
         try:
             publish_progress(run_id, progress=0.72, log="프레임 생성 중...")
-            final_video_path = renderer.render(output_path)
+            final_video_path = renderer.render(output_path, on_progress=_on_encode_progress)
+            progress_debouncer.flush()
             publish_progress(run_id, progress=0.78, log="영상 파일 내보내기 완료")
         except Exception as e:
+            progress_debouncer.flush()
             logger.error(f"[{run_id}] FFmpeg rendering failed: {e}", exc_info=True)
             raise
 
@@ -383,9 +384,9 @@ def director_task(self, asset_results: list, run_id: str, json_path: str):
                 artifacts={"video_url": video_url}
             )
 
-            # Trigger QA task
-            from app.tasks.qa import qa_task
-            qa_task.apply_async(args=[run_id, str(json_path), str(output_path)])
+            # Trigger QA task with the trimmed QA input instead of the full layout
+            qa_input_path = emit_qa_input(layout, output_dir, video_url)
+            qa_task.apply_async(args=[run_id, str(qa_input_path), str(output_path)])
             logger.info(f"[{run_id}] QA task triggered with video_url: {video_url}")
 
         return {
@@ -399,19 +400,18 @@ def director_task(self, asset_results: list, run_id: str, json_path: str):
         logger.error(f"[{run_id}] Director task failed: {e}", exc_info=True)
 
         # Mark FSM as failed
-        from app.orchestrator.fsm import get_fsm
         if fsm := get_fsm(run_id):
             fsm.fail(str(e))
 
-        from app.main import runs
-        if run_id in runs:
-            runs[run_id]["state"] = "FAILED"
-            runs[run_id]["logs"].append(f"Rendering failed: {e}")
+        if run_entry is not None:
+            run_entry["state"] = "FAILED"
+            run_entry["logs"].append(f"Rendering failed: {e}")
 
         raise
 
 
 @celery.task(bind=True, name="tasks.director_pro")
+@single_run_task("director")
 def director_task_pro(self, asset_results: list, run_id: str, json_path: str):
     """
     Pro Mode director: Generate videos using Kling AI and compose final video.
@@ -431,27 +431,25 @@ def director_task_pro(self, asset_results: list, run_id: str, json_path: str):
     Returns:
         Dict with final video URL
     """
-    import asyncio
-
     logger.info(f"[{run_id}] Director Pro: Starting Pro mode video composition...")
     publish_progress(run_id, progress=0.5, log="감독: Pro 모드 영상 합성 시작...")
 
+    # Bind the run registry entry once for every state/progress update below
+    run_entry = runs.get(run_id)
+
     try:
         # Get FSM and transition to RENDERING
-        from app.orchestrator.fsm import get_fsm
         fsm = get_fsm(run_id)
         if fsm and fsm.transition_to(RunState.RENDERING):
             logger.info(f"[{run_id}] Transitioned to RENDERING")
             publish_progress(run_id, state="RENDERING", progress=0.55, log="렌더링 단계 시작")
 
-            from app.main import runs
-            if run_id in runs:
-                runs[run_id]["state"] = fsm.current_state.value
-                runs[run_id]["progress"] = 0.55
+            if run_entry is not None:
+                run_entry["state"] = fsm.current_state.value
+                run_entry["progress"] = 0.55
 
         # Load plot.json
-        with open(json_path, "r", encoding="utf-8") as f:
-            plot = json.load(f)
+        plot = read_json(json_path)
 
         logger.info(f"[{run_id}] Plot loaded with {len(plot.get('scenes', []))} scenes")
 
@@ -465,84 +463,41 @@ def director_task_pro(self, asset_results: list, run_id: str, json_path: str):
         title_text = plot.get("title", "")
 
         # Then, try layout.json for additional config (General mode)
-        if layout_json_path.exists():
-            try:
-                with open(layout_json_path, "r", encoding="utf-8") as f:
-                    layout = json.load(f)
-                # Use layout.json title if plot.json didn't have one
-                if not title_text:
-                    title_text = layout.get("title", "")
-                layout_config = layout.get("metadata", {}).get("layout_config", {})
-                logger.info(f"[{run_id}] Layout config loaded: title='{title_text[:30] if title_text else '(empty)'}', config={layout_config}")
-            except Exception as e:
-                logger.warning(f"[{run_id}] Failed to load layout.json: {e}")
-        else:
+        # Single open attempt: no separate exists() stat, parsed once and only for title/config
+        try:
+            layout = read_json(layout_json_path)
+        except FileNotFoundError:
+            layout = None
             logger.info(f"[{run_id}] Pro mode: using title from plot.json: '{title_text[:30] if title_text else '(empty)'}'")
+        except Exception as e:
+            layout = None
+            logger.warning(f"[{run_id}] Failed to load layout.json: {e}")
+
+        if layout is not None:
+            # Use layout.json title if plot.json didn't have one
+            if not title_text:
+                title_text = layout.get("title", "")
+            layout_config = layout.get("metadata", {}).get("layout_config", {})
+            logger.info(f"[{run_id}] Layout config loaded: title='{title_text[:30] if title_text else '(empty)'}', config={layout_config}")
+            del layout
 
         # Update plot with asset URLs from chord results (if any)
-        if asset_results:
-            for result in asset_results:
-                if not result or "agent" not in result:
-                    continue
-
-                agent = result["agent"]
-
-                # Update image URLs from designer_pro
-                if agent == "designer_pro" and "images" in result:
-                    for img_result in result["images"]:
-                        scene_id = img_result["scene_id"]
-                        frame_type = img_result.get("frame_type", "start")
-                        image_url = img_result["image_url"]
-
-                        for scene in plot.get("scenes", []):
-                            if scene["scene_id"] == scene_id:
-                                if frame_type == "start":
-                                    scene["start_image_url"] = image_url
-                                else:
-                                    scene["end_image_url"] = image_url
-                                logger.info(f"[{run_id}] Updated {scene_id}/{frame_type} -> {image_url}")
-
-                # Update audio URLs from voice agent
-                elif agent == "voice" and "voice" in result:
-                    for audio_result in result["voice"]:
-                        scene_id = audio_result["scene_id"]
-                        audio_url = audio_result["audio_url"]
-                        duration_ms = audio_result.get("duration_ms")
-
-                        for scene in plot.get("scenes", []):
-                            if scene["scene_id"] == scene_id:
-                                scene["audio_url"] = audio_url
-                                if duration_ms:
-                                    scene["tts_duration_ms"] = duration_ms
-                                logger.info(f"[{run_id}] Updated {scene_id} audio -> {audio_url} ({duration_ms}ms)")
-
-                # Update global BGM from composer
-                elif agent == "composer" and "audio" in result:
-                    for audio_item in result["audio"]:
-                        if audio_item.get("type") == "bgm" and audio_item.get("id") == "global_bgm":
-                            bgm_url = audio_item.get("path")
-                            if bgm_url:
-                                plot["bgm_url"] = bgm_url
-                                logger.info(f"[{run_id}] Updated global BGM -> {bgm_url}")
+        plot_dirty = merge_pro_asset_results(plot, asset_results, run_id)
 
         # Get Kling client
-        from app.config import settings
-        from app.utils.kling_client import get_kling_client
-
         stub_mode = not settings.KLING_ACCESS_KEY
         kling_client = get_kling_client(stub_mode=stub_mode)
         logger.info(f"[{run_id}] Using Kling client (stub_mode={stub_mode})")
 
         output_dir = Path(json_path).parent
-        videos_dir = output_dir / "videos"
-        videos_dir.mkdir(parents=True, exist_ok=True)
+        videos_dir = _kling_staging_dir(run_id, output_dir, len(plot.get("scenes", [])))
+        staged_on_scratch = videos_dir != output_dir / "videos"
 
         # Generate video for each scene using Kling
         scenes = plot.get("scenes", [])
 
-        scene_videos = []
-
-        for idx, scene in enumerate(scenes):
+        jobs = []
+        for scene in scenes:
             scene_id = scene["scene_id"]
             start_image = scene.get("start_image_url")
             end_image = scene.get("end_image_url")
@@ -551,8 +506,6 @@ def director_task_pro(self, asset_results: list, run_id: str, json_path: str):
                 logger.warning(f"[{run_id}] Missing images for {scene_id}, skipping")
                 continue
 
-            video_output = videos_dir / f"{scene_id}.mp4"
-
             # Get motion prompt from plot.json (generated by plot_generator)
             # Priority: motion_prompt > text (subtitle as fallback)
             motion_prompt = scene.get("motion_prompt", "")
@@ -560,59 +513,137 @@ def director_task_pro(self, asset_results: list, run_id: str, json_path: str):
                 # Fallback: use subtitle text as basic prompt
                 motion_prompt = scene.get("text", "")
 
-            negative_prompt = scene.get("negative_prompt", "blurry, shaky, distorted, low quality, sudden movement")
+            jobs.append((scene, motion_prompt))
+
+        # Scenes are independent: run Kling requests concurrently (bounded for rate limits)
+        async def _generate_all():
+            semaphore = asyncio.Semaphore(max(1, settings.KLING_MAX_CONCURRENCY))
+            max_retries = max(0, settings.KLING_SCENE_RETRIES)
+            # Stub clips are placeholders: never cache them
+            cache_dir = Path(settings.KLING_CACHE_DIR) if settings.KLING_CACHE_DIR and not stub_mode else None
+            if cache_dir is not None:
+                cache_dir.mkdir(parents=True, exist_ok=True)
+            n_jobs = len(jobs)
+            progress_step = 0.2 / n_jobs if n_jobs else 0.0
+            completed = 0
+
+            async def _generate_one(scene: dict, motion_prompt: str) -> str:
+                nonlocal completed
+                scene_id = scene["scene_id"]
+                negative_prompt = scene.get("negative_prompt", "blurry, shaky, distorted, low quality, sudden movement")
+                output_path = videos_dir / f"{scene_id}.mp4"
+
+                # Same frames + prompts as an earlier render (e.g. a retry): reuse that clip
+                cache_path = None
+                if cache_dir is not None:
+                    cache_path = cache_dir / f"{_kling_cache_key(scene, motion_prompt, negative_prompt)}.mp4"
+                    if _copy_clip(cache_path, output_path):
+                        _mark_kling_cache_used(cache_path)
+                        completed += 1
+                        logger.info(f"[{run_id}] ✓ Reused cached Kling video for {scene_id}: {cache_path.name}")
+                        progress_debouncer.schedule(
+                            run_id,
+                            progress=0.55 + progress_step * completed,
+                            log=f"Kling: {scene_id} 캐시된 영상 재사용 ({completed}/{n_jobs})"
+                        )
+                        return str(output_path)
+
+                async with semaphore:
+                    logger.info(f"[{run_id}] Generating video for {scene_id}...")
+                    if motion_prompt:
+                        logger.info(f"[{run_id}]   Motion prompt: {motion_prompt[:50]}...")
+
+                    # Retry only this scene on transient failures instead of failing the whole render
+                    for attempt in range(max_retries + 1):
+                        try:
+                            video_path = await kling_client.image_to_video(
+                                start_image_path=scene["start_image_url"],
+                                end_image_path=scene["end_image_url"],
+                                output_path=str(output_path),
+                                prompt=motion_prompt,
+                                negative_prompt=negative_prompt
+                            )
+                            break
+                        except (httpx.TransportError, KlingTransientError) as e:
+                            if attempt >= max_retries:
+                                raise
+                            backoff = 5 * (2 ** attempt)
+                            logger.warning(
+                                f"[{run_id}] Kling {scene_id} failed ({e}), "
+                                f"retry {attempt + 1}/{max_retries} in {backoff}s"
+                            )
+                            await asyncio.sleep(backoff)
+
+                if cache_path is not None:
+                    _store_in_kling_cache(Path(video_path), cache_path, run_id)
+
+                completed += 1
+                logger.info(f"[{run_id}] ✓ Video generated for {scene_id}: {video_path}")
+                # Completions tend to land together: coalesce them into one publish
+                progress_debouncer.schedule(
+                    run_id,
+                    progress=0.55 + progress_step * completed,
+                    log=f"Kling: {scene_id} 영상 생성 완료 ({completed}/{n_jobs})"
+                )
+                return video_path
 
-            logger.info(f"[{run_id}] Generating video for {scene_id}...")
-            if motion_prompt:
-                logger.info(f"[{run_id}]   Motion prompt: {motion_prompt[:50]}...")
-            publish_progress(
-                run_id,
-                progress=0.55 + (0.2 * idx / len(scenes)),
-                log=f"Kling: {scene_id} 영상 생성 중..."
-            )
+            # One event loop and one HTTP pool for the whole batch
+            async with kling_client:
+                results = await asyncio.gather(*(_generate_one(scene, prompt) for scene, prompt in jobs))
+            if cache_dir is not None:
+                _prune_kling_cache(cache_dir, settings.KLING_CACHE_MAX_BYTES, run_id)
+            return results
 
-            # Call Kling API (async)
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                video_path = loop.run_until_complete(
-                    kling_client.image_to_video(
-                        start_image_path=start_image,
-                        end_image_path=end_image,
-                        output_path=str(video_output),
-                        prompt=motion_prompt,
-                        negative_prompt=negative_prompt
-                    )
-                )
-            finally:
-                loop.close()
+        publish_progress(run_id, progress=0.55, log=f"Kling: {len(jobs)}개 장면 영상 생성 중...")
+        progress_debouncer = ProgressDebouncer()
+        try:
+            video_paths = asyncio.run(_generate_all()) if jobs else []
+        finally:
+            progress_debouncer.flush()
 
-            scene["video_url"] = str(video_path)
+        scene_videos = []
+        for (scene, _), video_path in zip(jobs, video_paths):
+            if not staged_on_scratch and scene.get("video_url") != str(video_path):
+                # Scratch clips are deleted after composition: only record durable paths
+                scene["video_url"] = str(video_path)
+                plot_dirty = True
             scene_videos.append({
-                "scene_id": scene_id,
+                "scene_id": scene["scene_id"],
                 "video_path": str(video_path),
                 "tts_duration_ms": scene.get("tts_duration_ms"),
                 "audio_url": scene.get("audio_url"),
                 "text": scene.get("text", "")
             })
 
-            logger.info(f"[{run_id}] ✓ Video generated for {scene_id}: {video_path}")
-
-        # Save updated plot.json with video URLs
-        with open(json_path, "w", encoding="utf-8") as f:
-            json.dump(plot, f, indent=2, ensure_ascii=False)
+        # Save updated plot.json with video URLs (skipped when nothing changed)
+        if plot_dirty:
+            write_json(json_path, plot)
+        else:
+            logger.info(f"[{run_id}] plot.json already up to date, skipping rewrite")
 
-        # Compose final video using FFmpeg/MoviePy
+        # Compose final video using FFmpeg/MoviePy (encode progress maps onto 0.75-0.85)
         publish_progress(run_id, progress=0.75, log="감독: 장면 합성 및 자막 오버레이 중...")
+        progress_debouncer = ProgressDebouncer(interval=1.0)
 
-        final_video_path = _compose_pro_video(
-            run_id=run_id,
-            scene_videos=scene_videos,
-            bgm_url=plot.get("bgm_url"),
-            output_dir=output_dir,
-            title_text=title_text,
-            layout_config=layout_config
-        )
+        def _on_encode_progress(fraction: float) -> None:
+            progress_debouncer.schedule(
+                run_id, progress=0.75 + 0.1 * fraction, log=f"영상 인코딩 중... {int(fraction * 100)}%"
+            )
+
+        try:
+            final_video_path = _compose_pro_video(
+                run_id=run_id,
+                scene_videos=scene_videos,
+                bgm_url=plot.get("bgm_url"),
+                output_dir=output_dir,
+                title_text=title_text,
+                layout_config=layout_config,
+                on_progress=_on_encode_progress
+            )
+        finally:
+            progress_debouncer.flush()
+            if staged_on_scratch:
+                shutil.rmtree(videos_dir, ignore_errors=True)
 
         logger.info(f"[{run_id}] Final Pro mode video: {final_video_path}")
         publish_progress(run_id, progress=0.85, log=f"영상 합성 완료: {final_video_path}")
@@ -630,9 +661,9 @@ def director_task_pro(self, asset_results: list, run_id: str, json_path: str):
                 artifacts={"video_url": video_url}
             )
 
-            # Trigger QA task
-            from app.tasks.qa import qa_task
-            qa_task.apply_async(args=[run_id, str(json_path), str(final_video_path)])
+            # Trigger QA task with the trimmed QA input instead of the full plot
+            qa_input_path = emit_qa_input(plot, output_dir, video_url)
+            qa_task.apply_async(args=[run_id, str(qa_input_path), str(final_video_path)])
             logger.info(f"[{run_id}] QA task triggered")
 
         return {
@@ -645,14 +676,12 @@ def director_task_pro(self, asset_results: list, run_id: str, json_path: str):
     except Exception as e:
         logger.error(f"[{run_id}] Director Pro task failed: {e}", exc_info=True)
 
-        from app.orchestrator.fsm import get_fsm
         if fsm := get_fsm(run_id):
             fsm.fail(str(e))
 
-        from app.main import runs
-        if run_id in runs:
-            runs[run_id]["state"] = "FAILED"
-            runs[run_id]["logs"].append(f"Pro mode rendering failed: {e}")
+        if run_entry is not None:
+            run_entry["state"] = "FAILED"
+            run_entry["logs"].append(f"Pro mode rendering failed: {e}")
 
         raise
 
@@ -663,7 +692,8 @@ def _compose_pro_video(
     bgm_url: str | None,
     output_dir: Path,
     title_text: str = "",
-    layout_config: dict | None = None
+    layout_config: dict | None = None,
+    on_progress: Callable[[float], None] | None = None
 ) -> Path:
     """
     Compose final Pro mode video with General mode layout.
@@ -674,12 +704,13 @@ def _compose_pro_video(
     - Video area: 1080x1080 (bottom) - 1:1 cropped video
 
     For each scene:
-    1. Generate static frame with title + subtitle using PIL
+    1. Static frame: title block drawn once with PIL; the subtitle is drawn by
+       FFmpeg drawtext when the subtitle font is a local file (else by PIL per scene)
     2. Crop Kling video to 1:1 and overlay on frame
     3. If TTS > 5s, extend with freeze frame
     4. Add TTS audio
 
-    Then concatenate all scenes and add BGM.
+    Steps 2-4, the concat and the BGM mix run as a single FFmpeg filter graph.
 
     Args:
         run_id: Run identifier
@@ -688,16 +719,11 @@ def _compose_pro_video(
         output_dir: Output directory (MUST be absolute path)
         title_text: Project title for title block
         layout_config: Layout configuration (colors, fonts, etc.)
+        on_progress: Called with the encoded fraction (0..1) while FFmpeg runs
 
     Returns:
         Path to final video
     """
-    import subprocess
-    import shutil
-    from PIL import Image, ImageDraw, ImageFont
-    from app.config import settings
-    from app.utils.fonts import get_font_path
-
     logger.info(f"[{run_id}] === Pro Mode Video Composition Start (General Layout) ===")
     logger.info(f"[{run_id}] Scenes: {len(scene_videos)}")
     logger.info(f"[{run_id}] Title: {title_text[:50]}..." if title_text else f"[{run_id}] No title")
@@ -706,50 +732,68 @@ def _compose_pro_video(
     output_dir = Path(output_dir).resolve()
     logger.info(f"[{run_id}] Output dir (absolute): {output_dir}")
 
-    # Create temp directories with absolute paths
-    temp_dir = output_dir / "temp_pro"
-    frames_dir = temp_dir / "frames"
-    temp_dir.mkdir(parents=True, exist_ok=True)
-    frames_dir.mkdir(parents=True, exist_ok=True)
-    logger.info(f"[{run_id}] Temp dir: {temp_dir}")
+    # Video area starts at bottom (1080px height)
+    video_area_top = PRO_FRAME_HEIGHT - PRO_VIDEO_SIZE  # 1920 - 1080 = 840
 
-    # Layout configuration
-    layout_config = layout_config or {}
-    FRAME_WIDTH = 1080
-    FRAME_HEIGHT = 1920
-    VIDEO_SIZE = 1080  # 1:1 square video area
-
-    # Title block settings
-    title_bg_color = _hex_to_rgb(layout_config.get("title_bg_color", "#323296"))
-    title_font_size = layout_config.get("title_font_size", 100)
-    subtitle_font_size = layout_config.get("subtitle_font_size", 80)
-
-    # Load fonts
-    title_font_id = layout_config.get("title_font", "AppleGothic")
-    subtitle_font_id = layout_config.get("subtitle_font", "AppleGothic")
-    title_font_path = get_font_path(title_font_id)
-    subtitle_font_path = get_font_path(subtitle_font_id)
+    # Resolve every input path once up front (one stat each) and fail before any rendering
+    video_paths = [_existing_abs_path(scene_info["video_path"]) for scene_info in scene_videos]
+    missing_videos = [
+        scene_info["video_path"]
+        for scene_info, video_path in zip(scene_videos, video_paths)
+        if video_path is None
+    ]
+    if missing_videos:
+        logger.error(f"[{run_id}] Videos not found: {missing_videos}")
+        raise FileNotFoundError(f"Scene video not found: {', '.join(missing_videos)}")
+    audio_paths = [_existing_abs_path(scene_info.get("audio_url")) for scene_info in scene_videos]
 
-    try:
-        title_font = ImageFont.truetype(title_font_path, title_font_size)
-        subtitle_font = ImageFont.truetype(subtitle_font_path, subtitle_font_size)
-    except Exception as e:
-        logger.warning(f"[{run_id}] Font load error: {e}, using default")
-        title_font = ImageFont.load_default()
-        subtitle_font = ImageFont.load_default()
+    # === Step 1: Create static frames (title + subtitle + white bg) ===
+    # Frames stay in memory as raw RGB and are piped to FFmpeg (no PNG encode/decode round-trip)
+    layout_config = layout_config or {}
+    subtitle_dir = output_dir / "temp_pro" / "subtitles"
+    subtitle_font_file = _drawtext_font_file(layout_config.get("subtitle_font", "AppleGothic"))
+    use_drawtext = (
+        subtitle_font_file is not None
+        and _FILTER_SAFE_PATH.match(str(subtitle_dir)) is not None
+        and ffmpeg_has_filter("drawtext")
+    )
+
+    if use_drawtext:
+        # Only the shared title frame comes from PIL; FFmpeg draws each subtitle in the graph
+        _init_pro_frame_renderer(title_text, layout_config, run_id)
+        frames = [_pro_frame_ctx["base_frame"].tobytes()]
+        subtitle_dir.mkdir(parents=True, exist_ok=True)
+        logger.info(f"[{run_id}] Subtitles via FFmpeg drawtext ({Path(subtitle_font_file).name})")
+    else:
+        # CPU-bound and independent per scene: rendered in parallel worker processes
+        frames = _render_pro_frames(
+            run_id,
+            [scene_info.get("text", "") for scene_info in scene_videos],
+            title_text,
+            layout_config
+        )
 
-    processed_videos: list[Path] = []
+    # === Step 2: Build one FFmpeg graph for all scenes (+ BGM) ===
+    # Input 0: static frames as one rawvideo stream on stdin
+    # (frame i = scene i, or a single shared title frame with drawtext subtitles)
+    # Inputs per scene: Kling video, TTS audio (optional)
+    inputs: list[str] = [
+        "-f", "rawvideo", "-pix_fmt", "rgb24",
+        "-s", f"{PRO_FRAME_WIDTH}x{PRO_FRAME_HEIGHT}",
+        "-framerate", str(PRO_FRAME_RATE),
+        "-i", "pipe:0"
+    ]
+    filter_parts: list[str] = [
+        "[0:v]split=" + str(len(scene_videos)) + "".join(f"[f{idx}]" for idx in range(len(scene_videos)))
+    ]
+    concat_inputs = ""
+    total_duration = 0.0
+    input_idx = 1
+    drawtext_chains: dict[str, str] = {}  # subtitle text -> drawtext filter chain
 
     for idx, scene_info in enumerate(scene_videos):
         scene_id = scene_info["scene_id"]
-
-        # CRITICAL: Convert all input paths to absolute immediately
-        raw_video_path = scene_info["video_path"]
-        video_path = Path(raw_video_path).resolve()
-
-        if not video_path.exists():
-            logger.error(f"[{run_id}] Video not found: {video_path}")
-            raise FileNotFoundError(f"Scene video not found: {video_path}")
+        video_path = video_paths[idx]
 
         tts_duration_ms = scene_info.get("tts_duration_ms") or 5000
         raw_audio_url = scene_info.get("audio_url")
@@ -758,280 +802,547 @@ def _compose_pro_video(
         tts_duration_sec = tts_duration_ms / 1000.0
         video_duration_sec = float(settings.KLING_VIDEO_DURATION)  # 5 seconds
 
+        # Scene duration (video length or TTS length, whichever is longer)
+        scene_duration = max(tts_duration_sec, video_duration_sec)
+        total_duration += scene_duration
+
         logger.info(f"[{run_id}] [{idx+1}/{len(scene_videos)}] {scene_id}")
         logger.info(f"[{run_id}]   Video: {video_path}")
         logger.info(f"[{run_id}]   Duration: video={video_duration_sec}s, tts={tts_duration_sec}s")
         logger.info(f"[{run_id}]   Subtitle: {subtitle_text[:30]}..." if subtitle_text else f"[{run_id}]   No subtitle")
 
-        # === Step 1: Create static frame with PIL (title + subtitle + white bg) ===
-        frame_path = frames_dir / f"{scene_id}_frame.png"
-        frame_img = Image.new('RGB', (FRAME_WIDTH, FRAME_HEIGHT), (255, 255, 255))
-        draw = ImageDraw.Draw(frame_img)
-
-        # Calculate title block height
-        title_block_height = 0
-        if title_text:
-            title_lines = _wrap_text(title_text, title_font, int(FRAME_WIDTH * 0.9))
-            line_height = int(title_font_size * 1.3)
-            padding = 40
-            title_block_height = len(title_lines) * line_height + padding * 2
-
-            # Draw title background
-            draw.rectangle([(0, 0), (FRAME_WIDTH, title_block_height)], fill=title_bg_color)
-
-            # Draw title text (centered)
-            current_y = padding
-            for line in title_lines:
-                bbox = title_font.getbbox(line)
-                text_width = bbox[2] - bbox[0]
-                x_centered = (FRAME_WIDTH - text_width) // 2
-                _draw_text_with_stroke(draw, line, (x_centered, current_y), title_font,
-                                       fill_color=(255, 255, 255), stroke_color=(0, 0, 0), stroke_width=3)
-                current_y += line_height
-
-        # Video area starts at bottom (1080px height)
-        video_area_top = FRAME_HEIGHT - VIDEO_SIZE  # 1920 - 1080 = 840
-
-        # Subtitle area: between title block and video area
-        subtitle_area_top = title_block_height
-        subtitle_area_height = video_area_top - title_block_height
-
-        # Draw subtitle (centered in subtitle area)
-        if subtitle_text:
-            subtitle_lines = _wrap_text(subtitle_text, subtitle_font, int(FRAME_WIDTH * 0.9))
-            line_height = int(subtitle_font_size * 1.3)
-            total_text_height = len(subtitle_lines) * line_height
-
-            # Center vertically in subtitle area
-            subtitle_y = subtitle_area_top + (subtitle_area_height - total_text_height) // 2
-
-            for line in subtitle_lines:
-                bbox = subtitle_font.getbbox(line)
-                text_width = bbox[2] - bbox[0]
-                x_centered = (FRAME_WIDTH - text_width) // 2
-                _draw_text_with_stroke(draw, line, (x_centered, subtitle_y), subtitle_font,
-                                       fill_color=(0, 0, 0), stroke_color=(255, 255, 255), stroke_width=2)
-                subtitle_y += line_height
-
-        # Save frame
-        frame_img.save(frame_path, "PNG")
-        logger.info(f"[{run_id}]   ✓ Frame created: {frame_path.name}")
-
-        # === Step 2: Process video with FFmpeg ===
-        output_scene_path = temp_dir / f"{scene_id}_processed.mp4"
-
         # Prepare audio input (absolute path)
-        audio_path: Path | None = None
-        if raw_audio_url:
-            audio_path = Path(raw_audio_url).resolve()
-            if not audio_path.exists():
-                logger.warning(f"[{run_id}]   Audio not found: {audio_path}")
-                audio_path = None
-            else:
-                logger.info(f"[{run_id}]   Audio: {audio_path}")
-
-        # Build FFmpeg command
-        # Input 0: Kling video
-        # Input 1: Static frame (for overlay base)
-        # Input 2: Audio (optional)
-
-        inputs = [
-            "-i", str(video_path),
-            "-loop", "1", "-t", str(max(tts_duration_sec, video_duration_sec)), "-i", str(frame_path)
-        ]
-        input_count = 2
-
-        audio_input_idx: int | None = None
+        audio_path = audio_paths[idx]
         if audio_path:
-            inputs.extend(["-i", str(audio_path)])
-            audio_input_idx = input_count
-            input_count += 1
-
-        # Filter complex:
-        # 1. Crop video to 1:1 (center crop)
-        # 2. Scale to VIDEO_SIZE x VIDEO_SIZE
-        # 3. If TTS > 5s, extend video with freeze frame (tpad)
-        # 4. Overlay video on frame at bottom
-
-        filter_parts = []
+            logger.info(f"[{run_id}]   Audio: {audio_path}")
+        elif raw_audio_url:
+            logger.warning(f"[{run_id}]   Audio not found: {raw_audio_url}")
+
+        video_input_idx = input_idx
+        inputs.extend([*hwaccel_input_args(), "-i", str(video_path)])
+        input_idx += 1
+
+        # Pick this scene's frame and hold it for the whole scene
+        # (subtitle is drawn on the single frame before tpad clones it, not on every output frame)
+        frame_no = 0 if use_drawtext else idx
+        bg_chain = f"[f{idx}]trim=start_frame={frame_no}:end_frame={frame_no + 1},setpts=PTS-STARTPTS,"
+        if use_drawtext and subtitle_text:
+            drawtext_chain = drawtext_chains.get(subtitle_text)
+            if drawtext_chain is None:
+                # Repeated subtitles share one layout pass and one set of text files
+                drawtext_chain = _subtitle_drawtext_chain(
+                    subtitle_text, subtitle_font_file, subtitle_dir, len(drawtext_chains)
+                )
+                drawtext_chains[subtitle_text] = drawtext_chain
+            bg_chain += drawtext_chain + ","
+        filter_parts.append(bg_chain + f"tpad=stop_mode=clone:stop_duration={scene_duration}[bg{idx}]")
 
         # Crop and scale video to 1:1 (1080x1080)
         # crop=min(iw,ih):min(iw,ih) crops to square from center
-        crop_scale = f"[0:v]crop=min(iw\\,ih):min(iw\\,ih),scale={VIDEO_SIZE}:{VIDEO_SIZE}"
+        crop_scale = f"[{video_input_idx}:v]crop=min(iw\\,ih):min(iw\\,ih),scale={PRO_VIDEO_SIZE}:{PRO_VIDEO_SIZE}"
 
-        # Add freeze frame extension if needed
+        # If TTS > 5s, extend video with freeze frame (tpad)
         if tts_duration_sec > video_duration_sec:
             extra_duration = tts_duration_sec - video_duration_sec
             logger.info(f"[{run_id}]   Freeze frame: +{extra_duration:.1f}s")
             crop_scale += f",tpad=stop_mode=clone:stop_duration={extra_duration}"
 
-        crop_scale += "[vcropped]"
-        filter_parts.append(crop_scale)
+        filter_parts.append(crop_scale + f"[vc{idx}]")
+
+        # Overlay cropped video on frame at video_area_top position, cut to scene duration
+        filter_parts.append(
+            f"[bg{idx}][vc{idx}]overlay=0:{video_area_top},"
+            f"trim=duration={scene_duration},setpts=PTS-STARTPTS,setsar=1[v{idx}]"
+        )
 
-        # Overlay cropped video on frame at video_area_top position
-        filter_parts.append(f"[1:v][vcropped]overlay=0:{video_area_top}[vout]")
+        # TTS plays at scene start and silence fills remaining time; scenes without
+        # TTS get a silent track so every concat segment has audio
+        if audio_path:
+            inputs.extend(["-i", str(audio_path)])
+            filter_parts.append(
+                f"[{input_idx}:a]aformat=sample_rates=44100:channel_layouts=stereo,"
+                f"apad=whole_dur={scene_duration},atrim=duration={scene_duration},asetpts=PTS-STARTPTS[a{idx}]"
+            )
+            input_idx += 1
+        else:
+            filter_parts.append(
+                f"anullsrc=r=44100:cl=stereo,atrim=duration={scene_duration}[a{idx}]"
+            )
 
-        # Calculate scene duration (video length or TTS length, whichever is longer)
-        scene_duration = max(tts_duration_sec, video_duration_sec)
+        concat_inputs += f"[v{idx}][a{idx}]"
 
-        # Add audio padding to match scene duration
-        # This ensures TTS plays at scene start and silence fills remaining time
-        if audio_input_idx is not None:
-            # apad pads with silence, then atrim cuts to exact duration
-            filter_parts.append(f"[{audio_input_idx}:a]apad=whole_dur={scene_duration}[aout]")
+    filter_parts.append(f"{concat_inputs}concat=n={len(scene_videos)}:v=1:a=1[vout][acat]")
 
-        filter_complex = ";".join(filter_parts)
+    # === Add BGM if available ===
+    final_output = output_dir / "final_video.mp4"
 
+    bgm_path = _existing_abs_path(bgm_url)
+    if bgm_url and not bgm_path:
+        logger.warning(f"[{run_id}] BGM not found: {bgm_url}")
+
+    def _build_cmd(with_bgm: bool) -> list[str]:
+        # Per-scene crop/scale/overlay chains are the heavy part of this graph: let them use every core
         cmd = [
-            "ffmpeg", "-y",
-            *inputs,
-            "-filter_complex", filter_complex,
-            "-map", "[vout]",
+            "ffmpeg", *ffmpeg_log_args(), "-y",
+            "-filter_complex_threads", str(os.cpu_count() or 1),
+            *inputs
         ]
-
-        # Add audio mapping (now using filtered audio with padding)
-        if audio_input_idx is not None:
-            cmd.extend(["-map", "[aout]"])
+        parts = list(filter_parts)
+        if with_bgm:
+            # Total duration is known from the scene plan, no ffprobe pass needed
+            cmd.extend(["-stream_loop", "-1", "-i", str(bgm_path)])
+            parts.append(f"[{input_idx}:a]volume=0.3,atrim=0:{total_duration}[bgm]")
+            parts.append("[acat][bgm]amix=inputs=2:duration=first:dropout_transition=2[aout]")
+            audio_label = "[aout]"
         else:
-            cmd.extend(["-an"])
+            audio_label = "[acat]"
 
         cmd.extend([
-            "-c:v", "libx264",
-            "-preset", "fast",
-            "-crf", "23",
+            "-filter_complex", ";".join(parts),
+            "-map", "[vout]",
+            "-map", audio_label,
+            *video_encoder_args(),
+            "-threads", "0",
+            "-pix_fmt", "yuv420p",
+            # moov atom up front: the browser player can start before the whole file loads
+            "-movflags", "+faststart",
             "-c:a", "aac",
-            "-b:a", "128k",
-            "-t", str(scene_duration),
-            str(output_scene_path)
+            "-b:a", "192k",
+            "-t", str(total_duration),
+            str(final_output)
         ])
+        return cmd
+
+    logger.info(f"[{run_id}] Composing {len(scene_videos)} scenes in one FFmpeg pass (total {total_duration:.1f}s)...")
+
+    try:
+        if bgm_path:
+            logger.info(f"[{run_id}] Adding BGM: {bgm_path}")
+            try:
+                cmd = _build_cmd(with_bgm=True)
+                logger.debug(f"[{run_id}] FFmpeg: {' '.join(cmd)}")
+                run_ffmpeg(cmd, frames, total_duration, on_progress)
+                logger.info(f"[{run_id}] ✓ BGM mixed successfully")
+            except subprocess.CalledProcessError as e:
+                logger.error(f"[{run_id}] ✗ BGM mix error: {e.stderr.decode(errors='replace')}")
+                logger.warning(f"[{run_id}] Retrying without BGM as fallback")
+                bgm_path = None
+
+        if not bgm_path:
+            cmd = _build_cmd(with_bgm=False)
+            try:
+                logger.debug(f"[{run_id}] FFmpeg: {' '.join(cmd)}")
+                run_ffmpeg(cmd, frames, total_duration, on_progress)
+                logger.info(f"[{run_id}] No BGM, composed scenes without background music")
+            except subprocess.CalledProcessError as e:
+                logger.error(f"[{run_id}] ✗ FFmpeg error: {e.stderr.decode(errors='replace')}")
+                raise
+    finally:
+        if use_drawtext:
+            shutil.rmtree(subtitle_dir, ignore_errors=True)
+
+    logger.info(f"[{run_id}] === Pro Mode Video Composition Complete ===")
+    logger.info(f"[{run_id}] ✓ Final video: {final_output}")
+    return final_output
+
+
+def _existing_abs_path(path: str | None) -> Path | None:
+    """
+    Make a path absolute (string op, no symlink walk) and check it exists with a single stat.
+
+    Args:
+        path: File path (may be relative or empty)
+
+    Returns:
+        Absolute Path, or None if the path is empty or missing
+    """
+    if not path:
+        return None
+    abs_path = os.path.abspath(path)
+    try:
+        os.stat(abs_path)
+    except OSError:
+        return None
+    return Path(abs_path)
+
 
+# Rough upper bound for one 5s 1080p Kling clip, used to size the scratch staging area
+KLING_CLIP_BYTES_ESTIMATE = 30 * 1024 * 1024
+
+
+def _kling_staging_dir(run_id: str, output_dir: Path, scene_count: int) -> Path:
+    """
+    Pick the directory for per-scene Kling clips.
+
+    The clips are only inputs to _compose_pro_video, so they go to
+    settings.SCRATCH_DIR (e.g. tmpfs) when configured and large enough;
+    otherwise they stay in output_dir/videos as before.
+
+    Args:
+        run_id: Run identifier
+        output_dir: Run output directory
+        scene_count: Number of scenes to stage
+
+    Returns:
+        Absolute, existing directory path
+    """
+    if settings.SCRATCH_DIR:
+        scratch_root = Path(settings.SCRATCH_DIR)
         try:
-            logger.debug(f"[{run_id}] FFmpeg: {' '.join(cmd)}")
-            result = subprocess.run(cmd, check=True, capture_output=True, text=True)
-            processed_videos.append(output_scene_path)
-            logger.info(f"[{run_id}]   ✓ Processed -> {output_scene_path.name}")
-        except subprocess.CalledProcessError as e:
-            logger.error(f"[{run_id}]   ✗ FFmpeg error: {e.stderr}")
-            raise
+            needed = scene_count * KLING_CLIP_BYTES_ESTIMATE
+            if shutil.disk_usage(scratch_root).free >= needed:
+                staging_dir = (scratch_root / f"kling-{run_id}").resolve()
+                staging_dir.mkdir(parents=True, exist_ok=True)
+                logger.info(f"[{run_id}] Staging Kling clips on scratch: {staging_dir}")
+                return staging_dir
+            logger.warning(f"[{run_id}] Not enough space in {scratch_root} for {scene_count} clips, using output dir")
+        except OSError as e:
+            logger.warning(f"[{run_id}] Scratch dir {scratch_root} unusable ({e}), using output dir")
+
+    videos_dir = output_dir / "videos"
+    videos_dir.mkdir(parents=True, exist_ok=True)
+    return videos_dir
+
+
+def _kling_cache_key(scene: dict, motion_prompt: str, negative_prompt: str) -> str:
+    """
+    Hash everything that determines a scene's Kling clip.
 
-    # === Concatenate all processed videos ===
-    logger.info(f"[{run_id}] Concatenating {len(processed_videos)} videos...")
+    Args:
+        scene: Plot scene with start/end frame paths
+        motion_prompt: Motion prompt sent to Kling
+        negative_prompt: Negative prompt sent to Kling
 
-    concat_list_path = temp_dir / "concat_list.txt"
-    with open(concat_list_path, "w") as f:
-        for vpath in processed_videos:
-            f.write(f"file '{vpath}'\n")
-            logger.debug(f"[{run_id}]   - {vpath}")
+    Returns:
+        Hex digest used as the cache file name
+    """
+    digest = hashlib.sha256()
+    for image_path in (scene["start_image_url"], scene["end_image_url"]):
+        with open(image_path, "rb") as f:
+            digest.update(hashlib.file_digest(f, "sha256").digest())
+    for part in (motion_prompt, negative_prompt, KLING_MODEL_V1_6, str(settings.KLING_VIDEO_DURATION)):
+        digest.update(b"\0" + (part or "").encode("utf-8"))
+    return digest.hexdigest()
 
-    concat_output = temp_dir / "concat_no_bgm.mp4"
 
-    concat_cmd = [
-        "ffmpeg", "-y",
-        "-f", "concat",
-        "-safe", "0",
-        "-i", str(concat_list_path),
-        "-c", "copy",
-        str(concat_output)
-    ]
+def _copy_clip(src: Path, dst: Path) -> bool:
+    """
+    Materialize src at dst as an independent file (reflink/in-kernel copy, else plain copy).
+
+    Never hardlinks: Kling/stub writers rewrite videos/{scene_id}.mp4 in place,
+    so a shared inode would let a later render overwrite a cached clip.
 
+    Args:
+        src: Existing file
+        dst: Destination path (replaced if present)
+
+    Returns:
+        False if src does not exist
+    """
     try:
-        logger.debug(f"[{run_id}] Concat cmd: {' '.join(concat_cmd)}")
-        subprocess.run(concat_cmd, check=True, capture_output=True, text=True)
-        logger.info(f"[{run_id}] ✓ Concatenation complete: {concat_output.name}")
-    except subprocess.CalledProcessError as e:
-        logger.error(f"[{run_id}] ✗ Concat error: {e.stderr}")
-        logger.error(f"[{run_id}] Concat list contents:")
-        with open(concat_list_path) as f:
-            logger.error(f.read())
-        raise
+        dst.unlink(missing_ok=True)
+        _clone_file(src, dst)
+    except FileNotFoundError:
+        return False
+    return True
 
-    # === Add BGM if available ===
-    final_output = output_dir / "final_video.mp4"
 
-    bgm_path: Path | None = None
-    if bgm_url:
-        bgm_path = Path(bgm_url).resolve()
-        if not bgm_path.exists():
-            logger.warning(f"[{run_id}] BGM not found: {bgm_path}")
-            bgm_path = None
-
-    if bgm_path:
-        logger.info(f"[{run_id}] Adding BGM: {bgm_path}")
-
-        # Get video duration for BGM trimming
-        probe_cmd = [
-            "ffprobe", "-v", "error",
-            "-show_entries", "format=duration",
-            "-of", "default=noprint_wrappers=1:nokey=1",
-            str(concat_output)
-        ]
-        result = subprocess.run(probe_cmd, capture_output=True, text=True)
-        video_duration = float(result.stdout.strip())
-        logger.info(f"[{run_id}] Video duration: {video_duration:.1f}s")
-
-        # Mix BGM with existing audio
-        bgm_cmd = [
-            "ffmpeg", "-y",
-            "-i", str(concat_output),
-            "-stream_loop", "-1",
-            "-i", str(bgm_path),
-            "-filter_complex",
-            f"[1:a]volume=0.3,atrim=0:{video_duration}[bgm];"
-            f"[0:a][bgm]amix=inputs=2:duration=first:dropout_transition=2[aout]",
-            "-map", "0:v",
-            "-map", "[aout]",
-            "-c:v", "copy",
-            "-c:a", "aac",
-            "-b:a", "192k",
-            "-shortest",
-            str(final_output)
-        ]
+def _clone_file(src: Path, dst: Path) -> None:
+    """
+    Copy src to dst with copy_file_range (CoW reflink on btrfs/xfs), else shutil.copyfile.
+    """
+    if hasattr(os, "copy_file_range"):
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+                if remaining == 0:
+                    return
+        except FileNotFoundError:
+            raise
+        except OSError:
+            # EXDEV / ENOSYS / EINVAL: unsupported for this pair of filesystems
+            pass
+    shutil.copyfile(src, dst)
+
 
+def _store_in_kling_cache(video_path: Path, cache_path: Path, run_id: str) -> None:
+    """Publish a generated clip into the Kling cache atomically (best effort)."""
+    tmp_path = cache_path.with_name(f".{cache_path.name}.{run_id}.tmp")
+    try:
+        _copy_clip(video_path, tmp_path)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logger.warning(f"[{run_id}] Could not cache Kling clip {video_path.name}: {e}")
+        tmp_path.unlink(missing_ok=True)
+
+
+def _mark_kling_cache_used(cache_path: Path) -> None:
+    """Bump a cached clip's mtime so LRU pruning keeps it (best effort)."""
+    try:
+        os.utime(cache_path)
+    except OSError:
+        pass
+
+
+def _prune_kling_cache(cache_dir: Path, max_bytes: int, run_id: str) -> None:
+    """
+    Trim the Kling cache to max_bytes, deleting least recently used clips first.
+
+    Clips are ordered by mtime, which is set when a clip is stored and bumped
+    on every cache hit.
+
+    Args:
+        cache_dir: Kling cache directory
+        max_bytes: Size budget for the cache
+        run_id: Run identifier for logging
+    """
+    entries = []
+    for path in cache_dir.glob("*.mp4"):
         try:
-            subprocess.run(bgm_cmd, check=True, capture_output=True, text=True)
-            logger.info(f"[{run_id}] ✓ BGM mixed successfully")
-        except subprocess.CalledProcessError as e:
-            logger.error(f"[{run_id}] ✗ BGM mix error: {e.stderr}")
-            shutil.copy(concat_output, final_output)
-            logger.warning(f"[{run_id}] Using video without BGM as fallback")
-    else:
-        shutil.copy(concat_output, final_output)
-        logger.info(f"[{run_id}] No BGM, using concatenated video as final")
+            st = path.stat()
+        except OSError:
+            continue
+        entries.append((st.st_mtime, st.st_size, path))
+
+    entries.sort(reverse=True)
+    kept_bytes = 0
+    removed = 0
+    for _, size, path in entries:
+        kept_bytes += size
+        if kept_bytes > max_bytes:
+            path.unlink(missing_ok=True)
+            removed += 1
+    if removed:
+        logger.info(f"[{run_id}] Pruned {removed} clips from Kling cache (limit {max_bytes} bytes)")
+
+
+# Pro mode frame layout (1080x1920, 1:1 video area at the bottom)
+PRO_FRAME_WIDTH = 1080
+PRO_FRAME_HEIGHT = 1920
+PRO_VIDEO_SIZE = 1080
+PRO_FRAME_RATE = 25  # rate of the piped static frames (matches the former -loop 1 image input)
+
+# Per-process frame renderer state (fonts + pre-drawn title frame), set by _init_pro_frame_renderer
+_pro_frame_ctx: dict | None = None
+
+
+def _init_pro_frame_renderer(title_text: str, layout_config: dict, run_id: str = ""):
+    """
+    Load fonts and draw the constant base frame (white bg + title block) for this process.
 
-    logger.info(f"[{run_id}] === Pro Mode Video Composition Complete ===")
-    logger.info(f"[{run_id}] ✓ Final video: {final_output}")
-    return final_output
+    Used as ProcessPoolExecutor initializer so each worker parses the TTFs once.
 
+    Args:
+        title_text: Project title for title block
+        layout_config: Layout configuration (colors, fonts, etc.)
+        run_id: Run identifier for logging
+    """
+    global _pro_frame_ctx
+    from PIL import Image, ImageDraw, ImageFont
 
-def _hex_to_rgb(hex_color: str) -> tuple[int, int, int]:
-    """Convert hex color to RGB tuple."""
-    hex_color = hex_color.lstrip('#')
-    return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
+    # Title block settings
+    title_bg_color = _hex_to_rgb(layout_config.get("title_bg_color", "#323296"))
+    title_font_size = layout_config.get("title_font_size", 100)
+    subtitle_font_size = layout_config.get("subtitle_font_size", 80)
 
+    # Load fonts
+    title_font_id = layout_config.get("title_font", "AppleGothic")
+    subtitle_font_id = layout_config.get("subtitle_font", "AppleGothic")
+    title_font_path = get_font_path(title_font_id)
+    subtitle_font_path = get_font_path(subtitle_font_id)
 
-def _wrap_text(text: str, font, max_width: int) -> list[str]:
-    """Wrap text to fit within max_width."""
-    from PIL import ImageFont
-    lines = []
-    words = text.split()
-    current_line = []
+    try:
+        title_font = load_font(title_font_path, title_font_size)
+        subtitle_font = load_font(subtitle_font_path, subtitle_font_size)
+    except Exception as e:
+        logger.warning(f"[{run_id}] Font load error: {e}, using default")
+        title_font = ImageFont.load_default()
+        subtitle_font = ImageFont.load_default()
 
-    for word in words:
-        test_line = ' '.join(current_line + [word])
-        bbox = font.getbbox(test_line)
-        text_width = bbox[2] - bbox[0]
+    # Base frame (white bg + title block) is identical for every scene: draw it once
+    base_frame = Image.new('RGB', (PRO_FRAME_WIDTH, PRO_FRAME_HEIGHT), (255, 255, 255))
+    draw = ImageDraw.Draw(base_frame)
+
+    # Calculate title block height
+    title_block_height = 0
+    if title_text:
+        line_height = int(title_font_size * 1.3)
+        padding = 40
+        title_lines = layout_text(
+            title_text, title_font, int(PRO_FRAME_WIDTH * 0.9), PRO_FRAME_WIDTH, padding, line_height
+        )
+        title_block_height = len(title_lines) * line_height + padding * 2
 
-        if text_width <= max_width:
-            current_line.append(word)
-        else:
-            if current_line:
-                lines.append(' '.join(current_line))
-            current_line = [word]
+        # Draw title background
+        draw.rectangle([(0, 0), (PRO_FRAME_WIDTH, title_block_height)], fill=title_bg_color)
+
+        # Draw title text (centered)
+        for line, x_centered, line_y in title_lines:
+            _draw_text_with_stroke(draw, line, (x_centered, line_y), title_font,
+                                   fill_color=(255, 255, 255), stroke_color=(0, 0, 0), stroke_width=3)
+
+    # Video area starts at bottom (1080px height)
+    video_area_top = PRO_FRAME_HEIGHT - PRO_VIDEO_SIZE  # 1920 - 1080 = 840
+
+    # Subtitle area: between title block and video area
+    subtitle_area_top = title_block_height
+    subtitle_area_height = video_area_top - title_block_height
+    subtitle_line_height = int(subtitle_font_size * 1.3)
+
+    _pro_frame_ctx = {
+        "base_frame": base_frame,
+        "subtitle_font": subtitle_font,
+        "subtitle_area_top": subtitle_area_top,
+        "subtitle_area_height": subtitle_area_height,
+        "subtitle_line_height": subtitle_line_height,
+    }
+
+
+def _pro_subtitle_layout(subtitle_text: str) -> list[tuple[str, int, int]]:
+    """
+    Wrap and position a scene subtitle in the subtitle area (needs _init_pro_frame_renderer).
+
+    Args:
+        subtitle_text: Scene subtitle
+
+    Returns:
+        List of (line, x, y) draw positions
+    """
+    ctx = _pro_frame_ctx
+    # Center horizontally and vertically in subtitle area
+    return layout_text(
+        subtitle_text, ctx["subtitle_font"], int(PRO_FRAME_WIDTH * 0.9), PRO_FRAME_WIDTH,
+        ctx["subtitle_area_top"], ctx["subtitle_line_height"], area_height=ctx["subtitle_area_height"]
+    )
+
+
+# Paths interpolated into FFmpeg filter options unquoted: no ':', ',', quotes, brackets or spaces
+_FILTER_SAFE_PATH = re.compile(r"^[\w./\-]+$")
+
+
+def _drawtext_font_file(font_id: str) -> str | None:
+    """
+    Resolve a font id to a TTF/OTF file FFmpeg drawtext can load.
+
+    System font names (e.g. "AppleGothic") are only resolvable by PIL, so
+    they return None and the caller keeps the PIL subtitle path.
+
+    Args:
+        font_id: Font identifier from layout_config
+
+    Returns:
+        Absolute font file path, or None
+    """
+    font_path = Path(get_font_path(font_id))
+    if not font_path.is_file():
+        return None
+    font_file = str(font_path.resolve())
+    return font_file if _FILTER_SAFE_PATH.match(font_file) else None
+
+
+def _subtitle_drawtext_chain(subtitle_text: str, font_file: str, text_dir: Path, subtitle_idx: int) -> str:
+    """
+    Build drawtext filters for one scene subtitle, matching the PIL layout.
+
+    Line breaks and positions come from _pro_subtitle_layout. Each line's text
+    goes through a textfile (with expansion off), so subtitles need no
+    filtergraph escaping.
+
+    Args:
+        subtitle_text: Scene subtitle
+        font_file: Font file for drawtext
+        text_dir: Directory for the per-line text files
+        subtitle_idx: Unique subtitle index (names the text files)
 
-    if current_line:
-        lines.append(' '.join(current_line))
+    Returns:
+        Comma-joined drawtext filter chain
+    """
+    font_size = _pro_frame_ctx["subtitle_font"].size
+    filters = []
+    for line_no, (line, x, y) in enumerate(_pro_subtitle_layout(subtitle_text)):
+        text_file = text_dir / f"sub{subtitle_idx}_line{line_no}.txt"
+        text_file.write_text(line, encoding="utf-8")
+        filters.append(
+            f"drawtext=fontfile={font_file}:textfile={text_file}:expansion=none:"
+            f"fontsize={font_size}:fontcolor=black:bordercolor=white:borderw=2:x={x}:y={y}"
+        )
+    return ",".join(filters)
+
+
+def _render_pro_scene_frame(subtitle_text: str) -> bytes:
+    """
+    Render one scene frame (base frame + centered subtitle).
+
+    Args:
+        subtitle_text: Scene subtitle
+
+    Returns:
+        Raw RGB24 pixels (PRO_FRAME_WIDTH x PRO_FRAME_HEIGHT)
+    """
+    from PIL import ImageDraw
+
+    ctx = _pro_frame_ctx
+    subtitle_font = ctx["subtitle_font"]
+    frame_img = ctx["base_frame"].copy()
+    draw = ImageDraw.Draw(frame_img)
+
+    # Draw subtitle (centered in subtitle area)
+    if subtitle_text:
+        for line, x_centered, line_y in _pro_subtitle_layout(subtitle_text):
+            _draw_text_with_stroke(draw, line, (x_centered, line_y), subtitle_font,
+                                   fill_color=(0, 0, 0), stroke_color=(255, 255, 255), stroke_width=2)
+
+    return frame_img.tobytes()
+
+
+def _render_pro_frames(run_id: str, subtitles: list, title_text: str, layout_config: dict) -> list[bytes]:
+    """
+    Render all Pro mode scene frames, in parallel processes when there is more than one.
 
-    return lines if lines else [text]
+    Falls back to in-process rendering when a process pool can't be used
+    (e.g. inside a daemonic prefork worker).
+
+    Args:
+        run_id: Run identifier
+        subtitles: Subtitle text per scene
+        title_text: Project title for title block
+        layout_config: Layout configuration (colors, fonts, etc.)
+
+    Returns:
+        Raw RGB24 frame per scene, in scene order
+    """
+    max_workers = min(os.cpu_count() or 1, len(subtitles))
+    if max_workers > 1:
+        try:
+            # spawn: don't fork the worker's gevent hub / Celery state into the children
+            with ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_pro_frame_renderer,
+                initargs=(title_text, layout_config, run_id),
+            ) as executor:
+                frames = list(executor.map(_render_pro_scene_frame, subtitles))
+            logger.info(f"[{run_id}]   ✓ {len(frames)} frames created ({max_workers} processes)")
+            return frames
+        except Exception as e:
+            logger.warning(f"[{run_id}] Parallel frame rendering unavailable ({e}), rendering in-process")
+
+    _init_pro_frame_renderer(title_text, layout_config, run_id)
+    frames = [_render_pro_scene_frame(subtitle_text) for subtitle_text in subtitles]
+    logger.info(f"[{run_id}]   ✓ {len(frames)} frames created")
+    return frames
+
+
+@functools.lru_cache(maxsize=32)
+def _hex_to_rgb(hex_color: str) -> tuple[int, int, int]:
+    """Convert hex color to RGB tuple."""
+    rgb = bytes.fromhex(hex_color.lstrip('#'))
+    return (rgb[0], rgb[1], rgb[2])
 
 
 def _draw_text_with_stroke(
@@ -1044,13 +1355,6 @@ def _draw_text_with_stroke(
     stroke_width: int = 3
 ):
     """Draw text with stroke (outline)."""
-    x, y = position
-
-    # Draw stroke
-    for offset_x in range(-stroke_width, stroke_width + 1):
-        for offset_y in range(-stroke_width, stroke_width + 1):
-            if offset_x != 0 or offset_y != 0:
-                draw.text((x + offset_x, y + offset_y), text, font=font, fill=stroke_color)
-
-    # Draw main text
-    draw.text((x, y), text, font=font, fill=fill_color)
+    # Pillow rasterizes glyph + outline in one pass (no per-offset redraws)
+    draw.text(position, text, font=font, fill=fill_color,
+              stroke_width=stroke_width, stroke_fill=stroke_color)
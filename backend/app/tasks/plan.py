@@ -2,23 +2,37 @@
 기획자 Agent: Plot planning task.
 Generates CSV from prompt, converts to JSON, and triggers asset generation.
 """
+import hashlib
 import logging
 import json
+import os
+import shutil
 from pathlib import Path
 from celery import chord, group
 from celery.exceptions import Retry
-from typing import List
+from typing import List, Optional, Tuple
+
+import orjson
 
 from app.celery_app import celery
+from app.config import settings
 from app.orchestrator.fsm import RunState, get_fsm
 from app.utils.plot_generator import generate_plot_with_characters, generate_plot_pro_mode
 from app.utils.json_converter import convert_plot_to_json
-from app.utils.progress import publish_progress
+from app.utils.json_io import read_json
+from app.utils.progress import ProgressBatch, publish_progress
 
 logger = logging.getLogger(__name__)
 
 
-def _validate_plot_json(run_id: str, plot_json_path: Path, layout_json_path: Path, characters_path: Path, spec: dict) -> List[str]:
+def _validate_plot_json(
+    run_id: str,
+    plot_json_path: Path,
+    layout_json_path: Path,
+    characters_path: Path,
+    spec: dict,
+    plot_data: dict = None
+) -> List[str]:
     """
     Validate plot.json, characters.json, and layout.json structure.
 
@@ -28,6 +42,7 @@ def _validate_plot_json(run_id: str, plot_json_path: Path, layout_json_path: Pat
         layout_json_path: Path to layout.json
         characters_path: Path to characters.json
         spec: RunSpec dict
+        plot_data: Already-loaded contents of plot.json (skips re-reading the file)
 
     Returns:
         List of validation error messages (empty if valid)
@@ -36,18 +51,16 @@ def _validate_plot_json(run_id: str, plot_json_path: Path, layout_json_path: Pat
 
     try:
         # Load plot.json
-        with open(plot_json_path, "r", encoding="utf-8") as f:
-            plot_data = json.load(f)
+        if plot_data is None:
+            plot_data = read_json(plot_json_path)
 
         # Load layout.json
-        with open(layout_json_path, "r", encoding="utf-8") as f:
-            layout_data = json.load(f)
+        layout_data = read_json(layout_json_path)
 
         # Load characters.json
         characters_data = {}
         if characters_path.exists():
-            with open(characters_path, "r", encoding="utf-8") as f:
-                characters_data = json.load(f)
+            characters_data = read_json(characters_path)
 
         mode = spec.get("mode", "general")
         num_cuts = spec.get("num_cuts", 3)
@@ -187,7 +200,7 @@ def _validate_plot_json(run_id: str, plot_json_path: Path, layout_json_path: Pat
         logger.info(f"[{run_id}] Validation completed: {len(errors)} errors found")
         return errors
 
-    except json.JSONDecodeError as e:
+    except json.JSONDecodeError as e:  # orjson.JSONDecodeError subclasses it
         errors.append(f"JSON 파싱 실패: {e}")
         return errors
     except Exception as e:
@@ -195,8 +208,65 @@ def _validate_plot_json(run_id: str, plot_json_path: Path, layout_json_path: Pat
         return errors
 
 
+# Spec fields that determine the generated plot (art style, music etc. only affect layout.json)
+PLAN_CACHE_SPEC_KEYS = (
+    "prompt", "mode", "num_characters", "num_cuts", "characters", "narrative_tone", "plot_structure"
+)
+PLAN_CACHE_FILES = ("plot.json", "characters.json")
+
+
+def _plan_cache_key(spec: dict) -> str:
+    """Hash the plot-relevant part of a RunSpec."""
+    payload = orjson.dumps(
+        {key: spec.get(key) for key in PLAN_CACHE_SPEC_KEYS},
+        option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+    )
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+def _restore_cached_plan(run_id: str, cache_key: str) -> Optional[Tuple[Path, Path]]:
+    """
+    Copy cached plot.json / characters.json into the run directory.
+
+    Files are copied (not linked) because later stages rewrite them per run.
+
+    Args:
+        run_id: Run identifier
+        cache_key: Key from _plan_cache_key
+
+    Returns:
+        (characters_path, plot_json_path) on a cache hit, None otherwise
+    """
+    cache_dir = Path(settings.PLAN_CACHE_DIR) / cache_key
+    if not all((cache_dir / name).is_file() for name in PLAN_CACHE_FILES):
+        return None
+
+    output_dir = Path(f"app/data/outputs/{run_id}")
+    output_dir.mkdir(parents=True, exist_ok=True)
+    try:
+        for name in PLAN_CACHE_FILES:
+            shutil.copyfile(cache_dir / name, output_dir / name)
+    except OSError as e:
+        logger.warning(f"[{run_id}] Plan cache restore failed, regenerating: {e}")
+        return None
+    return output_dir / "characters.json", output_dir / "plot.json"
+
+
+def _store_plan_in_cache(run_id: str, cache_key: str, characters_path: Path, plot_json_path: Path) -> None:
+    """Publish a validated plot/characters pair into the plan cache (best effort, atomic per file)."""
+    cache_dir = Path(settings.PLAN_CACHE_DIR) / cache_key
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        for src, name in ((plot_json_path, "plot.json"), (characters_path, "characters.json")):
+            tmp_path = cache_dir / f".{name}.{run_id}.tmp"
+            shutil.copyfile(src, tmp_path)
+            os.replace(tmp_path, cache_dir / name)
+    except OSError as e:
+        logger.warning(f"[{run_id}] Could not store plan in cache: {e}")
+
+
 @celery.task(bind=True, name="tasks.plan")
-def plan_task(self, run_id: str, spec: dict):
+def plan_task(self, run_id: str, spec: dict, use_plan_cache: bool = True):
     """
     Generate plot and structure from prompt.
 
@@ -209,15 +279,12 @@ def plan_task(self, run_id: str, spec: dict):
     Args:
         run_id: Run identifier
         spec: RunSpec as dict
+        use_plan_cache: Reuse a cached plot for identical inputs (off for explicit regeneration)
     """
     logger.info(f"[{run_id}] Starting plot generation...")
     publish_progress(run_id, state="PLOT_GENERATION", progress=0.1, log="기획자: 시나리오 작성 중...")
 
     try:
-        # TEST: 3초 대기
-        import time
-        time.sleep(3)
-
         # Get FSM (from Redis if needed)
         fsm = get_fsm(run_id)
         if not fsm:
@@ -226,7 +293,15 @@ def plan_task(self, run_id: str, spec: dict):
         # Step 1: Generate characters and plot
         mode = spec.get("mode", "general")
 
-        if mode == "pro":
+        plan_cache_key = _plan_cache_key(spec) if settings.PLAN_CACHE_DIR and use_plan_cache else None
+        cached_plan = _restore_cached_plan(run_id, plan_cache_key) if plan_cache_key else None
+
+        if cached_plan:
+            # Identical inputs were planned before: skip the LLM call
+            characters_path, plot_json_path = cached_plan
+            logger.info(f"[{run_id}] Plan cache hit ({plan_cache_key}), reusing plot.json and characters.json")
+            publish_progress(run_id, progress=0.15, log="기획자: 동일한 입력의 시나리오 재사용")
+        elif mode == "pro":
             # Pro Mode: Use specialized plot generator with start/end frames
             logger.info(f"[{run_id}] [PRO MODE] Generating Pro mode plot with start/end frames...")
             publish_progress(run_id, progress=0.12, log="기획자: Pro 모드 시나리오 생성 중 (Gemini 2.5 Flash)...")
@@ -258,11 +333,17 @@ def plan_task(self, run_id: str, spec: dict):
             logger.info(f"[{run_id}] Plot JSON generated: {plot_json_path}")
             publish_progress(run_id, progress=0.15, log=f"기획자: 캐릭터 & 시나리오 생성 완료")
 
+        # plot.json is parsed once here and reused by conversion, validation and the review CSV
+        plot_data = read_json(plot_json_path)
+
+        # Back-to-back milestones (no work in between) are queued here and sent together
+        progress_batch = ProgressBatch(run_id)
+
         # Step 2: Convert plot.json to layout.json (skip for Pro mode)
         if mode == "pro":
             # Pro mode: Use plot.json directly, no layout.json conversion needed
             logger.info(f"[{run_id}] [PRO MODE] Skipping layout.json conversion (using plot.json directly)")
-            publish_progress(run_id, progress=0.2, log="기획자: Pro 모드 - plot.json 직접 사용")
+            progress_batch.add(progress=0.2, log="기획자: Pro 모드 - plot.json 직접 사용")
             json_path = plot_json_path  # Use plot.json as the main JSON
         else:
             # General mode: Convert plot.json to layout.json
@@ -275,7 +356,8 @@ def plan_task(self, run_id: str, spec: dict):
                 music_genre=spec.get("music_genre", "ambient"),
                 video_title=spec.get("video_title"),
                 layout_config=spec.get("layout_config"),
-                review_mode=spec.get("review_mode", False)
+                review_mode=spec.get("review_mode", False),
+                plot_data=plot_data
             )
             logger.info(f"[{run_id}] Layout JSON generated: {json_path}")
             publish_progress(run_id, progress=0.2, log=f"기획자: 레이아웃 JSON 생성 완료")
@@ -284,12 +366,14 @@ def plan_task(self, run_id: str, spec: dict):
         if mode == "pro":
             # Pro mode: Skip validation (different JSON structure)
             logger.info(f"[{run_id}] [PRO MODE] Skipping JSON validation (Pro mode uses different structure)")
-            publish_progress(run_id, progress=0.22, log="✓ Pro 모드 JSON 검증 생략")
+            progress_batch.add(progress=0.22, log="✓ Pro 모드 JSON 검증 생략")
             validation_errors = []
         else:
             logger.info(f"[{run_id}] Validating plot, characters, and layout JSON...")
             publish_progress(run_id, progress=0.21, log="기획자: JSON 검증 중...")
-            validation_errors = _validate_plot_json(run_id, plot_json_path, json_path, characters_path, spec)
+            validation_errors = _validate_plot_json(
+                run_id, plot_json_path, json_path, characters_path, spec, plot_data=plot_data
+            )
 
         if validation_errors:
             # Check retry count from FSM metadata (persistent across Celery retries)
@@ -326,41 +410,37 @@ def plan_task(self, run_id: str, spec: dict):
                 raise ValueError(error_msg)
 
         logger.info(f"[{run_id}] ✓ JSON validation passed")
-        publish_progress(run_id, progress=0.22, log="✓ JSON 검증 완료")
 
-        # Update FSM artifacts
-        from app.main import runs
-        if run_id in runs:
-            runs[run_id]["artifacts"]["characters_path"] = str(characters_path)
-            runs[run_id]["artifacts"]["plot_json_path"] = str(plot_json_path)
-            runs[run_id]["artifacts"]["json_path"] = str(json_path)
-            runs[run_id]["progress"] = 0.22
+        if plan_cache_key and not cached_plan:
+            _store_plan_in_cache(run_id, plan_cache_key, characters_path, plot_json_path)
+
+        # The worker has no view of the API's runs dict: artifacts travel with the
+        # progress message and the API's Redis listener merges them into the run entry
+        progress_batch.add(
+            progress=0.22,
+            log="✓ JSON 검증 완료",
+            artifacts={
+                "characters_path": str(characters_path),
+                "plot_json_path": str(plot_json_path),
+                "json_path": str(json_path),
+            }
+        )
+        progress_batch.flush()
 
         # Step 3: Branch based on review_mode
         if spec.get("review_mode", False):
             # Review mode: Transition to PLOT_REVIEW (user approval needed)
-            publish_progress(run_id, progress=0.22, log="플롯 검수 대기 중...")
+            progress_batch.add(progress=0.22, log="플롯 검수 대기 중...")
             if fsm.transition_to(RunState.PLOT_REVIEW):
                 logger.info(f"[{run_id}] [REVIEW_MODE] Transitioned to PLOT_REVIEW - waiting for user approval")
-                publish_progress(run_id, state="PLOT_REVIEW", progress=0.25, log="✓ 플롯 생성 완료 - 사용자 검수 필요")
-
-                # Update state
-                if run_id in runs:
-                    runs[run_id]["state"] = fsm.current_state.value
-
-                # Load plot.json data
-                import json
-                with open(plot_json_path, 'r', encoding='utf-8') as f:
-                    plot_data = json.load(f)
+                progress_batch.add(state="PLOT_REVIEW", progress=0.25, log="✓ 플롯 생성 완료 - 사용자 검수 필요")
+                progress_batch.flush()
 
                 # Save CSV version of plot for user editing
                 from app.utils.plot_csv_converter import save_plot_csv
                 plot_csv_path = save_plot_csv(run_id, plot_data, mode=spec["mode"])
                 logger.info(f"[{run_id}] Saved plot CSV for user review: {plot_csv_path}")
-
-                # Update artifacts
-                if run_id in runs:
-                    runs[run_id]["artifacts"]["plot_csv_path"] = str(plot_csv_path)
+                publish_progress(run_id, artifacts={"plot_csv_path": str(plot_csv_path)})
 
                 # Wait here - user needs to confirm/edit/regenerate
                 # The workflow will continue via API endpoint (see main.py)
@@ -372,18 +452,16 @@ def plan_task(self, run_id: str, spec: dict):
             else:
                 error_msg = f"Failed to transition to PLOT_REVIEW"
                 logger.error(f"[{run_id}] {error_msg}")
-                publish_progress(run_id, progress=0.22, log=f"❌ 상태 전환 실패")
+                progress_batch.add(progress=0.22, log=f"❌ 상태 전환 실패")
+                progress_batch.flush()
                 raise ValueError(error_msg)
         else:
             # Auto mode: Transition directly to ASSET_GENERATION
-            publish_progress(run_id, progress=0.22, log="에셋 생성 단계로 전환 중...")
+            progress_batch.add(progress=0.22, log="에셋 생성 단계로 전환 중...")
             if fsm.transition_to(RunState.ASSET_GENERATION):
                 logger.info(f"[{run_id}] [AUTO_MODE] Transitioned to ASSET_GENERATION")
-                publish_progress(run_id, state="ASSET_GENERATION", progress=0.25, log="에셋 생성 시작 (디자이너, 작곡가, 성우)")
-
-                # Update state
-                if run_id in runs:
-                    runs[run_id]["state"] = fsm.current_state.value
+                progress_batch.add(state="ASSET_GENERATION", progress=0.25, log="에셋 생성 시작 (디자이너, 작곡가, 성우)")
+                progress_batch.flush()
 
                 # Step 4: Fan-out to asset generation tasks
                 # Convert Path to string for JSON serialization
@@ -429,6 +507,8 @@ def plan_task(self, run_id: str, spec: dict):
 
                     logger.info(f"[{run_id}] Asset generation chord started")
 
+            # Sends the queued "전환 중" message if the transition above failed
+            progress_batch.flush()
             return {
                 "run_id": run_id,
                 "plot_json_path": str(plot_json_path),
@@ -448,10 +528,7 @@ def plan_task(self, run_id: str, spec: dict):
         if fsm := get_fsm(run_id):
             fsm.fail(str(e))
 
-        # Update run state
-        from app.main import runs
-        if run_id in runs:
-            runs[run_id]["state"] = "FAILED"
-            runs[run_id]["logs"].append(f"Planning failed: {e}")
+        # Update run state (via the progress channel, like every other update)
+        publish_progress(run_id, state="FAILED", log=f"Planning failed: {e}")
 
         raise
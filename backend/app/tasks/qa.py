@@ -3,15 +3,60 @@ QA Agent: 품질 검수 및 검증.
 렌더링된 영상의 품질을 확인하고 Pass/Fail 판정.
 """
 import logging
-import json
 from pathlib import Path
+from typing import Dict
 
 from app.celery_app import celery
 from app.orchestrator.fsm import RunState, get_fsm
+from app.state import runs
+from app.utils.json_io import read_json, write_json
 from app.utils.progress import publish_progress
 
 logger = logging.getLogger(__name__)
 
+QA_INPUT_FILENAME = "qa_input.json"
+
+# Scene fields the QA checks actually look at
+_QA_SCENE_KEYS = ("scene_id", "text", "audio_url", "tts_duration_ms", "start_image_url", "end_image_url")
+
+
+def emit_qa_input(layout: Dict, output_dir: Path, video_url: str) -> Path:
+    """
+    Write the trimmed subset of layout/plot JSON that qa_task needs.
+
+    QA only checks required top-level keys, image/BGM paths and the video,
+    so it reads this small file instead of re-parsing the full layout.
+
+    Args:
+        layout: Merged layout.json or plot.json dict
+        output_dir: Run output directory
+        video_url: Frontend URL of the rendered video
+
+    Returns:
+        Path to the written qa_input.json
+    """
+    scenes = []
+    for scene in layout.get("scenes", []):
+        qa_scene = {key: scene[key] for key in _QA_SCENE_KEYS if key in scene}
+        if "images" in scene:
+            qa_scene["images"] = [{"image_url": slot.get("image_url")} for slot in scene["images"]]
+        scenes.append(qa_scene)
+
+    qa_input = {
+        "mode": layout.get("mode", "general"),
+        "scenes": scenes,
+        "global_bgm": layout.get("global_bgm"),
+        "bgm_url": layout.get("bgm_url"),
+        "video_url": video_url,
+    }
+    if "timeline" in layout:
+        # Only the key's presence is validated
+        qa_input["timeline"] = {}
+
+    qa_input_path = Path(output_dir) / QA_INPUT_FILENAME
+    write_json(qa_input_path, qa_input)
+    return qa_input_path
+
 
 @celery.task(bind=True, name="tasks.qa")
 def qa_task(self, run_id: str, json_path: str, video_path: str):
@@ -27,7 +72,7 @@ def qa_task(self, run_id: str, json_path: str, video_path: str):
 
     Args:
         run_id: Run identifier
-        json_path: Path to JSON layout
+        json_path: Path to QA input JSON (qa_input.json, or a full layout/plot JSON)
         video_path: Path to rendered video
 
     Returns:
@@ -36,20 +81,14 @@ def qa_task(self, run_id: str, json_path: str, video_path: str):
     logger.info(f"[{run_id}] QA: Starting quality check...")
     publish_progress(run_id, state="QA", progress=0.85, log="QA: 품질 검수 시작...")
 
-    # TEST: 3초 대기
-    import time
-    time.sleep(3)
-
     try:
         # Get FSM
-        from app.orchestrator.fsm import get_fsm
         fsm = get_fsm(run_id)
         if not fsm:
             raise ValueError(f"FSM not found for run {run_id}")
 
-        # Load JSON layout
-        with open(json_path, "r", encoding="utf-8") as f:
-            layout = json.load(f)
+        # Load JSON layout (trimmed qa_input.json from the director)
+        layout = read_json(json_path)
 
         qa_results = {
             "checks": [],
@@ -212,11 +251,12 @@ def qa_task(self, run_id: str, json_path: str, video_path: str):
                     log="QA 실패 - 플롯부터 재생성 시작..."
                 )
 
-                from app.main import runs
-                if run_id in runs:
-                    runs[run_id]["state"] = fsm.current_state.value
-                    runs[run_id]["progress"] = 0.0
-                    runs[run_id]["artifacts"]["qa_retry_count"] = runs[run_id]["artifacts"].get("qa_retry_count", 0) + 1
+                run_entry = runs.get(run_id)
+                if run_entry is not None:
+                    run_entry["state"] = fsm.current_state.value
+                    run_entry["progress"] = 0.0
+                    artifacts = run_entry["artifacts"]
+                    artifacts["qa_retry_count"] = artifacts.get("qa_retry_count", 0) + 1
 
                 # TODO: Trigger plan task again
                 # from app.tasks.plan import plan_task
@@ -3,7 +3,9 @@ Recovery task: Handles retries and fallback strategies.
 """
 import logging
 from app.celery_app import celery
+from app.config import settings
 from app.orchestrator.fsm import RunState, get_fsm
+from app.state import runs
 
 logger = logging.getLogger(__name__)
 
@@ -53,7 +55,6 @@ def recover_task(self, run_id: str, failed_state: str, error_message: str):
         # Apply fallback strategies based on failed state
         if "TTS" in error_message or "voice" in error_message.lower():
             # Switch TTS provider
-            from app.config import settings
             if settings.TTS_PROVIDER == "elevenlabs":
                 logger.info(f"[{run_id}] Switching TTS provider to playht")
                 settings.TTS_PROVIDER = "playht"
@@ -73,7 +74,6 @@ def recover_task(self, run_id: str, failed_state: str, error_message: str):
         # Re-trigger the failed task
         if retry_state == RunState.PLOT_GENERATION:
             from app.tasks.plan import plan_task
-            from app.main import runs
             spec = runs.get(run_id, {}).get("spec", {})
             plan_task.apply_async(args=[run_id, spec])
 
@@ -2,12 +2,13 @@
 성우 Agent: TTS/voice generation.
 """
 import logging
-import json
 from pathlib import Path
 
 from app.celery_app import celery
 from app.config import settings
-from app.utils.progress import publish_progress
+from app.state import runs
+from app.utils.progress import ProgressDebouncer, publish_progress
+from app.utils.json_io import read_json, write_json
 
 logger = logging.getLogger(__name__)
 
@@ -34,14 +35,9 @@ def voice_task(self, run_id: str, json_path: str, spec: dict):
         logger.warning(f"[{run_id}] 🧪 STUB TTS MODE: Skipping ElevenLabs/PlayHT API calls")
         publish_progress(run_id, progress=0.57, log="🧪 테스트: 더미 음성 사용 (API 생략)")
 
-    # TEST: 3초 대기
-    import time
-    time.sleep(3)
-
     try:
         # Load JSON
-        with open(json_path, "r", encoding="utf-8") as f:
-            layout = json.load(f)
+        layout = read_json(json_path)
 
         # Get TTS provider (stub mode bypasses all providers)
         if stub_mode:
@@ -78,16 +74,14 @@ def voice_task(self, run_id: str, json_path: str, spec: dict):
             voices_path = Path("voices.json")
 
         if voices_path.exists():
-            with open(voices_path, "r", encoding="utf-8") as f:
-                voices_config = json.load(f)
+            voices_config = read_json(voices_path)
             logger.info(f"[{run_id}] Loaded {voices_path} for voice matching")
 
         # Load characters.json for gender/personality info
         characters_json_path = Path(json_path).parent / "characters.json"
         characters_data = {}
         if characters_json_path.exists():
-            with open(characters_json_path, "r", encoding="utf-8") as f:
-                characters_data = json.load(f)
+            characters_data = read_json(characters_json_path)
             logger.info(f"[{run_id}] Loaded characters.json for voice matching")
 
         # Map characters to voice IDs
@@ -191,8 +185,9 @@ def voice_task(self, run_id: str, json_path: str, spec: dict):
                     logger.warning(f"[{run_id}] Failed to measure audio duration: {e}, using default")
                     audio_duration_ms = None
 
-                # Update JSON
+                # Update JSON (duration is kept so the renderer doesn't have to ffprobe it)
                 text_line["audio_url"] = str(audio_path)
+                text_line["audio_duration_ms"] = audio_duration_ms
 
                 voice_results.append({
                     "scene_id": scene_id,
@@ -203,20 +198,21 @@ def voice_task(self, run_id: str, json_path: str, spec: dict):
 
                 logger.info(f"[{run_id}] Generated: {audio_path}")
 
+        # Longest TTS per scene, grouped in one pass (no per-scene scan over all results)
+        max_audio_by_scene = {}
+        for result in voice_results:
+            duration_ms = result["audio_duration_ms"]
+            if duration_ms is not None:
+                scene_id = result["scene_id"]
+                max_audio_by_scene[scene_id] = max(duration_ms, max_audio_by_scene.get(scene_id, 0))
+
         # Update scene durations based on TTS lengths
         for scene in layout.get("scenes", []):
             scene_id = scene["scene_id"]
 
-            # Find all audio durations for this scene
-            scene_audio_durations = [
-                result["audio_duration_ms"]
-                for result in voice_results
-                if result["scene_id"] == scene_id and result["audio_duration_ms"] is not None
-            ]
-
-            if scene_audio_durations:
+            max_audio_duration = max_audio_by_scene.get(scene_id)
+            if max_audio_duration is not None:
                 # Use the longest audio duration for the scene, plus 50ms padding
-                max_audio_duration = max(scene_audio_durations)
                 new_duration = max_audio_duration + 50  # Add 50ms padding (minimal pause)
                 old_duration = scene.get("duration_ms", 5000)
 
@@ -226,16 +222,15 @@ def voice_task(self, run_id: str, json_path: str, spec: dict):
                 logger.warning(f"[{run_id}] ⚠️ No audio duration found for {scene_id}, keeping original duration: {scene.get('duration_ms', 5000)}ms")
 
         # Save updated JSON
-        with open(json_path, "w", encoding="utf-8") as f:
-            json.dump(layout, f, indent=2, ensure_ascii=False)
+        write_json(json_path, layout)
 
         logger.info(f"[{run_id}] Voice: Completed {len(voice_results)} lines")
         publish_progress(run_id, progress=0.65, log=f"성우: 모든 음성 합성 완료 ({len(voice_results)}개)")
 
         # Update progress
-        from app.main import runs
-        if run_id in runs:
-            runs[run_id]["artifacts"]["voice"] = voice_results
+        run_entry = runs.get(run_id)
+        if run_entry is not None:
+            run_entry["artifacts"]["voice"] = voice_results
 
         return {
             "run_id": run_id,
@@ -275,10 +270,12 @@ def voice_task_pro(self, run_id: str, json_path: str, spec: dict):
     if stub_mode:
         logger.warning(f"[{run_id}] 🧪 STUB TTS MODE: Skipping API calls")
 
+    # Per-scene updates arrive in bursts (stub TTS): coalesce them
+    progress_debouncer = ProgressDebouncer()
+
     try:
         # Load plot.json
-        with open(json_path, "r", encoding="utf-8") as f:
-            plot = json.load(f)
+        plot = read_json(json_path)
 
         # Get TTS client
         if stub_mode:
@@ -315,8 +312,7 @@ def voice_task_pro(self, run_id: str, json_path: str, spec: dict):
         # Load characters.json for voice_id lookup
         characters_json_path = output_dir / "characters.json"
         if characters_json_path.exists():
-            with open(characters_json_path, "r", encoding="utf-8") as f:
-                characters_data = json.load(f)
+            characters_data = read_json(characters_json_path)
             for char in characters_data.get("characters", []):
                 if "voice_id" in char:
                     char_voices[char["char_id"]] = char["voice_id"]
@@ -393,13 +389,13 @@ def voice_task_pro(self, run_id: str, json_path: str, spec: dict):
             })
 
             progress = 0.55 + (0.1 * (idx + 1) / len(scenes))
-            publish_progress(run_id, progress=progress, log=f"성우: {scene_id} 음성 생성 완료 ({audio_duration_ms}ms)")
+            progress_debouncer.schedule(run_id, progress=progress, log=f"성우: {scene_id} 음성 생성 완료 ({audio_duration_ms}ms)")
 
         # Save updated plot.json with audio URLs and durations
-        with open(json_path, "w", encoding="utf-8") as f:
-            json.dump(plot, f, indent=2, ensure_ascii=False)
+        write_json(json_path, plot)
 
         logger.info(f"[{run_id}] Voice Pro: Completed {len(voice_results)} lines")
+        progress_debouncer.flush()
         publish_progress(run_id, progress=0.65, log=f"성우: Pro 모드 음성 합성 완료 ({len(voice_results)}개)")
 
         return {
@@ -410,5 +406,6 @@ def voice_task_pro(self, run_id: str, json_path: str, spec: dict):
         }
 
     except Exception as e:
+        progress_debouncer.flush()
         logger.error(f"[{run_id}] Voice Pro task failed: {e}", exc_info=True)
         raise
@@ -1,12 +1,14 @@
 """
 JWT token creation and verification.
 """
-from datetime import datetime, timedelta
-from jose import jwt, JWTError
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from jose import jwk, jwt, JWTError
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
 from app.config import settings
 from app.database import get_db
 from app.models.user import User
@@ -14,6 +16,17 @@ from app.models.user import User
 # HTTPBearer scheme for extracting JWT from Authorization header
 security = HTTPBearer()
 
+# Signing key and allowed algorithms are built once instead of per encode/decode call
+_JWT_KEY = jwk.construct(settings.JWT_SECRET_KEY, settings.JWT_ALGORITHM)
+_JWT_ALGORITHMS = [settings.JWT_ALGORITHM]
+_ACCESS_TOKEN_EXPIRE_SECONDS = settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+
+# Decoded payloads of recently verified tokens: token -> (payload, exp timestamp).
+# Every authenticated request re-sends the same token, so a hit skips the HMAC check.
+TOKEN_CACHE_MAXSIZE = 10_000
+_token_cache: "OrderedDict[str, tuple[dict, float]]" = OrderedDict()
+_token_cache_lock = threading.Lock()
+
 
 def create_access_token(user_id: str, username: str) -> str:
     """
@@ -26,13 +39,14 @@ def create_access_token(user_id: str, username: str) -> str:
     Returns:
         Encoded JWT token
     """
-    expire = datetime.utcnow() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+    # exp as a Unix timestamp (what jose would convert a datetime to anyway)
+    expire = int(time.time()) + _ACCESS_TOKEN_EXPIRE_SECONDS
     payload = {
         "sub": user_id,  # Subject (user ID)
         "username": username,
         "exp": expire  # Expiration time
     }
-    return jwt.encode(payload, settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM)
+    return jwt.encode(payload, _JWT_KEY, algorithm=settings.JWT_ALGORITHM)
 
 
 def verify_token(token: str) -> dict | None:
@@ -45,12 +59,51 @@ def verify_token(token: str) -> dict | None:
     Returns:
         Decoded payload dict or None if invalid
     """
+    now = time.time()
+    with _token_cache_lock:
+        cached = _token_cache.get(token)
+        if cached is not None:
+            payload, expires_at = cached
+            if expires_at > now:
+                _token_cache.move_to_end(token)
+                return dict(payload)
+            del _token_cache[token]
+
     try:
-        payload = jwt.decode(token, settings.JWT_SECRET_KEY, algorithms=[settings.JWT_ALGORITHM])
-        return payload
+        payload = jwt.decode(token, _JWT_KEY, algorithms=_JWT_ALGORITHMS)
     except JWTError:
         return None
 
+    # Only tokens with an exp claim are cached, and only until they expire
+    expires_at = payload.get("exp")
+    if isinstance(expires_at, (int, float)):
+        with _token_cache_lock:
+            _token_cache[token] = (payload, float(expires_at))
+            if len(_token_cache) > TOKEN_CACHE_MAXSIZE:
+                _token_cache.popitem(last=False)
+    return dict(payload)
+
+
+async def _get_user(db: AsyncSession, user_id: str) -> User | None:
+    """
+    Load a user by primary key.
+
+    db.get checks the session's identity map first, so a user already loaded
+    in this request's session costs no second SELECT.
+
+    Args:
+        db: Database session
+        user_id: User UUID as string (JWT "sub" claim)
+
+    Returns:
+        User object or None if not found / malformed id
+    """
+    try:
+        user_uuid = uuid.UUID(str(user_id))
+    except ValueError:
+        return None
+    return await db.get(User, user_uuid)
+
 
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
@@ -88,8 +141,7 @@ async def get_current_user(
         )
 
     # Fetch user from database
-    result = await db.execute(select(User).where(User.id == user_id))
-    user = result.scalars().first()
+    user = await _get_user(db, user_id)
 
     if user is None:
         raise HTTPException(
@@ -130,7 +182,6 @@ async def get_optional_current_user(
         return None
 
     # Fetch user from database
-    result = await db.execute(select(User).where(User.id == user_id))
-    user = result.scalars().first()
+    user = await _get_user(db, user_id)
 
     return user
@@ -10,21 +10,300 @@ Performance benefits over MoviePy:
 - Lower memory usage (no Python video objects in memory)
 - More reliable for long videos
 """
+import functools
 import logging
+import multiprocessing
+import os
 import subprocess
 import json
+import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Tuple, Optional
+from typing import Callable, Iterable, List, Dict, Tuple, Optional
 from PIL import Image, ImageDraw, ImageFont
-import numpy as np
+
+from app.utils.fonts import get_font_path, layout_text, load_font
 
 logger = logging.getLogger(__name__)
 
+# The general-mode video is a slideshow of static frames: B-frames, extra reference
+# frames and a long lookahead buy nothing there, so skip them (CRF is unchanged)
+STILL_FRAME_X264_PARAMS = "ref=1:bframes=0:rc-lookahead=10:subme=2:me=dia:trellis=0"
+
+# Hardware H.264 encoders tried by auto-detection, in order of preference
+HW_ENCODERS = ("h264_nvenc", "h264_videotoolbox", "h264_qsv")
+
+
+@functools.lru_cache(maxsize=1)
+def detect_video_encoder() -> str:
+    """
+    Resolve the H.264 encoder to use (once per process).
+
+    Honors settings.FFMPEG_HW_ENCODER; in "auto" mode, a hardware encoder is
+    used only if FFmpeg lists it and a tiny test encode succeeds (NVENC is
+    often compiled in without a usable GPU).
+
+    Returns:
+        Encoder name (e.g. "h264_nvenc", "h264_qsv" or "libx264")
+    """
+    from app.config import settings
+
+    configured = (settings.FFMPEG_HW_ENCODER or "none").strip().lower()
+    if configured == "none":
+        return "libx264"
+    if configured != "auto":
+        return configured
+
+    try:
+        result = subprocess.run(
+            ["ffmpeg", "-hide_banner", "-encoders"],
+            capture_output=True, text=True, timeout=10
+        )
+        available = result.stdout
+    except Exception as e:
+        logger.warning(f"FFmpeg encoder detection failed: {e}, using libx264")
+        return "libx264"
+
+    for encoder in HW_ENCODERS:
+        if encoder not in available:
+            continue
+        try:
+            probe = subprocess.run(
+                ["ffmpeg", "-hide_banner", "-v", "error",
+                 "-f", "lavfi", "-i", "color=c=black:s=256x256:d=0.1",
+                 "-c:v", encoder, "-f", "null", "-"],
+                capture_output=True, text=True, timeout=20
+            )
+        except Exception:
+            continue
+        if probe.returncode == 0:
+            logger.info(f"Using hardware video encoder: {encoder}")
+            return encoder
+
+    logger.info("No usable hardware video encoder, using libx264")
+    return "libx264"
+
+
+@functools.lru_cache(maxsize=1)
+def detect_hwaccel() -> Optional[str]:
+    """
+    Resolve the FFmpeg hwaccel for decoding video inputs (once per process).
+
+    Honors settings.FFMPEG_HWACCEL; "auto" picks CUDA only when the NVENC
+    encoder passed its test encode (i.e. a usable NVIDIA GPU is present).
+    The name must also appear in `ffmpeg -hwaccels`.
+
+    Returns:
+        Hwaccel name (e.g. "cuda"), or None for CPU decoding
+    """
+    from app.config import settings
+
+    configured = (settings.FFMPEG_HWACCEL or "none").strip().lower()
+    if configured == "none":
+        return None
+    if configured == "auto":
+        if detect_video_encoder() != "h264_nvenc":
+            return None
+        configured = "cuda"
+
+    try:
+        result = subprocess.run(
+            ["ffmpeg", "-hide_banner", "-hwaccels"],
+            capture_output=True, text=True, timeout=10
+        )
+    except Exception as e:
+        logger.warning(f"FFmpeg hwaccel detection failed: {e}, decoding on CPU")
+        return None
+
+    # Output: "Hardware acceleration methods:" followed by one name per line
+    if configured not in result.stdout.split():
+        logger.warning(f"FFmpeg hwaccel '{configured}' not available, decoding on CPU")
+        return None
+    logger.info(f"Using hardware video decoding: {configured}")
+    return configured
+
+
+def hwaccel_input_args() -> List[str]:
+    """
+    FFmpeg input options for hardware decoding (place before a video -i).
+
+    Decoded frames are downloaded to system memory (no -hwaccel_output_format),
+    so CPU filters such as crop/scale/overlay keep working unchanged.
+    """
+    hwaccel = detect_hwaccel()
+    return ["-hwaccel", hwaccel] if hwaccel else []
+
+
+@functools.lru_cache(maxsize=None)
+def ffmpeg_has_filter(name: str) -> bool:
+    """
+    Check (once per process) whether the installed FFmpeg provides a filter.
+
+    Args:
+        name: Filter name (e.g. "drawtext", which needs libfreetype)
+
+    Returns:
+        True if FFmpeg lists the filter
+    """
+    try:
+        result = subprocess.run(
+            ["ffmpeg", "-hide_banner", "-filters"],
+            capture_output=True, text=True, timeout=10
+        )
+    except Exception as e:
+        logger.warning(f"FFmpeg filter detection failed: {e}")
+        return False
+    return any(
+        len(fields) > 1 and fields[1] == name
+        for fields in (line.split() for line in result.stdout.splitlines())
+    )
+
+
+def ffmpeg_log_args() -> List[str]:
+    """
+    FFmpeg logging options for encode runs.
+
+    Progress stats and per-stream info can run to megabytes on long
+    filter graphs; by default only errors are written to stderr so the
+    captured pipe stays small but failures keep their diagnostics.
+    settings.FFMPEG_DEBUG restores the full log.
+
+    Returns:
+        FFmpeg global options (place right after "ffmpeg")
+    """
+    from app.config import settings
+
+    level = "info" if settings.FFMPEG_DEBUG else "error"
+    return ["-hide_banner", "-nostats", "-loglevel", level]
+
+
+# Bytes of FFmpeg stderr kept for error reports (the tail holds the actual error)
+FFMPEG_STDERR_TAIL = 64 * 1024
+
+
+def run_ffmpeg(
+    cmd: List[str],
+    stdin_chunks: Iterable[bytes] = (),
+    total_duration: Optional[float] = None,
+    on_progress: Optional[Callable[[float], None]] = None
+) -> None:
+    """
+    Run FFmpeg, streaming stdin and reporting encode progress as it goes.
+
+    stdin is written chunk by chunk (no joined buffer). stderr goes to a temp
+    file, so FFmpeg never blocks on a full pipe and memory stays constant; only
+    its tail is kept for the error. With on_progress, `-progress pipe:1` is
+    added and a reader thread turns out_time into a 0..1 fraction of
+    total_duration.
+
+    Args:
+        cmd: FFmpeg argv (cmd[0] is the ffmpeg binary)
+        stdin_chunks: Data written to FFmpeg's stdin, in order
+        total_duration: Expected output duration in seconds (for progress)
+        on_progress: Called with the completed fraction (0..1)
+
+    Raises:
+        subprocess.CalledProcessError: FFmpeg exited non-zero (stderr tail attached)
+    """
+    track_progress = on_progress is not None and bool(total_duration)
+    if track_progress:
+        cmd = [cmd[0], "-progress", "pipe:1", *cmd[1:]]
+
+    with tempfile.TemporaryFile() as stderr_file:
+        proc = subprocess.Popen(
+            cmd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE if track_progress else subprocess.DEVNULL,
+            stderr=stderr_file
+        )
+        reader = None
+        if track_progress:
+            reader = threading.Thread(
+                target=_read_ffmpeg_progress,
+                args=(proc.stdout, total_duration, on_progress),
+                daemon=True
+            )
+            reader.start()
+
+        try:
+            for chunk in stdin_chunks:
+                proc.stdin.write(chunk)
+        except BrokenPipeError:
+            # FFmpeg exited early; its stderr explains why
+            pass
+        finally:
+            try:
+                proc.stdin.close()
+            except BrokenPipeError:
+                pass
+
+        returncode = proc.wait()
+        if reader is not None:
+            reader.join()
+        if returncode != 0:
+            size = stderr_file.seek(0, os.SEEK_END)
+            stderr_file.seek(max(0, size - FFMPEG_STDERR_TAIL))
+            raise subprocess.CalledProcessError(returncode, cmd, stderr=stderr_file.read())
+
+
+def _read_ffmpeg_progress(stream, total_duration: float, on_progress: Callable[[float], None]) -> None:
+    """Parse `-progress` key=value lines and report out_time as a fraction."""
+    with stream:
+        for raw_line in stream:
+            key, _, value = raw_line.decode(errors="replace").strip().partition("=")
+            # out_time_us (and the misnamed out_time_ms) are microseconds; "N/A" before the first frame
+            if key == "out_time_us" and value.isdigit():
+                try:
+                    on_progress(min(1.0, int(value) / 1_000_000 / total_duration))
+                except Exception as e:
+                    logger.debug(f"FFmpeg progress callback failed: {e}")
+
+
+def video_encoder_args(
+    vcodec: Optional[str] = None,
+    preset: Optional[str] = None,
+    crf: int = 23,
+    tune: Optional[str] = None,
+    x264_params: Optional[str] = None
+) -> List[str]:
+    """
+    Build FFmpeg video encoding options for the given encoder.
+
+    Args:
+        vcodec: Encoder name (None = detect_video_encoder())
+        preset: x264 preset used when falling back to libx264 (None = settings.FFMPEG_PRESET)
+        crf: x264 CRF used when falling back to libx264
+        tune: Optional x264 tune (e.g. "stillimage")
+        x264_params: Optional -x264-params override string
+
+    Returns:
+        FFmpeg arguments (starting with -c:v)
+    """
+    vcodec = vcodec or detect_video_encoder()
+    if vcodec == "h264_nvenc":
+        # Constant-quality VBR at the same level as the x264 CRF, capped for short-form delivery
+        return ["-c:v", vcodec, "-preset", "p4", "-tune", "hq",
+                "-rc", "vbr", "-cq", str(crf), "-b:v", "0", "-maxrate", "8M", "-bufsize", "12M"]
+    if vcodec == "h264_qsv":
+        return ["-c:v", vcodec, "-preset", "medium", "-global_quality", str(crf)]
+    if vcodec == "h264_videotoolbox":
+        return ["-c:v", vcodec, "-b:v", "6M", "-maxrate", "8M", "-bufsize", "12M"]
+    if vcodec == "libx264":
+        from app.config import settings
+        args = ["-c:v", vcodec, "-preset", preset or settings.FFMPEG_PRESET, "-crf", str(crf)]
+        if tune:
+            args.extend(["-tune", tune])
+        if x264_params:
+            args.extend(["-x264-params", x264_params])
+        return args
+    return ["-c:v", vcodec]
+
 
 class FFmpegRenderer:
     """FFmpeg-based video renderer with PIL frame generation."""
 
-    def __init__(self, run_id: str, layout: Dict, output_dir: Path):
+    def __init__(self, run_id: str, layout: Dict, output_dir: Path, vcodec: Optional[str] = None):
         """
         Initialize renderer.
 
@@ -32,6 +311,7 @@ class FFmpegRenderer:
             run_id: Run identifier for logging
             layout: Layout JSON with scenes, images, audio, etc.
             output_dir: Output directory for frames and final video
+            vcodec: H.264 encoder (None = auto-detect via settings.FFMPEG_HW_ENCODER)
         """
         self.run_id = run_id
         self.layout = layout
@@ -40,6 +320,7 @@ class FFmpegRenderer:
         self.frames_dir.mkdir(parents=True, exist_ok=True)
 
         # Video settings
+        self.vcodec = vcodec or detect_video_encoder()
         self.width = 1080
         self.height = 1920
         self.fps = layout.get("timeline", {}).get("fps", 30)
@@ -52,7 +333,6 @@ class FFmpegRenderer:
         self.subtitle_font_size = self.layout_config.get("subtitle_font_size", 80)
 
         # Font paths
-        from app.utils.fonts import get_font_path
         title_font_id = self.layout_config.get("title_font", "AppleGothic")
         subtitle_font_id = self.layout_config.get("subtitle_font", "AppleGothic")
         self.title_font_path = get_font_path(title_font_id)
@@ -61,18 +341,25 @@ class FFmpegRenderer:
         # Mode
         self.mode = layout.get("metadata", {}).get("mode", "general")
 
+        # ffprobe results keyed by audio path (frames and audio mix both need them)
+        self._audio_durations: Dict[str, float] = {}
+
+        # Pre-rendered title blocks keyed by title text (identical for every scene)
+        self._title_blocks: Dict[str, Tuple[Image.Image, int]] = {}
+
         logger.info(f"[{run_id}] FFmpegRenderer initialized: {self.width}x{self.height} @ {self.fps}fps")
 
     @staticmethod
+    @functools.lru_cache(maxsize=32)
     def _hex_to_rgb(hex_color: str) -> Tuple[int, int, int]:
         """Convert hex color to RGB tuple."""
-        hex_color = hex_color.lstrip('#')
-        return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
+        rgb = bytes.fromhex(hex_color.lstrip('#'))
+        return (rgb[0], rgb[1], rgb[2])
 
     def _load_font(self, font_path: str, font_size: int) -> ImageFont.FreeTypeFont:
         """Load TrueType font."""
         try:
-            return ImageFont.truetype(font_path, font_size)
+            return load_font(font_path, font_size)
         except Exception as e:
             logger.warning(f"[{self.run_id}] Failed to load font {font_path}: {e}, using default")
             return ImageFont.load_default()
@@ -88,39 +375,9 @@ class FFmpegRenderer:
         stroke_width: int = 3
     ):
         """Draw text with stroke (outline)."""
-        x, y = position
-
-        # Draw stroke
-        for offset_x in range(-stroke_width, stroke_width + 1):
-            for offset_y in range(-stroke_width, stroke_width + 1):
-                if offset_x != 0 or offset_y != 0:
-                    draw.text((x + offset_x, y + offset_y), text, font=font, fill=stroke_color)
-
-        # Draw main text
-        draw.text((x, y), text, font=font, fill=fill_color)
-
-    def _wrap_text(self, text: str, font: ImageFont.FreeTypeFont, max_width: int) -> List[str]:
-        """Wrap text to fit within max_width."""
-        lines = []
-        words = text.split()
-        current_line = []
-
-        for word in words:
-            test_line = ' '.join(current_line + [word])
-            bbox = font.getbbox(test_line)
-            text_width = bbox[2] - bbox[0]
-
-            if text_width <= max_width:
-                current_line.append(word)
-            else:
-                if current_line:
-                    lines.append(' '.join(current_line))
-                current_line = [word]
-
-        if current_line:
-            lines.append(' '.join(current_line))
-
-        return lines
+        # Pillow rasterizes glyph + outline in one pass (no per-offset redraws)
+        draw.text(position, text, font=font, fill=fill_color,
+                  stroke_width=stroke_width, stroke_fill=stroke_color)
 
     def _create_title_block(
         self,
@@ -131,6 +388,9 @@ class FFmpegRenderer:
         """
         Draw title block at the top of the image.
 
+        The title is the same for every scene, so the block is rendered once
+        per renderer and pasted into each frame.
+
         Args:
             img: PIL Image to draw on (modified in-place)
             title_text: Title text
@@ -139,49 +399,63 @@ class FFmpegRenderer:
         Returns:
             Height of title block in pixels
         """
-        draw = ImageDraw.Draw(img)
+        cached = self._title_blocks.get(title_text)
+        if cached is None:
+            cached = self._render_title_block(title_text, title_font)
+            self._title_blocks[title_text] = cached
+
+        block_img, title_block_height = cached
+        # The block is fully opaque: a plain paste matches drawing it in place
+        img.paste(block_img, (0, 0))
+        return title_block_height
 
-        # Wrap title text
-        max_title_width = int(self.width * 0.90)
-        title_lines = self._wrap_text(title_text, title_font, max_title_width)
+    def _render_title_block(
+        self,
+        title_text: str,
+        title_font: ImageFont.FreeTypeFont
+    ) -> Tuple[Image.Image, int]:
+        """
+        Render the title block (background bar + centered title) as its own image.
+
+        Args:
+            title_text: Title text
+            title_font: Font for title
 
+        Returns:
+            (block image, height of title block in pixels)
+        """
         # Calculate title block height
         line_height = int(self.title_font_size * 1.3)  # 1.3x for line spacing
         padding_top = 40  # Increased from 20 for better spacing
         padding_bottom = 40  # Increased from 20 for better spacing
         padding_left = 30
 
+        # Wrap title text and place lines (center-aligned, multi-line)
+        max_title_width = int(self.width * 0.90)
+        title_lines = layout_text(title_text, title_font, max_title_width, self.width, padding_top, line_height)
+
         title_text_height = len(title_lines) * line_height
         title_block_height = title_text_height + padding_top + padding_bottom
 
-        # Draw title background
-        draw.rectangle(
-            [(0, 0), (self.width, title_block_height)],
-            fill=self.title_bg_color
-        )
-
-        # Draw title text (center-aligned, multi-line)
-        current_y = padding_top
-        for line in title_lines:
-            # Calculate centered x position for each line
-            bbox = title_font.getbbox(line)
-            text_width = bbox[2] - bbox[0]
-            x_centered = (self.width - text_width) // 2
+        # Draw title background (rectangle bounds are inclusive: height + 1 rows)
+        block_img = Image.new('RGB', (self.width, title_block_height + 1), self.title_bg_color)
+        draw = ImageDraw.Draw(block_img)
 
+        # Draw title text
+        for line, x_centered, line_y in title_lines:
             self._draw_text_with_stroke(
                 draw,
                 line,
-                (x_centered, current_y),
+                (x_centered, line_y),
                 title_font,
                 fill_color=(255, 255, 255),
                 stroke_color=(0, 0, 0),
                 stroke_width=3
             )
-            current_y += line_height
 
         logger.info(f"[{self.run_id}] Drew title block: {len(title_lines)} lines, height={title_block_height}px")
 
-        return title_block_height
+        return block_img, title_block_height
 
     def _create_subtitle(
         self,
@@ -205,30 +479,25 @@ class FFmpegRenderer:
         """
         draw = ImageDraw.Draw(img)
 
-        # Wrap subtitle text
-        max_subtitle_width = int(self.width * 0.90)
-        subtitle_lines = self._wrap_text(subtitle_text, subtitle_font, max_subtitle_width)
-
         # Calculate line height
         line_height = int(self.subtitle_font_size * 1.3)
 
-        # Center subtitle horizontally
-        current_y = y_position
-        for line in subtitle_lines:
-            bbox = subtitle_font.getbbox(line)
-            text_width = bbox[2] - bbox[0]
-            x_centered = (self.width - text_width) // 2
+        # Wrap subtitle text and center it horizontally
+        max_subtitle_width = int(self.width * 0.90)
+        subtitle_lines = layout_text(
+            subtitle_text, subtitle_font, max_subtitle_width, self.width, y_position, line_height
+        )
 
+        for line, x_centered, line_y in subtitle_lines:
             self._draw_text_with_stroke(
                 draw,
                 line,
-                (x_centered, current_y),
+                (x_centered, line_y),
                 subtitle_font,
                 fill_color=text_color,
                 stroke_color=stroke_color,
                 stroke_width=2
             )
-            current_y += line_height
 
     def _composite_scene_frame(
         self,
@@ -269,15 +538,17 @@ class FFmpegRenderer:
             img_type = img_slot.get("type", "character")
             layer_img = Image.open(img_url)
 
-            # Convert to RGBA if needed
-            if layer_img.mode != 'RGBA':
+            # Only layers with transparency need alpha blending; opaque RGB
+            # images (generated scenes/backgrounds) are pasted as a plain copy
+            has_alpha = layer_img.mode != 'RGB'
+            if has_alpha and layer_img.mode != 'RGBA':
                 layer_img = layer_img.convert('RGBA')
 
             # Handle different image types
             if img_type == "background":
                 # Background: resize to fill screen
                 layer_img = layer_img.resize((self.width, self.height), Image.Resampling.LANCZOS)
-                img.paste(layer_img, (0, 0), layer_img)
+                img.paste(layer_img, (0, 0), layer_img if has_alpha else None)
                 logger.info(f"[{self.run_id}] Composited background image (full screen)")
 
             elif img_type == "scene":
@@ -294,12 +565,12 @@ class FFmpegRenderer:
                     y_position = int(self.height * 0.80 - new_height * 0.80)
                     scene_image_top_y = y_position
 
-                    img.paste(layer_img, ((self.width - new_width) // 2, y_position), layer_img)
+                    img.paste(layer_img, ((self.width - new_width) // 2, y_position), layer_img if has_alpha else None)
                     logger.info(f"[{self.run_id}] Composited 1:1 scene image at y={y_position}px")
                 else:
                     # Story Mode: 9:16 image, fill screen
                     layer_img = layer_img.resize((self.width, self.height), Image.Resampling.LANCZOS)
-                    img.paste(layer_img, (0, 0), layer_img)
+                    img.paste(layer_img, (0, 0), layer_img if has_alpha else None)
                     logger.info(f"[{self.run_id}] Composited 9:16 scene image (full screen)")
 
             else:
@@ -315,13 +586,13 @@ class FFmpegRenderer:
                     x_pixel = x_center - (new_width // 2)
                     y_pixel = self.height - new_height  # Bottom-aligned
 
-                    img.paste(layer_img, (x_pixel, y_pixel), layer_img)
+                    img.paste(layer_img, (x_pixel, y_pixel), layer_img if has_alpha else None)
                     logger.info(f"[{self.run_id}] Composited character at x={x_pos:.2f}, bottom-aligned")
                 else:
                     # Legacy center positioning
                     x_pixel = (self.width - new_width) // 2
                     y_pixel = (self.height - new_height) // 2
-                    img.paste(layer_img, (x_pixel, y_pixel), layer_img)
+                    img.paste(layer_img, (x_pixel, y_pixel), layer_img if has_alpha else None)
 
         # Add title block
         title_height = 0
@@ -363,6 +634,53 @@ class FFmpegRenderer:
 
         return img
 
+    def _probe_audio_duration(self, audio_url: str) -> float:
+        """
+        Get audio duration in seconds via ffprobe, cached per path.
+
+        Args:
+            audio_url: Path to audio file
+
+        Returns:
+            Duration in seconds (3s default if probing fails)
+        """
+        if audio_url in self._audio_durations:
+            return self._audio_durations[audio_url]
+
+        try:
+            probe_cmd = [
+                "ffprobe", "-v", "error",
+                "-show_entries", "format=duration",
+                "-of", "default=noprint_wrappers=1:nokey=1",
+                str(audio_url)
+            ]
+            result = subprocess.run(probe_cmd, capture_output=True, text=True, check=True)
+            duration = float(result.stdout.strip())
+        except Exception as e:
+            logger.warning(f"[{self.run_id}] Failed to probe audio {audio_url}: {e}, using default 3s")
+            duration = 3.0
+
+        self._audio_durations[audio_url] = duration
+        return duration
+
+    def _line_audio_duration(self, text_line: Dict) -> float:
+        """
+        Get a text line's TTS duration in seconds.
+
+        Uses the duration measured by the voice task when available and only
+        falls back to ffprobe for layouts that don't carry it.
+
+        Args:
+            text_line: Text line with audio_url (and optionally audio_duration_ms)
+
+        Returns:
+            Duration in seconds
+        """
+        duration_ms = text_line.get("audio_duration_ms")
+        if duration_ms:
+            return duration_ms / 1000.0
+        return self._probe_audio_duration(text_line["audio_url"])
+
     def _get_scene_audio_duration(self, scene: Dict) -> float:
         """
         Calculate scene duration based on actual TTS audio duration.
@@ -374,67 +692,104 @@ class FFmpegRenderer:
         Returns:
             Duration in seconds (with 1.1x speedup and 0.5s gap applied)
         """
-        import subprocess as sp
-
         total_duration = 0.0
         audio_count = 0
         for text_line in scene.get("texts", []):
             audio_url = text_line.get("audio_url")
             if audio_url and Path(audio_url).exists() and Path(audio_url).stat().st_size > 100:
-                try:
-                    probe_cmd = [
-                        "ffprobe", "-v", "error",
-                        "-show_entries", "format=duration",
-                        "-of", "default=noprint_wrappers=1:nokey=1",
-                        str(audio_url)
-                    ]
-                    result = sp.run(probe_cmd, capture_output=True, text=True, check=True)
-                    audio_duration = float(result.stdout.strip())
-                    # Apply 1.1x speedup + 0.5s gap
-                    total_duration += audio_duration / 1.1 + 0.5
-                    audio_count += 1
-                except Exception as e:
-                    logger.warning(f"[{self.run_id}] Failed to probe audio: {e}, using 3s default")
-                    total_duration += 3.0 / 1.1 + 0.5
-                    audio_count += 1
+                # Apply 1.1x speedup + 0.5s gap
+                total_duration += self._line_audio_duration(text_line) / 1.1 + 0.5
+                audio_count += 1
 
         # Minimum duration of 0.5s if no audio
         return max(total_duration, 0.5)
 
+    def _render_scene_frame(
+        self,
+        index: int,
+        scene: Dict,
+        title_text: str,
+        title_font: ImageFont.FreeTypeFont,
+        subtitle_font: ImageFont.FreeTypeFont
+    ) -> Tuple[Path, float]:
+        """
+        Render and save the frame for one scene.
+
+        Args:
+            index: Scene index (used for the frame file name)
+            scene: Scene data from layout.json
+            title_text: Project title
+            title_font: Font for title
+            subtitle_font: Font for subtitle
+
+        Returns:
+            (frame_path, duration_seconds)
+        """
+        scene_id = scene["scene_id"]
+        # Calculate duration based on actual TTS audio (with 1.1x speedup)
+        duration_sec = self._get_scene_audio_duration(scene)
+
+        logger.info(f"[{self.run_id}] Rendering frame for {scene_id} (audio-based duration={duration_sec:.2f}s)")
+
+        # Create composite frame
+        frame_img = self._composite_scene_frame(scene, title_text, title_font, subtitle_font)
+
+        # Save frame
+        # The base canvas is opaque, so the alpha plane is always 255 here.
+        # Drop it so FFmpeg decodes plain RGB frames instead of blending RGBA.
+        frame_path = self.frames_dir / f"scene_{index:04d}.png"
+        frame_img.convert("RGB").save(frame_path, "PNG")
+
+        logger.info(f"[{self.run_id}] Saved frame: {frame_path}")
+        return frame_path, duration_sec
+
     def render_frames(self) -> List[Tuple[Path, float]]:
         """
         Render all scene frames.
 
+        Scenes are independent, so with more than one scene they are rendered
+        in parallel worker processes (falls back to in-process rendering when
+        a process pool can't be used, e.g. inside a daemonic prefork worker).
+
         Returns:
-            List of (frame_path, duration_seconds) tuples
+            List of (frame_path, duration_seconds) tuples, in scene order
         """
         logger.info(f"[{self.run_id}] Starting frame generation...")
 
-        # Load fonts
-        title_font = self._load_font(self.title_font_path, self.title_font_size)
-        subtitle_font = self._load_font(self.subtitle_font_path, self.subtitle_font_size)
-
         title_text = self.layout.get("title", "")
         scenes = self.layout.get("scenes", [])
 
-        frame_info = []
+        max_workers = min(len(scenes), os.cpu_count() or 1)
+        if max_workers > 1:
+            try:
+                # spawn: don't fork the worker's gevent hub / Celery state into the children
+                with ProcessPoolExecutor(
+                    max_workers=max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_frame_worker,
+                    initargs=(self.run_id, self.layout, self.output_dir, self.vcodec),
+                ) as executor:
+                    results = list(executor.map(_render_frame_in_worker, range(len(scenes))))
+
+                frame_info = []
+                for frame_path, duration_sec, audio_durations in results:
+                    # Keep the probed durations so compose_video doesn't ffprobe again
+                    self._audio_durations.update(audio_durations)
+                    frame_info.append((frame_path, duration_sec))
+
+                logger.info(f"[{self.run_id}] Frame generation complete: {len(frame_info)} frames ({max_workers} processes)")
+                return frame_info
+            except Exception as e:
+                logger.warning(f"[{self.run_id}] Parallel frame rendering unavailable ({e}), rendering in-process")
 
-        for i, scene in enumerate(scenes):
-            scene_id = scene["scene_id"]
-            # Calculate duration based on actual TTS audio (with 1.1x speedup)
-            duration_sec = self._get_scene_audio_duration(scene)
-
-            logger.info(f"[{self.run_id}] Rendering frame for {scene_id} (audio-based duration={duration_sec:.2f}s)")
-
-            # Create composite frame
-            frame_img = self._composite_scene_frame(scene, title_text, title_font, subtitle_font)
-
-            # Save frame
-            frame_path = self.frames_dir / f"scene_{i:04d}.png"
-            frame_img.save(frame_path, "PNG")
+        # Load fonts
+        title_font = self._load_font(self.title_font_path, self.title_font_size)
+        subtitle_font = self._load_font(self.subtitle_font_path, self.subtitle_font_size)
 
-            frame_info.append((frame_path, duration_sec))
-            logger.info(f"[{self.run_id}] Saved frame: {frame_path}")
+        frame_info = [
+            self._render_scene_frame(i, scene, title_text, title_font, subtitle_font)
+            for i, scene in enumerate(scenes)
+        ]
 
         logger.info(f"[{self.run_id}] Frame generation complete: {len(frame_info)} frames")
         return frame_info
@@ -442,7 +797,8 @@ class FFmpegRenderer:
     def compose_video(
         self,
         frame_info: List[Tuple[Path, float]],
-        output_path: Path
+        output_path: Path,
+        on_progress: Optional[Callable[[float], None]] = None
     ) -> Path:
         """
         Compose frames into video using FFmpeg with audio mixing.
@@ -450,35 +806,42 @@ class FFmpegRenderer:
         Args:
             frame_info: List of (frame_path, duration_seconds) tuples
             output_path: Output video path
+            on_progress: Called with the encoded fraction (0..1) while FFmpeg runs
 
         Returns:
             Path to final video
         """
         logger.info(f"[{self.run_id}] Starting FFmpeg video composition...")
 
-        # Create concat demuxer file for frames with durations
-        concat_file = self.output_dir / "concat.txt"
-        with open(concat_file, "w") as f:
-            for frame_path, duration in frame_info:
-                # Use absolute path to avoid path resolution issues
-                abs_frame_path = frame_path.resolve()
-                f.write(f"file '{abs_frame_path}'\n")
-                f.write(f"duration {duration}\n")
-            # Repeat last frame to ensure it's included
-            if frame_info:
-                last_frame, _ = frame_info[-1]
-                abs_last_frame = last_frame.resolve()
-                f.write(f"file '{abs_last_frame}'\n")
-
-        logger.info(f"[{self.run_id}] Created concat file: {concat_file}")
+        # Build concat demuxer list for frames with durations (fed to FFmpeg on stdin, no list file)
+        concat_lines = []
+        for frame_path, duration in frame_info:
+            # Absolute path with an explicit file: scheme, otherwise FFmpeg resolves
+            # entries relative to the pipe:0 list URL and cannot open them
+            abs_frame_path = frame_path.resolve()
+            concat_lines.append(f"file 'file:{abs_frame_path}'")
+            concat_lines.append(f"duration {duration}")
+        # Repeat last frame to ensure it's included
+        if frame_info:
+            last_frame, _ = frame_info[-1]
+            abs_last_frame = last_frame.resolve()
+            concat_lines.append(f"file 'file:{abs_last_frame}'")
+        concat_list = "\n".join(concat_lines) + "\n"
+        # Output length is fixed by the frame plan: no probing of intermediate files needed
+        frames_duration = sum(duration for _, duration in frame_info)
+
+        logger.info(f"[{self.run_id}] Built concat list: {len(frame_info)} frames ({frames_duration:.1f}s)")
 
         # Build FFmpeg command (input section)
         cmd = [
             "ffmpeg",
+            *ffmpeg_log_args(),
             "-y",  # Overwrite output
             "-f", "concat",
             "-safe", "0",
-            "-i", str(concat_file),
+            # The list arrives on stdin but the frames it names are local files
+            "-protocol_whitelist", "file,pipe",
+            "-i", "pipe:0",
         ]
 
         # Collect audio files
@@ -493,7 +856,6 @@ class FFmpegRenderer:
                 audio_files.append(("bgm", str(bgm_path), global_bgm.get("volume", 0.5)))
 
         # Voice audio with timing (continuous without padding)
-        import subprocess as sp
         current_voice_time = 0.0  # Track continuous voice timeline
         scene_start_time = 0.0
 
@@ -503,22 +865,10 @@ class FFmpegRenderer:
             for text_line in scene.get("texts", []):
                 audio_url = text_line.get("audio_url")
                 if audio_url and Path(audio_url).exists() and Path(audio_url).stat().st_size > 100:
-                    # Get actual audio duration using ffprobe
-                    try:
-                        probe_cmd = [
-                            "ffprobe", "-v", "error",
-                            "-show_entries", "format=duration",
-                            "-of", "default=noprint_wrappers=1:nokey=1",
-                            str(audio_url)
-                        ]
-                        result = sp.run(probe_cmd, capture_output=True, text=True, check=True)
-                        audio_duration = float(result.stdout.strip())
-                        # Account for 1.1x speedup
-                        sped_up_duration = audio_duration / 1.1
-                    except Exception as e:
-                        logger.warning(f"[{self.run_id}] Failed to probe audio {audio_url}: {e}, using default 3s")
-                        audio_duration = 3.0
-                        sped_up_duration = audio_duration / 1.1
+                    # Actual audio duration (already probed during frame rendering)
+                    audio_duration = self._line_audio_duration(text_line)
+                    # Account for 1.1x speedup
+                    sped_up_duration = audio_duration / 1.1
 
                     # Add voice at current continuous timeline position
                     audio_files.append(("voice", str(audio_url), 1.0, current_voice_time))
@@ -533,6 +883,7 @@ class FFmpegRenderer:
         # Add audio inputs and build filter_complex
         audio_idx = 1  # 0 is video
         audio_streams = []
+        mix_weights = []
 
         for audio_info in audio_files:
             if audio_info[0] == "bgm":
@@ -541,20 +892,22 @@ class FFmpegRenderer:
 
                 # BGM is 30 seconds long - only loop if video is longer than 30s
                 if total_video_duration > 30.0:
-                    # Loop BGM and apply volume
-                    filter_complex_parts.append(f"[{audio_idx}:a]aloop=loop=-1:size=2e9,volume={volume}[bgm]")
+                    # Loop BGM (volume is applied as an amix weight)
+                    filter_complex_parts.append(f"[{audio_idx}:a]aloop=loop=-1:size=2e9[bgm]")
+                    audio_streams.append("[bgm]")
                 else:
-                    # No loop needed - just apply volume
-                    filter_complex_parts.append(f"[{audio_idx}:a]volume={volume}[bgm]")
+                    # No loop needed - feed the input straight into amix
+                    audio_streams.append(f"[{audio_idx}:a]")
 
-                audio_streams.append("[bgm]")
+                mix_weights.append(str(volume))
                 audio_idx += 1
             else:
                 _, audio_path, volume, start_time = audio_info
                 cmd.extend(["-i", audio_path])
-                # Apply 1.1x speed, delay to match timing, and apply volume
-                filter_complex_parts.append(f"[{audio_idx}:a]atempo=1.1,adelay={int(start_time * 1000)}|{int(start_time * 1000)},volume={volume}[v{audio_idx}]")
+                # Apply 1.1x speed and delay to match timing (volume is applied as an amix weight)
+                filter_complex_parts.append(f"[{audio_idx}:a]atempo=1.1,adelay={int(start_time * 1000)}|{int(start_time * 1000)}[v{audio_idx}]")
                 audio_streams.append(f"[v{audio_idx}]")
+                mix_weights.append(str(volume))
                 audio_idx += 1
 
         # Mix all audio streams and add output encoding options
@@ -563,7 +916,9 @@ class FFmpegRenderer:
             mix_inputs = "".join(audio_streams)
             # Use duration=longest to include all voice clips, then FFmpeg will trim to video length
             # IMPORTANT: normalize=0 prevents automatic volume boost when streams end (fixes volume fade-in at end)
-            filter_complex_parts.append(f"{mix_inputs}amix=inputs={num_streams}:duration=longest:normalize=0[aout]")
+            # Per-stream volumes are applied as amix weights in a single native mixing pass
+            weights = " ".join(mix_weights)
+            filter_complex_parts.append(f"{mix_inputs}amix=inputs={num_streams}:duration=longest:normalize=0:weights='{weights}'[aout]")
 
             cmd.extend([
                 "-filter_complex", ";".join(filter_complex_parts),
@@ -571,15 +926,16 @@ class FFmpegRenderer:
                 "-map", "[aout]",
                 # Video encoding options (MUST come after -map)
                 "-r", str(self.fps),
-                "-c:v", "libx264",
+                *video_encoder_args(self.vcodec, tune="stillimage", x264_params=STILL_FRAME_X264_PARAMS),
                 "-pix_fmt", "yuv420p",
-                "-preset", "medium",
-                "-crf", "23",
+                # moov atom up front: the browser player can start before the whole file loads
+                "-movflags", "+faststart",
                 # Audio encoding options
                 "-c:a", "aac",
                 "-b:a", "192k",
-                # CRITICAL: Trim audio to match video duration
-                "-shortest"
+                # CRITICAL: Trim output to the planned frame timeline (-t caps the looped BGM too).
+                # No -shortest on top: combined with -t it truncates the output early
+                "-t", f"{frames_duration:.3f}"
             ])
         else:
             # No audio - video only
@@ -587,10 +943,9 @@ class FFmpegRenderer:
                 "-map", "0:v",
                 # Video encoding options (MUST come after -map)
                 "-r", str(self.fps),
-                "-c:v", "libx264",
+                *video_encoder_args(self.vcodec, tune="stillimage", x264_params=STILL_FRAME_X264_PARAMS),
                 "-pix_fmt", "yuv420p",
-                "-preset", "medium",
-                "-crf", "23"
+                "-movflags", "+faststart"
             ])
 
         cmd.append(str(output_path))
@@ -599,26 +954,26 @@ class FFmpegRenderer:
 
         # Run FFmpeg
         try:
-            result = subprocess.run(
+            run_ffmpeg(
                 cmd,
-                check=True,
-                capture_output=True,
-                text=True
+                [concat_list.encode("utf-8")],
+                total_duration=total_video_duration if audio_streams else frames_duration,
+                on_progress=on_progress
             )
             logger.info(f"[{self.run_id}] FFmpeg completed successfully")
-            logger.debug(f"[{self.run_id}] FFmpeg output: {result.stdout}")
         except subprocess.CalledProcessError as e:
-            logger.error(f"[{self.run_id}] FFmpeg failed: {e.stderr}")
+            logger.error(f"[{self.run_id}] FFmpeg failed: {e.stderr.decode(errors='replace')}")
             raise
 
         return output_path
 
-    def render(self, output_path: Path) -> Path:
+    def render(self, output_path: Path, on_progress: Optional[Callable[[float], None]] = None) -> Path:
         """
         Full rendering pipeline: frames → video.
 
         Args:
             output_path: Output video path
+            on_progress: Called with the encoded fraction (0..1) during the FFmpeg pass
 
         Returns:
             Path to final video
@@ -627,7 +982,34 @@ class FFmpegRenderer:
         frame_info = self.render_frames()
 
         # Step 2: Compose video with FFmpeg
-        final_video = self.compose_video(frame_info, output_path)
+        final_video = self.compose_video(frame_info, output_path, on_progress=on_progress)
 
         logger.info(f"[{self.run_id}] Rendering complete: {final_video}")
         return final_video
+
+
+# Per-process renderer + fonts for parallel frame rendering, set by _init_frame_worker
+_frame_worker_ctx: Optional[Dict] = None
+
+
+def _init_frame_worker(run_id: str, layout: Dict, output_dir: Path, vcodec: str):
+    """ProcessPoolExecutor initializer: build a renderer and parse the TTFs once per process."""
+    global _frame_worker_ctx
+    renderer = FFmpegRenderer(run_id, layout, output_dir, vcodec=vcodec)
+    _frame_worker_ctx = {
+        "renderer": renderer,
+        "title_text": layout.get("title", ""),
+        "title_font": renderer._load_font(renderer.title_font_path, renderer.title_font_size),
+        "subtitle_font": renderer._load_font(renderer.subtitle_font_path, renderer.subtitle_font_size),
+    }
+
+
+def _render_frame_in_worker(index: int) -> Tuple[Path, float, Dict[str, float]]:
+    """Render scene `index` in a worker process; also returns the ffprobe results."""
+    ctx = _frame_worker_ctx
+    renderer = ctx["renderer"]
+    scene = renderer.layout["scenes"][index]
+    frame_path, duration_sec = renderer._render_scene_frame(
+        index, scene, ctx["title_text"], ctx["title_font"], ctx["subtitle_font"]
+    )
+    return frame_path, duration_sec, renderer._audio_durations
@@ -1,9 +1,10 @@
 """
 Font management utilities for MoviePy text rendering.
 """
+import functools
 import logging
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, Hashable, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -84,6 +85,27 @@ def get_font_path(font_id: str) -> str:
     return DEFAULT_FONT
 
 
+@functools.lru_cache(maxsize=64)
+def load_font(font_path: str, size: int):
+    """
+    Load a TrueType font, cached per (path, size) for the life of the process.
+
+    Worker processes render many runs with the same few fonts, so the TTF is
+    parsed by FreeType once instead of per run. Font objects are only read
+    while drawing, so sharing them is safe. Load errors are not cached.
+
+    Args:
+        font_path: Font file path or system font name (see get_font_path)
+        size: Font size in pixels
+
+    Returns:
+        PIL ImageFont.FreeTypeFont
+    """
+    from PIL import ImageFont
+
+    return ImageFont.truetype(font_path, size)
+
+
 # Friendly font name mapping (optional customization)
 FONT_NAME_MAPPING = {
     "KimjungchulGothic-Regular": "김중철고딕 Regular",
@@ -97,3 +119,137 @@ FONT_NAME_MAPPING = {
     "AppleGothic": "Apple Gothic (시스템)",
     "AppleMyungjo": "Apple Myungjo (시스템)",
 }
+
+
+# Fonts seen by text_bbox(), keyed by (path, size) so measurements are shared
+# across font objects loaded from the same file (e.g. one per scene/run)
+_fonts_by_key: Dict[Hashable, object] = {}
+# Path-less fonts are keyed by id(), so cap the registry to stop it growing
+_MAX_CACHED_FONTS = 64
+
+
+def _font_key(font) -> Hashable:
+    path = getattr(font, "path", None)
+    if path is None:
+        # Bitmap default font: no path, key by identity (kept alive by _fonts_by_key)
+        return ("id", id(font))
+    return (str(path), getattr(font, "size", None))
+
+
+@functools.lru_cache(maxsize=4096)
+def _cached_bbox(font_key: Hashable, text: str) -> Tuple[int, int, int, int]:
+    return _fonts_by_key[font_key].getbbox(text)
+
+
+def text_bbox(font, text: str) -> Tuple[int, int, int, int]:
+    """
+    Memoized font.getbbox(text).
+
+    Args:
+        font: PIL ImageFont
+        text: Text to measure
+
+    Returns:
+        (left, top, right, bottom) bounding box
+    """
+    key = _font_key(font)
+    if key not in _fonts_by_key:
+        if len(_fonts_by_key) >= _MAX_CACHED_FONTS:
+            # Cached bboxes reference the evicted keys, so drop them together
+            _fonts_by_key.clear()
+            _cached_bbox.cache_clear()
+        _fonts_by_key[key] = font
+    return _cached_bbox(key, text)
+
+
+def text_width(font, text: str) -> int:
+    """Memoized rendered width of text (bbox right - left)."""
+    bbox = text_bbox(font, text)
+    return bbox[2] - bbox[0]
+
+
+def _wrap_with_widths(text: str, font, max_width: int) -> List[Tuple[str, int]]:
+    """
+    Greedy word wrap returning (line, width) pairs.
+
+    Break points are chosen from cached word widths + space widths, instead of
+    re-measuring every growing prefix. Each finished line is then measured
+    once as a whole, so the returned width includes kerning.
+    """
+    space_width = text_width(font, "a a") - text_width(font, "aa")
+    lines = []
+    current_line: List[str] = []
+    current_width = 0
+
+    for word in text.split():
+        word_width = text_width(font, word)
+        line_width = current_width + space_width + word_width if current_line else word_width
+
+        if line_width <= max_width:
+            current_line.append(word)
+            current_width = line_width
+        else:
+            if current_line:
+                lines.append(' '.join(current_line))
+            current_line = [word]
+            current_width = word_width
+
+    if current_line:
+        lines.append(' '.join(current_line))
+
+    return [(line, text_width(font, line)) for line in lines]
+
+
+def wrap_text(text: str, font, max_width: int) -> List[str]:
+    """
+    Greedy word wrap to fit within max_width.
+
+    Args:
+        text: Text to wrap
+        font: PIL ImageFont
+        max_width: Maximum line width in pixels
+
+    Returns:
+        Wrapped lines (empty for blank text)
+    """
+    return [line for line, _ in _wrap_with_widths(text, font, max_width)]
+
+
+def layout_text(
+    text: str,
+    font,
+    max_width: int,
+    area_width: int,
+    area_top: int,
+    line_height: int,
+    area_height: Optional[int] = None
+) -> List[Tuple[str, int, int]]:
+    """
+    Wrap text and place each line horizontally centered in one pass.
+
+    Lines are centered on their real rendered width (cached text_width of the
+    whole line), not the summed word widths used to pick break points.
+
+    Args:
+        text: Text to lay out
+        font: PIL ImageFont
+        max_width: Maximum line width in pixels
+        area_width: Width of the area lines are centered in
+        area_top: Y of the first line (or top of the area when area_height is given)
+        line_height: Distance between line tops
+        area_height: If given, center the block vertically within this height
+
+    Returns:
+        List of (line, x, y) draw positions
+    """
+    lines = wrap_text(text, font, max_width)
+
+    y = area_top
+    if area_height is not None:
+        y += (area_height - len(lines) * line_height) // 2
+
+    placed = []
+    for line in lines:
+        placed.append((line, (area_width - text_width(font, line)) // 2, y))
+        y += line_height
+    return placed
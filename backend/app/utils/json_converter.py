@@ -2,15 +2,21 @@
 JSON conversion utilities with characters.json support.
 """
 import logging
-import json
+import re
+from collections import defaultdict
+from operator import itemgetter
 from pathlib import Path
 from typing import List, Dict
 
 from app.utils.seeds import generate_char_seed, generate_bg_seed
 from app.utils.sfx_tags import extract_sfx_tags
+from app.utils.json_io import read_json, write_json
 
 logger = logging.getLogger(__name__)
 
+# {char_X} placeholders in plot text / prompts
+CHAR_VAR_RE = re.compile(r'\{(char_\d+)\}')
+
 
 def convert_plot_to_json(
     plot_json_path: str,
@@ -19,7 +25,8 @@ def convert_plot_to_json(
     music_genre: str = "ambient",
     video_title: str = None,
     layout_config: dict = None,
-    review_mode: bool = False
+    review_mode: bool = False,
+    plot_data: Dict = None
 ) -> Path:
     """
     Convert plot.json and characters.json to final layout.json.
@@ -32,6 +39,7 @@ def convert_plot_to_json(
         video_title: User-specified video title
         layout_config: Layout customization settings (title_bg_color, fonts, etc.)
         review_mode: Whether user wants to review at each stage
+        plot_data: Already-loaded contents of plot.json (skips re-reading the file)
 
     Returns:
         Path to generated layout.json file
@@ -45,15 +53,14 @@ def convert_plot_to_json(
     characters_data = []
     if characters_json_path.exists():
         logger.info(f"Loading characters from: {characters_json_path}")
-        with open(characters_json_path, "r", encoding="utf-8") as f:
-            char_json = json.load(f)
-            characters_data = char_json.get("characters", [])
+        char_json = read_json(characters_json_path)
+        characters_data = char_json.get("characters", [])
     else:
         logger.warning(f"characters.json not found")
 
-    # Read plot JSON
-    with open(plot_json_path, "r", encoding="utf-8") as f:
-        plot_data = json.load(f)
+    # Read plot JSON (callers that just wrote it pass it in)
+    if plot_data is None:
+        plot_data = read_json(plot_json_path)
 
     rows = plot_data.get("scenes", [])
     if not rows:
@@ -82,17 +89,16 @@ def convert_plot_to_json(
                     persona=char.get("personality", f"{char['name']} 설정"),
                     voice_profile=char.get("voice_profile", "default"),
                     seed=char.get("seed", generate_char_seed(char["char_id"]))
-                ).model_dump()
+                )
             )
     else:
-        # Fallback: extract from plot JSON
-        characters_set = set()
+        # Fallback: extract from plot JSON (one entry per char_id, first name seen wins)
+        character_names: Dict[str, str] = {}
         for row in rows:
-            char_id = row["char_id"]
-            char_name = row.get("char_name", "Character")
-            characters_set.add((char_id, char_name))
+            character_names.setdefault(row["char_id"], row.get("char_name", "Character"))
 
-        for char_id, char_name in sorted(characters_set):
+        for char_id in sorted(character_names):
+            char_name = character_names[char_id]
             characters.append(
                 Character(
                     char_id=char_id,
@@ -100,16 +106,18 @@ def convert_plot_to_json(
                     persona=f"{char_name} 설정",
                     voice_profile="default",
                     seed=generate_char_seed(char_id)
-                ).model_dump()
+                )
             )
 
+    # characters.json entries by char_id (first entry wins, like the former linear scans)
+    characters_by_id: Dict[str, dict] = {}
+    for char in characters_data:
+        characters_by_id.setdefault(char.get("char_id"), char)
+
     # Build scenes
-    scenes_data: Dict[str, List[dict]] = {}
+    scenes_data: Dict[str, List[dict]] = defaultdict(list)
     for row in rows:
-        scene_id = row["scene_id"]
-        if scene_id not in scenes_data:
-            scenes_data[scene_id] = []
-        scenes_data[scene_id].append(row)
+        scenes_data[row["scene_id"]].append(row)
 
     scenes = []
     total_duration = 0
@@ -131,9 +139,15 @@ def convert_plot_to_json(
         "background_img": "simple background"
     }
 
-    for scene_id, scene_rows in sorted(scenes_data.items(), key=lambda x: int(x[0].split("_")[1])):
+    # Parse each scene number once; rows usually arrive in order, which Timsort handles in one pass
+    ordered_scenes = [
+        (int(scene_id.split("_")[1]), scene_id, scene_rows)
+        for scene_id, scene_rows in scenes_data.items()
+    ]
+    ordered_scenes.sort(key=itemgetter(0))
+
+    for sequence, scene_id, scene_rows in ordered_scenes:
         first_row = scene_rows[0]
-        sequence = int(scene_id.split("_")[1])
         # duration_ms with fallback to default 5000ms
         duration_ms = int(first_row.get("duration_ms") or 5000)
         total_duration += duration_ms
@@ -146,16 +160,12 @@ def convert_plot_to_json(
             text_type = row.get("text_type", "dialogue")
 
             # Replace character variable placeholders {char_X} with actual character names in text
-            import re
             if text and characters_data:
-                char_vars_in_text = re.findall(r'\{(char_\d+)\}', text)
+                char_vars_in_text = CHAR_VAR_RE.findall(text)
                 for char_var in char_vars_in_text:
                     # Find the character with this char_id and get their name
-                    char_name = None
-                    for char in characters_data:
-                        if char.get("char_id") == char_var:
-                            char_name = char.get("name", "")
-                            break
+                    char = characters_by_id.get(char_var)
+                    char_name = char.get("name", "") if char else None
 
                     if char_name:
                         # Replace {char_X} with character name in text
@@ -189,7 +199,7 @@ def convert_plot_to_json(
                     audio_url="",  # Will be filled by voice task
                     start_ms=idx * 2000,
                     duration_ms=duration_ms
-                ).model_dump()
+                )
             )
 
         # Create image slots
@@ -259,15 +269,11 @@ def convert_plot_to_json(
 
             # Add char1 if present (and not null)
             if char1_id:
-                char1_appearance = ""
-                for char in characters_data:
-                    if char["char_id"] == char1_id:
-                        char1_appearance = char.get("appearance", "")
-                        break
+                char1 = characters_by_id.get(char1_id)
+                char1_appearance = char1.get("appearance", "") if char1 else ""
 
                 # Validate that appearance doesn't contain variable placeholders like {char_X}
-                import re
-                if re.search(r'\{char_\d+\}', char1_appearance):
+                if CHAR_VAR_RE.search(char1_appearance):
                     raise ValueError(
                         f"CRITICAL: Character appearance contains unresolved variable placeholder: '{char1_appearance}'. "
                         f"The plot.json → layout.json conversion failed to replace character variables with actual descriptions. "
@@ -283,24 +289,20 @@ def convert_plot_to_json(
                     type="character",
                     ref_id=char1_id,
                     image_url="",
-                    z_index=2
-                ).model_dump()
-                char1_slot["image_prompt"] = char1_prompt
-                char1_slot["position"] = char1_pos
-                char1_slot["x_pos"] = position_map.get(char1_pos, 0.5)
+                    z_index=2,
+                    image_prompt=char1_prompt,
+                    position=char1_pos,
+                    x_pos=position_map.get(char1_pos, 0.5)
+                )
                 images.append(char1_slot)
 
             # Add char2 if present (and not null)
             if char2_id:
-                char2_appearance = ""
-                for char in characters_data:
-                    if char["char_id"] == char2_id:
-                        char2_appearance = char.get("appearance", "")
-                        break
+                char2 = characters_by_id.get(char2_id)
+                char2_appearance = char2.get("appearance", "") if char2 else ""
 
                 # Validate that appearance doesn't contain variable placeholders like {char_X}
-                import re
-                if re.search(r'\{char_\d+\}', char2_appearance):
+                if CHAR_VAR_RE.search(char2_appearance):
                     raise ValueError(
                         f"CRITICAL: Character appearance contains unresolved variable placeholder: '{char2_appearance}'. "
                         f"The plot.json → layout.json conversion failed to replace character variables with actual descriptions. "
@@ -316,11 +318,11 @@ def convert_plot_to_json(
                     type="character",
                     ref_id=char2_id,
                     image_url="",
-                    z_index=2
-                ).model_dump()
-                char2_slot["image_prompt"] = char2_prompt
-                char2_slot["position"] = char2_pos
-                char2_slot["x_pos"] = position_map.get(char2_pos, 0.75)
+                    z_index=2,
+                    image_prompt=char2_prompt,
+                    position=char2_pos,
+                    x_pos=position_map.get(char2_pos, 0.75)
+                )
                 images.append(char2_slot)
 
             # Add background image slot (always present)
@@ -329,9 +331,9 @@ def convert_plot_to_json(
                 type="background",
                 ref_id=scene_id,
                 image_url="",
-                z_index=0
-            ).model_dump()
-            bg_slot["image_prompt"] = background_img
+                z_index=0,
+                image_prompt=background_img
+            )
             images.insert(0, bg_slot)  # Background goes first (z_index 0)
 
         else:
@@ -340,17 +342,13 @@ def convert_plot_to_json(
             image_prompt_raw = first_row.get("image_prompt", "")
 
             # Replace character variable placeholders {char_X} with actual descriptions
-            import re
             if image_prompt_raw:
                 # Find all {char_X} patterns
-                char_vars = re.findall(r'\{(char_\d+)\}', image_prompt_raw)
+                char_vars = CHAR_VAR_RE.findall(image_prompt_raw)
                 for char_var in char_vars:
                     # Find the character with this char_id
-                    char_desc = None
-                    for char in characters_data:
-                        if char.get("char_id") == char_var:
-                            char_desc = char.get("appearance", "")
-                            break
+                    char = characters_by_id.get(char_var)
+                    char_desc = char.get("appearance", "") if char else None
 
                     if not char_desc:
                         raise ValueError(
@@ -382,17 +380,13 @@ def convert_plot_to_json(
                     type="scene",  # Unified scene image type
                     ref_id=scene_id,
                     image_url="",  # Empty - designer will populate
-                    z_index=0
-                ).model_dump()
+                    z_index=0,
+                    image_prompt=image_prompt,  # For designer task
+                    aspect_ratio="1:1",  # General mode uses 1:1 images
+                    background="white"  # White background for transparency removal
+                )
             ]
 
-            # Store image_prompt for designer task
-            images[0]["image_prompt"] = image_prompt
-
-            # Add metadata for general mode image generation
-            images[0]["aspect_ratio"] = "1:1"  # General mode uses 1:1 images
-            images[0]["background"] = "white"  # White background for transparency removal
-
         # SFX
         sfx_list = []
         sfx_tags = extract_sfx_tags(first_row["text"], first_row.get("emotion", "neutral"))
@@ -405,7 +399,7 @@ def convert_plot_to_json(
                     audio_url="",
                     start_ms=0,
                     volume=0.5
-                ).model_dump()
+                )
             )
 
         # Create scene
@@ -421,7 +415,8 @@ def convert_plot_to_json(
             transition="fade"
         )
 
-        scenes.append(scene.model_dump())
+        # Kept as a model: the whole tree is dumped once from ShortsJSON below
+        scenes.append(scene)
 
     # Create timeline
     timeline = Timeline(
@@ -461,7 +456,7 @@ def convert_plot_to_json(
         project_id=run_id,
         title=final_title if final_title else f"AutoShorts {run_id}",
         mode=mode_value,
-        timeline=timeline.model_dump(),
+        timeline=timeline,
         characters=characters,
         scenes=scenes,
         global_bgm=None,
@@ -473,8 +468,7 @@ def convert_plot_to_json(
 
     # Write layout JSON
     json_path = plot_json_path.parent / "layout.json"
-    with open(json_path, "w", encoding="utf-8") as f:
-        json.dump(shorts_json.model_dump(), f, indent=2, ensure_ascii=False)
+    write_json(json_path, shorts_json)
 
     logger.info(f"✅ Layout JSON generated: {json_path}")
     return json_path
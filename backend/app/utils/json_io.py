@@ -0,0 +1,73 @@
+"""
+JSON file helpers for pipeline artifacts (layout.json, plot.json).
+"""
+import mmap
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Union
+
+import orjson
+
+from app.config import settings
+
+
+def read_json(path: Union[str, Path]) -> Any:
+    """
+    Read a pipeline JSON file.
+
+    The file is memory-mapped and handed to orjson directly, so no
+    intermediate copy of the file contents is built.
+
+    Args:
+        path: Source file path
+
+    Returns:
+        Parsed JSON data
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            # mmap can't map empty files; let orjson raise the decode error
+            return orjson.loads(b"")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as view:
+                return orjson.loads(view)
+
+
+def write_json(path: Union[str, Path], data: Any) -> None:
+    """
+    Atomically write a pipeline JSON file.
+
+    The payload is serialized in one go, written to a temp file in the same
+    directory and swapped in with os.replace, so readers never see a
+    half-written layout even if the worker dies mid-write.
+
+    Output is compact by default; set DEBUG_PRETTY_JSON=true to get the
+    indented form when inspecting artifacts by hand.
+
+    Args:
+        path: Destination file path
+        data: JSON-serializable data, or a Pydantic model
+    """
+    path = Path(path)
+    if hasattr(data, "model_dump_json"):
+        # Pydantic models serialize straight to JSON in pydantic-core, without building dicts first
+        payload = data.model_dump_json(indent=2 if settings.DEBUG_PRETTY_JSON else None).encode("utf-8")
+    else:
+        option = orjson.OPT_NON_STR_KEYS
+        if settings.DEBUG_PRETTY_JSON:
+            option |= orjson.OPT_INDENT_2
+        payload = orjson.dumps(data, option=option)
+
+    # Unique temp name: designer/voice/composer may save the same file concurrently
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
@@ -29,6 +29,10 @@ KLING_MODEL_V1_5 = "kling-v1-5"
 KLING_MODEL_V1_6 = "kling-v1-6"  # Recommended: 195% better than v1.5
 
 
+class KlingTransientError(Exception):
+    """Kling rejected a request for a reason worth retrying (rate limit, 5xx)."""
+
+
 class KlingClient:
     """Client for Kling AI Image-to-Video API."""
 
@@ -36,6 +40,17 @@ class KlingClient:
         self.access_key = settings.KLING_ACCESS_KEY
         self.secret_key = settings.KLING_SECRET_KEY
         self.video_duration = settings.KLING_VIDEO_DURATION
+        self._http: Optional[httpx.AsyncClient] = None
+
+    async def __aenter__(self) -> "KlingClient":
+        """Share one HTTP connection pool across every call made inside the block."""
+        self._http = httpx.AsyncClient(timeout=300.0)
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        http, self._http = self._http, None
+        if http is not None:
+            await http.aclose()
 
     def _generate_jwt_token(self) -> str:
         """Generate JWT token for Kling API authentication."""
@@ -116,42 +131,56 @@ class KlingClient:
             "Authorization": f"Bearer {token}"
         }
 
+        if self._http is not None:
+            return await self._submit_and_download(self._http, payload, headers, output_path)
         async with httpx.AsyncClient(timeout=300.0) as client:
-            # Submit task
-            logger.info(f"[Kling] Submitting video generation task...")
-            response = await client.post(
-                f"{KLING_API_BASE}{KLING_IMAGE_TO_VIDEO_ENDPOINT}",
-                json=payload,
-                headers=headers
-            )
-
-            if response.status_code != 200:
-                logger.error(f"[Kling] API error: {response.status_code} - {response.text}")
-                raise Exception(f"Kling API error: {response.status_code}")
-
-            result = response.json()
-            logger.info(f"[Kling] Task submitted successfully")
-
-            if result.get("code") != 0:
-                raise Exception(f"Kling API error: {result.get('message')}")
-
-            task_id = result["data"]["task_id"]
-            logger.info(f"[Kling] Task ID: {task_id}")
+            return await self._submit_and_download(client, payload, headers, output_path)
 
-            # Poll for completion
-            video_url = await self._poll_task_status(client, task_id, headers)
-
-            # Download video
-            logger.info(f"[Kling] Downloading video...")
-            video_response = await client.get(video_url)
-
-            # Save to file
-            Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-            with open(output_path, "wb") as f:
-                f.write(video_response.content)
+    async def _submit_and_download(
+        self,
+        client: httpx.AsyncClient,
+        payload: dict,
+        headers: dict,
+        output_path: str,
+    ) -> str:
+        """Submit the task, wait for it and save the resulting video."""
+        # Submit task
+        logger.info(f"[Kling] Submitting video generation task...")
+        response = await client.post(
+            f"{KLING_API_BASE}{KLING_IMAGE_TO_VIDEO_ENDPOINT}",
+            json=payload,
+            headers=headers
+        )
+
+        if response.status_code != 200:
+            logger.error(f"[Kling] API error: {response.status_code} - {response.text}")
+            if response.status_code == 429 or response.status_code >= 500:
+                raise KlingTransientError(f"Kling API error: {response.status_code}")
+            raise Exception(f"Kling API error: {response.status_code}")
+
+        result = response.json()
+        logger.info(f"[Kling] Task submitted successfully")
+
+        if result.get("code") != 0:
+            raise Exception(f"Kling API error: {result.get('message')}")
+
+        task_id = result["data"]["task_id"]
+        logger.info(f"[Kling] Task ID: {task_id}")
+
+        # Poll for completion
+        video_url = await self._poll_task_status(client, task_id, headers)
+
+        # Download video
+        logger.info(f"[Kling] Downloading video...")
+        video_response = await client.get(video_url)
+
+        # Save to file
+        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+        with open(output_path, "wb") as f:
+            f.write(video_response.content)
 
-            logger.info(f"[Kling] ✓ Video saved to: {output_path}")
-            return output_path
+        logger.info(f"[Kling] ✓ Video saved to: {output_path}")
+        return output_path
 
     async def _poll_task_status(
         self,
@@ -208,6 +237,12 @@ class KlingClientStub:
     def __init__(self):
         self.video_duration = settings.KLING_VIDEO_DURATION
 
+    async def __aenter__(self) -> "KlingClientStub":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        return None
+
     async def image_to_video(
         self,
         start_image_path: str,
@@ -230,8 +265,10 @@ class KlingClientStub:
 
         # Create a simple crossfade video using FFmpeg
         # First image for 2.5s, crossfade 0.5s, second image for 2s
+        from app.utils.ffmpeg_renderer import ffmpeg_log_args
+
         cmd = [
-            "ffmpeg", "-y",
+            "ffmpeg", *ffmpeg_log_args(), "-y",
             "-loop", "1", "-t", "3", "-i", start_image_path,
             "-loop", "1", "-t", "3", "-i", end_image_path,
             "-filter_complex",
@@ -240,14 +277,16 @@ class KlingClientStub:
             "[v0][v1]xfade=transition=fade:duration=1:offset=2,format=yuv420p[v]",
             "-map", "[v]",
             "-t", str(self.video_duration),
+            # Intermediate only (re-encoded once by the final compose pass): cheapest
+            # preset, with a lower CRF so the second generation doesn't lose quality
             "-c:v", "libx264",
-            "-preset", "fast",
-            "-crf", "23",
+            "-preset", "ultrafast",
+            "-crf", "18",
             output_path
         ]
 
         try:
-            subprocess.run(cmd, check=True, capture_output=True)
+            subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
             logger.info(f"[Kling STUB] Video created: {output_path}")
         except subprocess.CalledProcessError as e:
             logger.error(f"[Kling STUB] FFmpeg error: {e.stderr.decode()}")
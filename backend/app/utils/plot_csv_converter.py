@@ -4,15 +4,42 @@ Plot CSV Converter - Convert plot.json to/from CSV for user editing.
 Supports both General Mode and Story Mode plot formats.
 """
 import logging
-import json
 import csv
 from pathlib import Path
 from typing import Dict, List
 from io import StringIO
 
+from app.utils.json_io import read_json, write_json
+
 logger = logging.getLogger(__name__)
 
 
+# CSV columns per mode: (column, default when writing plot -> CSV)
+PLOT_CSV_COLUMNS = {
+    # Pro Mode: scene_id, start_frame_prompt, end_frame_prompt, text, speaker, duration_ms
+    "pro": [
+        ("scene_id", ""), ("start_frame_prompt", ""), ("end_frame_prompt", ""),
+        ("text", ""), ("speaker", ""), ("duration_ms", 5000)
+    ],
+    # General Mode: scene_id, image_prompt, text, speaker, duration_ms
+    "general": [
+        ("scene_id", ""), ("image_prompt", ""), ("text", ""), ("speaker", ""), ("duration_ms", 5000)
+    ],
+    # Story Mode: more complex with characters
+    "story": [
+        ("scene_id", ""), ("char1_id", ""), ("char1_expression", ""), ("char1_pose", ""),
+        ("char1_pos", ""), ("speaker", ""), ("text", ""), ("background_img", ""), ("duration_ms", 5000)
+    ],
+}
+
+# Defaults when reading CSV -> plot (differ from the write defaults for a few story/speaker fields)
+PLOT_CSV_READ_DEFAULTS = {
+    "pro": {"speaker": "char_1"},
+    "general": {"speaker": "char_1"},
+    "story": {"char1_expression": "neutral", "char1_pose": "standing", "char1_pos": "center"},
+}
+
+
 def plot_to_csv(plot_data: Dict, mode: str = "general") -> str:
     """
     Convert plot.json to CSV string for user editing.
@@ -25,64 +52,22 @@ def plot_to_csv(plot_data: Dict, mode: str = "general") -> str:
         CSV string representation of plot
     """
     output = StringIO()
-
-    if mode == "pro":
-        # Pro Mode: scene_id, start_frame_prompt, end_frame_prompt, text, speaker, duration_ms
-        fieldnames = ["scene_id", "start_frame_prompt", "end_frame_prompt", "text", "speaker", "duration_ms"]
-        writer = csv.DictWriter(output, fieldnames=fieldnames)
-        writer.writeheader()
-
-        for scene in plot_data.get("scenes", []):
-            writer.writerow({
-                "scene_id": scene.get("scene_id", ""),
-                "start_frame_prompt": scene.get("start_frame_prompt", ""),
-                "end_frame_prompt": scene.get("end_frame_prompt", ""),
-                "text": scene.get("text", ""),
-                "speaker": scene.get("speaker", ""),
-                "duration_ms": scene.get("duration_ms", 5000)
-            })
-
-    elif mode == "general":
-        # General Mode: scene_id, image_prompt, text, speaker, duration_ms
-        fieldnames = ["scene_id", "image_prompt", "text", "speaker", "duration_ms"]
-        writer = csv.DictWriter(output, fieldnames=fieldnames)
-        writer.writeheader()
-
-        for scene in plot_data.get("scenes", []):
-            writer.writerow({
-                "scene_id": scene.get("scene_id", ""),
-                "image_prompt": scene.get("image_prompt", ""),
-                "text": scene.get("text", ""),
-                "speaker": scene.get("speaker", ""),
-                "duration_ms": scene.get("duration_ms", 5000)
-            })
-
-    elif mode == "story":
-        # Story Mode: more complex with characters
-        fieldnames = [
-            "scene_id", "char1_id", "char1_expression", "char1_pose", "char1_pos",
-            "speaker", "text", "background_img", "duration_ms"
-        ]
-        writer = csv.DictWriter(output, fieldnames=fieldnames)
-        writer.writeheader()
-
-        for scene in plot_data.get("scenes", []):
-            writer.writerow({
-                "scene_id": scene.get("scene_id", ""),
-                "char1_id": scene.get("char1_id", ""),
-                "char1_expression": scene.get("char1_expression", ""),
-                "char1_pose": scene.get("char1_pose", ""),
-                "char1_pos": scene.get("char1_pos", ""),
-                "speaker": scene.get("speaker", ""),
-                "text": scene.get("text", ""),
-                "background_img": scene.get("background_img", ""),
-                "duration_ms": scene.get("duration_ms", 5000)
-            })
+    scenes = plot_data.get("scenes", [])
+
+    columns = PLOT_CSV_COLUMNS.get(mode)
+    if columns:
+        writer = csv.writer(output)
+        writer.writerow([name for name, _ in columns])
+        # Rows go to the C writer in one call instead of a DictWriter round-trip per row
+        writer.writerows(
+            [scene.get(name, default) for name, default in columns]
+            for scene in scenes
+        )
 
     csv_content = output.getvalue()
     output.close()
 
-    logger.info(f"Converted plot to CSV ({len(plot_data.get('scenes', []))} scenes)")
+    logger.info(f"Converted plot to CSV ({len(scenes)} scenes)")
     return csv_content
 
 
@@ -98,50 +83,41 @@ def csv_to_plot(csv_content: str, mode: str = "general", original_plot: Dict = N
     Returns:
         Updated plot JSON data
     """
+    if mode not in PLOT_CSV_COLUMNS:
+        # Default to general mode structure
+        mode = "general"
+    read_defaults = PLOT_CSV_READ_DEFAULTS[mode]
+    # Resolve column defaults once instead of per row
+    columns = [
+        (name, read_defaults.get(name, default))
+        for name, default in PLOT_CSV_COLUMNS[mode]
+        if name != "duration_ms"
+    ]
+
     input_stream = StringIO(csv_content)
-    reader = csv.DictReader(input_stream)
+    reader = csv.reader(input_stream)
+
+    # Map header names to positions once; rows are then indexed as plain lists (no dict per row)
+    header = next(reader, [])
+    column_index = {name: idx for idx, name in enumerate(header)}
+    fields = [(name, column_index.get(name), default) for name, default in columns]
+    duration_idx = column_index.get("duration_ms")
 
     scenes = []
-    for row in reader:
-        if mode == "pro":
-            scene = {
-                "scene_id": row.get("scene_id", ""),
-                "start_frame_prompt": row.get("start_frame_prompt", ""),
-                "end_frame_prompt": row.get("end_frame_prompt", ""),
-                "text": row.get("text", ""),
-                "speaker": row.get("speaker", "char_1"),
-                "duration_ms": int(row.get("duration_ms", 5000))
-            }
-        elif mode == "general":
-            scene = {
-                "scene_id": row.get("scene_id", ""),
-                "image_prompt": row.get("image_prompt", ""),
-                "text": row.get("text", ""),
-                "speaker": row.get("speaker", "char_1"),
-                "duration_ms": int(row.get("duration_ms", 5000))
-            }
-        elif mode == "story":
-            scene = {
-                "scene_id": row.get("scene_id", ""),
-                "char1_id": row.get("char1_id", ""),
-                "char1_expression": row.get("char1_expression", "neutral"),
-                "char1_pose": row.get("char1_pose", "standing"),
-                "char1_pos": row.get("char1_pos", "center"),
-                "speaker": row.get("speaker", ""),
-                "text": row.get("text", ""),
-                "background_img": row.get("background_img", ""),
-                "duration_ms": int(row.get("duration_ms", 5000))
-            }
+    for values in reader:
+        if not values:
+            # Blank line (DictReader skipped these as well)
+            continue
+        width = len(values)
+        # Absent column -> default; short row -> None (DictReader's restval)
+        scene = {
+            name: default if idx is None else (values[idx] if idx < width else None)
+            for name, idx, default in fields
+        }
+        if duration_idx is None:
+            scene["duration_ms"] = 5000
         else:
-            # Default to general mode structure
-            scene = {
-                "scene_id": row.get("scene_id", ""),
-                "image_prompt": row.get("image_prompt", ""),
-                "text": row.get("text", ""),
-                "speaker": row.get("speaker", "char_1"),
-                "duration_ms": int(row.get("duration_ms", 5000))
-            }
-
+            scene["duration_ms"] = int(values[duration_idx] if duration_idx < width else None)
         scenes.append(scene)
 
     input_stream.close()
@@ -199,15 +175,13 @@ def load_and_update_plot(run_id: str, csv_content: str, mode: str = "general") -
     # Load original plot to preserve metadata
     original_plot = None
     if plot_path.exists():
-        with open(plot_path, 'r', encoding='utf-8') as f:
-            original_plot = json.load(f)
+        original_plot = read_json(plot_path)
 
     # Convert CSV to plot
     updated_plot = csv_to_plot(csv_content, mode, original_plot)
 
     # Save updated plot
-    with open(plot_path, 'w', encoding='utf-8') as f:
-        json.dump(updated_plot, f, ensure_ascii=False, indent=2)
+    write_json(plot_path, updated_plot)
 
     logger.info(f"Updated plot.json from CSV ({len(updated_plot['scenes'])} scenes)")
     return plot_path
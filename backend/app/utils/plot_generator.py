@@ -9,6 +9,8 @@ import time
 from pathlib import Path
 from typing import Tuple, Optional
 
+from app.utils.json_io import write_json
+
 logger = logging.getLogger(__name__)
 
 
@@ -247,8 +249,7 @@ def generate_plot_with_characters(
                     "role": char.get("role", "")
                 })
 
-            with open(characters_path, "w", encoding="utf-8") as f:
-                json.dump(characters_data, f, indent=2, ensure_ascii=False)
+            write_json(characters_path, characters_data)
             logger.info(f"✅ Characters saved with gender-matched voices: {characters_path}")
         else:
             # Auto-generate characters
@@ -379,8 +380,7 @@ JSON 형식:
                         char["voice_id"] = female_voices[0]["voice_id"] if female_voices else default_female
                         logger.info(f"  → Assigned female voice: {char['voice_id']}")
 
-            with open(characters_path, "w", encoding="utf-8") as f:
-                json.dump(characters_data, f, indent=2, ensure_ascii=False)
+            write_json(characters_path, characters_data)
 
             logger.info(f"✅ Characters generated and validated: {characters_path}")
 
@@ -851,8 +851,7 @@ JSON 형식 (예시: 3개 컷을 요청받은 경우):
         plot_data["mode"] = mode
         logger.info(f"[PLOT] Mode '{mode}' stored in plot.json")
 
-        with open(plot_path, "w", encoding="utf-8") as f:
-            json.dump(plot_data, f, indent=2, ensure_ascii=False)
+        write_json(plot_path, plot_data)
 
         logger.info(f"✅ Plot generated: {plot_path}")
         logger.info(f"Generated {len(plot_data.get('scenes', []))} scenes")
@@ -1009,8 +1008,7 @@ JSON 형식:
         "seed": 9999
     })
 
-    with open(characters_path, "w", encoding="utf-8") as f:
-        json.dump(characters_data, f, indent=2, ensure_ascii=False)
+    write_json(characters_path, characters_data)
 
     logger.info(f"[PRO MODE] Characters saved: {characters_path}")
 
@@ -1146,8 +1144,7 @@ JSON 형식 (씬 연결 예시):
     # Ensure mode is set
     plot_data["mode"] = "pro"
 
-    with open(plot_path, "w", encoding="utf-8") as f:
-        json.dump(plot_data, f, indent=2, ensure_ascii=False)
+    write_json(plot_path, plot_data)
 
     logger.info(f"[PRO MODE] Plot saved: {plot_path}")
     logger.info(f"[PRO MODE] Generated {len(plot_data.get('scenes', []))} scenes")
@@ -1218,8 +1215,7 @@ def _generate_fallback(
             }]
         }
 
-    with open(characters_path, "w", encoding="utf-8") as f:
-        json.dump(characters_data, f, indent=2, ensure_ascii=False)
+    write_json(characters_path, characters_data)
 
     # Generate simple plot
     scenes = []
@@ -1284,8 +1280,7 @@ def _generate_fallback(
             "scenes": scenes
         }
 
-    with open(plot_path, "w", encoding="utf-8") as f:
-        json.dump(plot_data, f, indent=2, ensure_ascii=False)
+    write_json(plot_path, plot_data)
 
     logger.info(f"✅ Fallback generation complete")
     return characters_path, plot_path
@@ -3,6 +3,7 @@ Progress update utility for Celery tasks.
 Publishes updates to Redis pub/sub which are then broadcast to WebSocket clients.
 """
 import logging
+import threading
 import redis
 import orjson
 from sqlalchemy import select, create_engine
@@ -88,16 +89,7 @@ def publish_progress(
     """
     try:
         client = get_redis_client()
-
-        message = {"run_id": run_id}
-        if state:
-            message["state"] = state
-        if progress is not None:
-            message["progress"] = progress
-        if log:
-            message["log"] = log
-        if artifacts:
-            message["artifacts"] = artifacts
+        message = _progress_message(run_id, state, progress, log, artifacts)
 
         # Publish to Redis channel
         client.publish(
@@ -121,6 +113,79 @@ def publish_progress(
             # Don't raise - database updates are non-critical
 
 
+def _progress_message(run_id: str, state: str, progress: float, log: str, artifacts: dict) -> dict:
+    """Build the pub/sub payload for a progress update."""
+    message = {"run_id": run_id}
+    if state:
+        message["state"] = state
+    if progress is not None:
+        message["progress"] = progress
+    if log:
+        message["log"] = log
+    if artifacts:
+        message["artifacts"] = artifacts
+    return message
+
+
+class ProgressBatch:
+    """
+    Collect back-to-back progress updates and send them together on flush().
+
+    All queued messages go out in one Redis pipeline round-trip, and the DB
+    row is synced once with the latest state/progress/video_url instead of
+    once per update. Like publish_progress, flush() never raises.
+    """
+
+    def __init__(self, run_id: str):
+        """
+        Initialize batch.
+
+        Args:
+            run_id: Run identifier
+        """
+        self.run_id = run_id
+        self._messages = []
+        self._state = None
+        self._progress = None
+        self._video_url = None
+
+    def add(self, state: str = None, progress: float = None, log: str = None, artifacts: dict = None):
+        """Queue one update (same arguments as publish_progress)."""
+        self._messages.append(_progress_message(self.run_id, state, progress, log, artifacts))
+        if state is not None:
+            self._state = state
+        if progress is not None:
+            self._progress = progress
+        if artifacts and artifacts.get("video_url"):
+            self._video_url = artifacts["video_url"]
+
+    def flush(self):
+        """Publish queued updates and sync the DB once; a no-op when nothing is queued."""
+        if not self._messages:
+            return
+        messages = self._messages
+        state, progress, video_url = self._state, self._progress, self._video_url
+        self._messages = []
+        self._state = self._progress = self._video_url = None
+
+        try:
+            pipe = get_redis_client().pipeline(transaction=False)
+            for message in messages:
+                pipe.publish("autoshorts:progress", orjson.dumps(message))
+            pipe.execute()
+            logger.debug(f"[{self.run_id}] Published {len(messages)} batched progress updates")
+        except Exception as e:
+            logger.error(f"Failed to publish progress for {self.run_id}: {e}")
+            # Don't raise - progress updates are non-critical
+
+        if state is not None or progress is not None or video_url:
+            try:
+                _update_run_in_db_sync(self.run_id, state, progress, video_url)
+            except Exception as e:
+                logger.error(f"Failed to update database for {self.run_id}: {e}")
+                # Don't raise - database updates are non-critical
+
+
 def _update_run_in_db_sync(run_id: str, state: str = None, progress: float = None, video_url: str = None):
     """
     Update Run model in database with current state/progress/video_url (sync version for Celery).
@@ -176,3 +241,64 @@ def _update_run_in_db_sync(run_id: str, state: str = None, progress: float = Non
             logger.error(f"[{run_id}] Database update failed: {e}")
             db.rollback()
             raise
+
+
+class ProgressDebouncer:
+    """
+    Coalesce bursts of progress updates into one publish per interval.
+
+    Updates are keyed by (run_id, state); within the interval only the latest
+    update for a key is kept and published when its timer fires.
+    """
+
+    def __init__(self, interval: float = 0.2):
+        """
+        Initialize debouncer.
+
+        Args:
+            interval: Coalescing window in seconds
+        """
+        self.interval = interval
+        self._pending = {}
+        self._timers = {}
+        self._lock = threading.Lock()
+
+    def schedule(
+        self,
+        run_id: str,
+        state: str = None,
+        progress: float = None,
+        log: str = None,
+        artifacts: dict = None
+    ):
+        """Queue a progress update (same arguments as publish_progress)."""
+        key = (run_id, state)
+        with self._lock:
+            self._pending[key] = {
+                "run_id": run_id,
+                "state": state,
+                "progress": progress,
+                "log": log,
+                "artifacts": artifacts,
+            }
+            if key not in self._timers:
+                timer = threading.Timer(self.interval, self._flush_key, args=(key,))
+                timer.daemon = True
+                self._timers[key] = timer
+                timer.start()
+
+    def _flush_key(self, key):
+        with self._lock:
+            update = self._pending.pop(key, None)
+            timer = self._timers.pop(key, None)
+        if timer:
+            timer.cancel()
+        if update:
+            publish_progress(**update)
+
+    def flush(self):
+        """Publish all pending updates immediately."""
+        with self._lock:
+            keys = list(self._pending)
+        for key in keys:
+            self._flush_key(key)
@@ -3,6 +3,7 @@ SFX tagging utilities.
 Extracts mood tags for sound effects based on text and emotion.
 """
 import logging
+import re
 from typing import List
 
 logger = logging.getLogger(__name__)
@@ -19,6 +20,23 @@ EMOTION_SFX_MAP = {
     "surprised": ["impact", "rise"]
 }
 
+# Keyword -> tag rules (substring match; Korean has no word boundaries to anchor on)
+KEYWORD_SFX_MAP = {
+    "door": ["문", "열다", "닫다"],
+    "footsteps": ["발소리", "걷다", "뛰다"],
+    "wind": ["바람", "공기"],
+    "water": ["물", "바다", "강"],
+}
+
+# All keyword rules in one alternation: one scan of the text instead of one `in` per keyword
+_KEYWORD_SFX_RE = re.compile(
+    "|".join(
+        f"(?P<{tag}>{'|'.join(map(re.escape, words))})"
+        for tag, words in KEYWORD_SFX_MAP.items()
+    ),
+    re.IGNORECASE
+)
+
 
 def extract_sfx_tags(text: str, emotion: str = "neutral") -> List[str]:
     """
@@ -34,32 +52,13 @@ def extract_sfx_tags(text: str, emotion: str = "neutral") -> List[str]:
     Returns:
         List of SFX tags
     """
-    tags = []
-
-    # Get emotion-based tags
-    emotion_lower = emotion.lower()
-    if emotion_lower in EMOTION_SFX_MAP:
-        tags.extend(EMOTION_SFX_MAP[emotion_lower])
-
-    # Add text-based tags (simple keyword matching)
-    text_lower = text.lower()
-
-    if any(word in text_lower for word in ["문", "열다", "닫다"]):
-        tags.append("door")
-
-    if any(word in text_lower for word in ["발소리", "걷다", "뛰다"]):
-        tags.append("footsteps")
-
-    if any(word in text_lower for word in ["바람", "공기"]):
-        tags.append("wind")
-
-    if any(word in text_lower for word in ["물", "바다", "강"]):
-        tags.append("water")
-
-    # Remove duplicates
-    tags = list(set(tags))
+    # Emotion-based tags first, then text-based tags; a dict keeps order while deduplicating
+    tags = dict.fromkeys(EMOTION_SFX_MAP.get(emotion.lower(), ()))
+    for match in _KEYWORD_SFX_RE.finditer(text):
+        tags[match.lastgroup] = None
+    tags = list(tags)
 
-    logger.debug(f"Extracted SFX tags for '{text[:30]}...': {tags}")
+    logger.debug("Extracted SFX tags for '%s...': %s", text[:30], tags)
 
     return tags if tags else ["ambient"]
 
@@ -0,0 +1,100 @@
+"""
+Per-run Redis locks for Celery tasks that must not run twice concurrently.
+"""
+import functools
+import inspect
+import logging
+import threading
+import uuid
+
+from app.utils.progress import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+# Delete the key only if it still holds our token (lock may have expired and been re-taken)
+_RELEASE_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+# Push the TTL out only while we still own the lock
+_RENEW_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("expire", KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+
+def _renew_until(stop: threading.Event, client, key: str, token: str, expiry: int, run_id: str) -> None:
+    """Keep the lock alive while its task runs; a crashed holder stops renewing and the TTL frees it."""
+    interval = max(1, expiry // 3)
+    while not stop.wait(interval):
+        try:
+            if not client.eval(_RENEW_SCRIPT, 1, key, token, expiry):
+                logger.warning(f"[{run_id}] Lost {key} before the task finished, no longer renewing")
+                return
+        except Exception as e:
+            # Transient Redis error: the remaining TTL covers the next attempt
+            logger.warning(f"[{run_id}] Failed to renew {key}: {e}")
+
+
+def single_run_task(lock_name: str, expiry: int = 1800):
+    """
+    Skip a task call while another call holds the lock for the same run_id.
+
+    Wrap the task function (below @celery.task) that takes a run_id argument.
+    A duplicate enqueue (chord re-fire, manual requeue) returns
+    {"run_id", "agent", "status": "duplicate"} without doing any work.
+    If Redis is unreachable the task runs unguarded.
+
+    Args:
+        lock_name: Lock namespace (tasks sharing it exclude each other)
+        expiry: Lock TTL in seconds. Renewed every expiry/3 while the task runs,
+            so it only bounds how long a crashed holder blocks the run
+    """
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            run_id = signature.bind(*args, **kwargs).arguments["run_id"]
+            key = f"autoshorts:lock:{lock_name}:{run_id}"
+            token = uuid.uuid4().hex
+
+            try:
+                client = get_redis_client()
+                acquired = client.set(key, token, nx=True, ex=expiry)
+            except Exception as e:
+                logger.warning(f"[{run_id}] Could not take {lock_name} lock: {e}, running unguarded")
+                return func(*args, **kwargs)
+
+            if not acquired:
+                logger.warning(f"[{run_id}] {lock_name} already running for this run, skipping duplicate")
+                return {"run_id": run_id, "agent": lock_name, "status": "duplicate"}
+
+            # Long tasks (Pro director: Kling polling + retries + compose) can outlive any fixed TTL
+            stop_renewing = threading.Event()
+            renewer = threading.Thread(
+                target=_renew_until,
+                args=(stop_renewing, client, key, token, expiry, run_id),
+                name=f"lock-renew-{lock_name}",
+                daemon=True
+            )
+            renewer.start()
+
+            try:
+                return func(*args, **kwargs)
+            finally:
+                stop_renewing.set()
+                renewer.join(timeout=5)
+                try:
+                    client.eval(_RELEASE_SCRIPT, 1, key, token)
+                except Exception as e:
+                    logger.warning(f"[{run_id}] Failed to release {lock_name} lock: {e}")
+
+        return wrapper
+
+    return decorator